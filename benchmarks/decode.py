@@ -0,0 +1,162 @@
+"""
+생성된 디코더와 3.1.0까지 사용하던 직접 작성한 from_dict의 변환 속도를 비교합니다.
+
+.. code:: sh
+
+    python -m benchmarks.decode
+
+:func:`collect` 는 :mod:`benchmarks.run` 에서 사용합니다.
+"""
+
+from sys import intern
+from time import perf_counter
+from typing import Any, Callable, Dict, Tuple
+
+from benchmarks.payloads import make_bot_response, make_server_response, make_user
+from koreanbots.model import (
+    CircularKoreanbotsBot,
+    CircularKoreanbotsServer,
+    Emoji,
+    KoreanbotsBotResponse,
+    KoreanbotsServerResponse,
+    KoreanbotsUserResponse,
+)
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(intern(v) for v in value)
+    return intern(value) if value is not None else value
+
+
+def legacy_user_from_dict(data: Dict[str, Any]) -> KoreanbotsUserResponse:
+    # KoreanbotsUserResponse.from_dict as written by hand before the decoder.
+    return KoreanbotsUserResponse(
+        id=data["id"],
+        username=data["username"],
+        globalName=data["globalName"],
+        tag=data["tag"],
+        github=data.get("github"),
+        flags=data["flags"],
+        servers=tuple(
+            CircularKoreanbotsServer(
+                id=s["id"],
+                name=s["name"],
+                flags=s["flags"],
+                intro=s.get("intro"),
+                desc=s.get("desc"),
+                votes=s["votes"],
+                category=_intern(s.get("category")),
+                invite=s["invite"],
+                state=_intern(s.get("state")),
+                vanity=s.get("vanity"),
+                bg=s.get("bg"),
+                banner=s.get("banner"),
+                icon=s.get("icon"),
+                members=s["members"],
+                emojis=tuple(
+                    Emoji(id=e["id"], name=e["name"], url=e["url"]) for e in s["emojis"]
+                ),
+                boostTier=s["boostTier"],
+                owner=s["owner"],
+            )
+            for s in data["servers"]
+        ),
+        bots=tuple(
+            CircularKoreanbotsBot(
+                id=b["id"],
+                name=b["name"],
+                tag=b["tag"],
+                avatar=b["avatar"],
+                flags=b["flags"],
+                lib=_intern(b["lib"]),
+                prefix=b["prefix"],
+                votes=b["votes"],
+                servers=b["servers"],
+                shards=b["shards"],
+                intro=b.get("intro"),
+                desc=b.get("desc"),
+                web=b.get("web"),
+                git=b.get("git"),
+                url=b.get("url"),
+                discord=b.get("discord"),
+                category=_intern(b.get("category")),
+                vanity=b.get("vanity"),
+                bg=b.get("bg"),
+                banner=b.get("banner"),
+                status=_intern(b.get("status")),
+                state=_intern(b.get("state")),
+                owners=tuple(b["owners"]),
+            )
+            for b in data["bots"]
+        ),
+    )
+
+
+def measure(
+    f: Callable[[Dict[str, Any]], Any], data: Dict[str, Any], repeat: int = 3
+) -> float:
+    def timed(number: int) -> float:
+        start = perf_counter()
+        for _ in range(number):
+            f(data)
+        return perf_counter() - start
+
+    number = 1
+    while True:
+        elapsed = timed(number)
+        if elapsed > 0.05:
+            break
+        number *= 2
+    # The fastest run is the one least disturbed by the rest of the system.
+    return min([elapsed] + [timed(number) for _ in range(repeat - 1)]) / number
+
+
+def collect() -> Dict[str, float]:
+    """
+    작은 응답과 아주 큰 응답의 from_dict 변환 시간(초)을 반환합니다.
+    """
+    payloads: Dict[str, Tuple[Callable[..., Any], Dict[str, Any]]] = {
+        "user.small": (KoreanbotsUserResponse.from_dict, make_user(bots=1, servers=1)),
+        "user.large": (
+            KoreanbotsUserResponse.from_dict,
+            make_user(bots=200, servers=200),
+        ),
+        "bot.small": (KoreanbotsBotResponse.from_dict, make_bot_response(owners=1)),
+        "bot.large": (KoreanbotsBotResponse.from_dict, make_bot_response(owners=100)),
+        "server.small": (
+            KoreanbotsServerResponse.from_dict,
+            make_server_response(emojis=1),
+        ),
+        "server.large": (
+            KoreanbotsServerResponse.from_dict,
+            make_server_response(emojis=1000),
+        ),
+    }
+    results = {}
+    for name, (from_dict, data) in payloads.items():
+        results[f"decode.{name}"] = measure(from_dict, data)
+        results[f"decode.{name}.lazy"] = measure(
+            lambda d: from_dict(d, lazy=True), data
+        )
+    return results
+
+
+def main() -> None:
+    for bots, servers in ((1, 1), (20, 20), (200, 200)):
+        data = make_user(bots=bots, servers=servers)
+        assert legacy_user_from_dict(data) == KoreanbotsUserResponse.from_dict(data)
+
+        legacy = measure(legacy_user_from_dict, data)
+        current = measure(KoreanbotsUserResponse.from_dict, data)
+        lazy = measure(lambda d: KoreanbotsUserResponse.from_dict(d, lazy=True), data)
+        print(
+            f"user with {bots:3} bots, {servers:3} servers: "
+            f"hand-written {legacy * 1e6:9.1f} us, "
+            f"generated {current * 1e6:9.1f} us ({legacy / current:.2f}x), "
+            f"lazy {lazy * 1e6:7.1f} us ({legacy / lazy:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
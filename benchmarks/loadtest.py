@@ -0,0 +1,228 @@
+"""
+여러 코루틴이 동시에 :class:`~koreanbots.Koreanbots` 로 요청할 때의 처리량과 응답 시간을 측정합니다.
+``--base-url`` 을 지정하지 않으면 :class:`~koreanbots.mock.MockKoreanbotsServer` 를 실행해 요청합니다.
+
+.. code:: sh
+
+    # 공지 직후처럼 투표 확인 요청이 몰리는 경우
+    python -m benchmarks.loadtest --concurrency 500 --requests 5000 --mix vote=95,bot=5
+
+    # 레이트리밋 헤더 없이 429만 보내는 서버
+    python -m benchmarks.loadtest --mock-rate-limit 50 --mock-window 1 --no-ratelimit-headers
+
+처리량, p50/p95/p99 응답 시간, 받은 ``429`` 응답 수와 레이트리밋 때문에 기다린 시간을 출력합니다.
+기다린 시간은 같은 라우트의 다른 호출 뒤에서 기다린 시간을 포함해 모든 호출의 대기 시간을 더한 값입니다.
+응답 시간은 레이트리밋 대기와 재시도를 포함한 호출 하나의 시간입니다.
+"""
+
+import asyncio
+import json
+import sys
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass, field
+from logging import ERROR, getLogger
+from random import Random
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from koreanbots import Koreanbots, RequestMetrics
+from koreanbots.mock import MockKoreanbotsServer
+
+BOT_ID = 653534001742741552
+SERVER_ID = 653083797763522580
+USER_ID = 285185716240252929
+
+Operation = Callable[[Koreanbots, Random], Awaitable[Any]]
+
+OPERATIONS: Dict[str, Operation] = {
+    "bot": lambda kb, r: kb.get_bot_info(BOT_ID + r.randrange(100)),
+    "user": lambda kb, r: kb.get_user_info(USER_ID + r.randrange(100)),
+    "server": lambda kb, r: kb.get_server_info(SERVER_ID + r.randrange(100)),
+    "vote": lambda kb, r: kb.get_bot_vote(USER_ID + r.randrange(10**6), BOT_ID),
+    "server_vote": lambda kb, r: kb.get_server_vote(
+        USER_ID + r.randrange(10**6), SERVER_ID
+    ),
+    "stats": lambda kb, r: kb.post_guild_count(BOT_ID, servers=r.randrange(10**4)),
+}
+
+
+@dataclass
+class LoadTestResult:
+    requests: int
+    errors: Dict[str, int]
+    elapsed: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    rate_limited: int
+    rate_limit_wait: float
+    global_limit_wait: float
+    operations: Dict[str, int] = field(default_factory=dict)
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {name!r}. Use {', '.join(OPERATIONS)}."
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def run(
+    kb: Koreanbots,
+    metrics: RequestMetrics,
+    concurrency: int,
+    requests: int,
+    mix: Dict[str, float],
+    duration: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> LoadTestResult:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    operations: Dict[str, int] = {}
+    remaining = requests
+    start = perf_counter()
+    deadline = start + duration if duration is not None else None
+
+    async def worker(index: int) -> None:
+        nonlocal remaining
+        random = Random(None if seed is None else seed + index)
+        while remaining > 0 and (deadline is None or perf_counter() < deadline):
+            remaining -= 1
+            name = random.choices(names, weights)[0]
+            operations[name] = operations.get(name, 0) + 1
+            began = perf_counter()
+            try:
+                await OPERATIONS[name](kb, random)
+            except Exception as e:
+                key = type(e).__name__
+                errors[key] = errors.get(key, 0) + 1
+            latencies.append(perf_counter() - began)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    snapshot = metrics.snapshot().values()
+    return LoadTestResult(
+        requests=len(latencies),
+        errors=errors,
+        elapsed=elapsed,
+        throughput=len(latencies) / elapsed if elapsed else 0.0,
+        p50=percentile(latencies, 0.5),
+        p95=percentile(latencies, 0.95),
+        p99=percentile(latencies, 0.99),
+        rate_limited=sum(m.rate_limited for m in snapshot),
+        rate_limit_wait=sum(m.rate_limit_wait for m in snapshot),
+        global_limit_wait=sum(m.global_limit_wait for m in snapshot),
+        operations=operations,
+    )
+
+
+def report(result: LoadTestResult) -> None:
+    print(f"requests         {result.requests} in {result.elapsed:.2f} s")
+    print(f"throughput       {result.throughput:.1f} req/s")
+    print(
+        f"latency          p50 {result.p50 * 1e3:.1f} ms, "
+        f"p95 {result.p95 * 1e3:.1f} ms, p99 {result.p99 * 1e3:.1f} ms"
+    )
+    print(f"429 responses    {result.rate_limited}")
+    # Includes time spent queued behind other callers on the same route.
+    per_call = result.rate_limit_wait / result.requests if result.requests else 0.0
+    print(
+        f"rate limit wait  {result.rate_limit_wait:.2f} s (summed over callers, "
+        f"{per_call * 1e3:.1f} ms per call)"
+    )
+    print(f"global limit     {result.global_limit_wait:.2f} s (summed over callers)")
+    mix = ", ".join(f"{k}={v}" for k, v in sorted(result.operations.items()))
+    print(f"operations       {mix}")
+    if result.errors:
+        errors = ", ".join(f"{k}={v}" for k, v in sorted(result.errors.items()))
+        print(f"errors           {errors}")
+
+
+async def main_async(args: Any) -> LoadTestResult:
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = MockKoreanbotsServer(
+            rate_limit=args.mock_rate_limit,
+            window=args.mock_window,
+            ratelimit_headers=not args.no_ratelimit_headers,
+            latency=args.mock_latency,
+            jitter=args.mock_jitter,
+            error_rate=args.mock_error_rate,
+            seed=args.seed,
+        )
+        await server.start()
+        base_url = server.url
+
+    metrics = RequestMetrics()
+    kb = Koreanbots(args.api_key, base_url=base_url, metrics=metrics)
+    try:
+        return await run(
+            kb,
+            metrics,
+            args.concurrency,
+            args.requests,
+            parse_mix(args.mix),
+            args.duration,
+            args.seed,
+        )
+    finally:
+        await kb.close()
+        if server is not None:
+            await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks.loadtest")
+    parser.add_argument("--base-url", help="요청할 API 주소 (기본값: 대체 서버 실행)")
+    parser.add_argument("--api-key", default="token", help="요청에 사용할 토큰")
+    parser.add_argument("--concurrency", "-c", type=int, default=100)
+    parser.add_argument("--requests", "-n", type=int, default=2000)
+    parser.add_argument("--duration", type=float, help="최대 실행 시간(초)")
+    parser.add_argument(
+        "--mix",
+        default="vote=90,bot=5,user=5",
+        help=f"요청 비율 ({', '.join(OPERATIONS)})",
+    )
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--mock-rate-limit", type=int, default=100)
+    parser.add_argument("--mock-window", type=float, default=1.0)
+    parser.add_argument("--mock-latency", type=float, default=0.01)
+    parser.add_argument("--mock-jitter", type=float, default=0.01)
+    parser.add_argument("--mock-error-rate", type=float, default=0.0)
+    parser.add_argument("--no-ratelimit-headers", action="store_true")
+    parser.add_argument("--verbose", "-v", action="store_true", help="경고 로그를 출력")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Every 429 logs a warning, which would drown the report.
+        getLogger("koreanbots").setLevel(ERROR)
+
+    result = asyncio.run(main_async(args))
+    if args.json:
+        json.dump(asdict(result), sys.stdout, indent=2)
+        print()
+    else:
+        report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+모델 인스턴스 하나가 차지하는 메모리를 tracemalloc으로 측정합니다.
+``__dict__`` 와 리스트를 사용하던 3.1.0의 모델 구조와 비교합니다.
+
+.. code:: sh
+
+    python -m benchmarks.model_memory
+
+:func:`collect` 는 :mod:`benchmarks.run` 에서 사용합니다.
+"""
+
+import gc
+import json
+import tracemalloc
+from dataclasses import field, fields, is_dataclass, make_dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from benchmarks.payloads import make_bot_response, make_server_response, make_user
+from koreanbots.model import (
+    KoreanbotsBotResponse,
+    KoreanbotsServerResponse,
+    KoreanbotsUserResponse,
+)
+
+_legacy_classes: Dict[type, type] = {}
+
+
+def legacy_class(cls: type) -> type:
+    # The same fields on a plain frozen dataclass, like the models before slots.
+    if cls not in _legacy_classes:
+        _legacy_classes[cls] = make_dataclass(
+            f"Legacy{cls.__name__}",
+            [(f.name, Any, field(default=None)) for f in fields(cls)],
+            frozen=True,
+        )
+    return _legacy_classes[cls]
+
+
+def to_legacy(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return legacy_class(type(value))(
+            **{f.name: to_legacy(getattr(value, f.name)) for f in fields(value)}
+        )
+    if isinstance(value, tuple):
+        return [to_legacy(v) for v in value]
+    # A fresh JSON decode gives every instance its own strings.
+    if isinstance(value, str):
+        return "".join(list(value))
+    return value
+
+
+def measure(build: Callable[[], Any], number: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [build() for _ in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / number
+
+
+def collect(number: int = 200) -> Dict[str, float]:
+    """
+    모델 인스턴스 하나가 차지하는 메모리(바이트)를 반환합니다.
+    """
+    payloads: Dict[str, Tuple[Callable[..., Any], str]] = {
+        "user": (
+            KoreanbotsUserResponse.from_dict,
+            json.dumps(make_user(bots=20, servers=20)),
+        ),
+        "bot": (KoreanbotsBotResponse.from_dict, json.dumps(make_bot_response())),
+        "server": (
+            KoreanbotsServerResponse.from_dict,
+            json.dumps(make_server_response()),
+        ),
+    }
+    results = {}
+    for name, (from_dict, raw) in payloads.items():
+        # Warm up the interned strings so only the instances are counted.
+        from_dict(json.loads(raw))
+        results[f"memory.{name}"] = measure(lambda: from_dict(json.loads(raw)), number)
+    return results
+
+
+def main(bots: int = 20, servers: int = 20, number: int = 200) -> None:
+    raw = json.dumps(make_user(bots=bots, servers=servers))
+    # Warm up the interned strings and the generated classes.
+    to_legacy(KoreanbotsUserResponse.from_dict(json.loads(raw)))
+
+    current = measure(lambda: KoreanbotsUserResponse.from_dict(json.loads(raw)), number)
+    legacy = measure(
+        lambda: to_legacy(KoreanbotsUserResponse.from_dict(json.loads(raw))), number
+    )
+
+    print(f"user with {bots} bots and {servers} servers")
+    print(f"legacy models    {legacy:10.0f} bytes/user")
+    print(f"slotted models   {current:10.0f} bytes/user ({current / legacy:.0%})")
+
+
+if __name__ == "__main__":
+    main()
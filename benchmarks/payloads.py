@@ -0,0 +1,12 @@
+"""
+벤치마크에 사용하는 Koreanbots API 응답 형식의 데이터를 만듭니다.
+:class:`~koreanbots.mock.MockKoreanbotsServer` 와 같은 데이터를 사용합니다.
+"""
+
+from koreanbots.mock import make_bot as make_bot
+from koreanbots.mock import make_bot_response as make_bot_response
+from koreanbots.mock import make_emoji as make_emoji
+from koreanbots.mock import make_owner as make_owner
+from koreanbots.mock import make_server as make_server
+from koreanbots.mock import make_server_response as make_server_response
+from koreanbots.mock import make_user as make_user
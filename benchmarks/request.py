@@ -0,0 +1,77 @@
+"""
+로컬 대체 서버에 요청할 때 클라이언트가 더하는 시간을 측정합니다.
+같은 서버에 aiohttp로 직접 요청한 시간과 비교합니다.
+
+.. code:: sh
+
+    python -m benchmarks.request
+
+:func:`collect` 는 :mod:`benchmarks.run` 에서 사용합니다.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict
+
+import aiohttp
+
+from koreanbots import Koreanbots
+from koreanbots.mock import MockKoreanbotsServer
+
+BOT_ID = 653534001742741552
+
+
+async def measure(f: Callable[[], Awaitable[Any]], number: int) -> float:
+    for _ in range(10):
+        await f()
+    start = perf_counter()
+    for _ in range(number):
+        await f()
+    return (perf_counter() - start) / number
+
+
+async def run(number: int) -> Dict[str, float]:
+    async with MockKoreanbotsServer(rate_limit=10**9) as server:
+        url = f"{server.url}/bots/{BOT_ID}"
+        async with aiohttp.ClientSession() as session:
+
+            async def baseline() -> bytes:
+                async with session.get(url, headers={"Authorization": "token"}) as r:
+                    return await r.read()
+
+            raw = await measure(baseline, number)
+
+        kb = Koreanbots("token", base_url=server.url)
+        client_raw = await measure(
+            lambda: kb.get_bot_info(BOT_ID, output="raw"), number
+        )
+        client_model = await measure(lambda: kb.get_bot_info(BOT_ID), number)
+        await kb.close()
+
+    return {
+        "request.aiohttp": raw,
+        "request.raw": client_raw,
+        "request.model": client_model,
+        "request.overhead": client_raw - raw,
+    }
+
+
+def collect(number: int = 500) -> Dict[str, float]:
+    """
+    요청 하나에 걸린 시간(초)과 aiohttp로 직접 요청한 것과의 차이를 반환합니다.
+    """
+    return asyncio.run(run(number))
+
+
+def main(number: int = 2000) -> None:
+    results = collect(number)
+    print(f"aiohttp          {results['request.aiohttp'] * 1e6:10.1f} us/request")
+    print(
+        f"client (raw)     {results['request.raw'] * 1e6:10.1f} us/request "
+        f"(+{results['request.overhead'] * 1e6:.1f} us)"
+    )
+    print(f"client (model)   {results['request.model'] * 1e6:10.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
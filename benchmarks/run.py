@@ -0,0 +1,134 @@
+"""
+모든 벤치마크를 실행하고 결과를 JSON으로 저장하거나, 두 결과를 비교합니다.
+모든 값은 작을수록 좋습니다.
+
+.. code:: sh
+
+    # 실행하고 저장
+    python -m benchmarks.run --output before.json
+
+    # 실행하고 저장된 결과와 비교
+    python -m benchmarks.run --output after.json --baseline before.json
+
+    # 저장된 두 결과를 비교
+    python -m benchmarks.run --compare before.json after.json
+
+비교할 때 ``--threshold`` 보다 크게 느려진 항목이 있으면 종료 코드 1로 종료합니다.
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks import decode, model_memory, request, strict_literal
+from koreanbots import __version__
+
+SUITES: Dict[str, Callable[[], Dict[str, float]]] = {
+    "decode": decode.collect,
+    "strict_literal": strict_literal.collect,
+    "memory": model_memory.collect,
+    "request": request.collect,
+}
+
+UNITS = {"memory": "bytes"}
+
+
+def run(only: Optional[List[str]] = None) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for suite, collect in SUITES.items():
+        if only and suite not in only:
+            continue
+        print(f"running {suite}...", file=sys.stderr)
+        for name, value in collect().items():
+            results[name] = {"value": value, "unit": UNITS.get(suite, "s")}
+
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit == "bytes":
+        return f"{value:.0f} B"
+    for scale, suffix in ((1, "s"), (1e3, "ms"), (1e6, "us")):
+        if abs(value) * scale >= 1:
+            return f"{value * scale:.2f} {suffix}"
+    return f"{value * 1e9:.0f} ns"
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> bool:
+    """두 결과를 비교해 출력하고, 느려진 항목이 없으면 True를 반환합니다."""
+    print(f"{'benchmark':36} {'before':>12} {'after':>12} {'change':>8}")
+    ok = True
+    for name, result in new["results"].items():
+        if name not in old["results"]:
+            print(f"{name:36} {'-':>12} {format_value(**result):>12}")
+            continue
+        before = old["results"][name]["value"]
+        after = result["value"]
+        change = (after - before) / before if before > 0 else 0.0
+        mark = ""
+        # Differences such as overheads can sit near zero, where ratios are noise.
+        if change > threshold and before > 0:
+            mark = "  slower"
+            ok = False
+        elif change < -threshold and before > 0:
+            mark = "  faster"
+        print(
+            f"{name:36} {format_value(before, result['unit']):>12} "
+            f"{format_value(**result):>12} {change:>+8.1%}{mark}"
+        )
+    return ok
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        data: Dict[str, Any] = json.load(f)
+    return data
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--output", "-o", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", "-b", help="결과와 비교할 JSON 파일")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="저장된 두 결과를 비교"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=list(SUITES), help="실행할 벤치마크"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="느려졌다고 판단할 비율 (기본값: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = map(load, args.compare)
+        return 0 if compare(old, new, args.threshold) else 1
+
+    result = run(args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        return 0 if compare(load(args.baseline), result, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
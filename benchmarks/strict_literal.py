@@ -0,0 +1,103 @@
+"""
+strict_literal 데코레이터의 호출당 오버헤드를 측정합니다.
+
+.. code:: sh
+
+    python -m benchmarks.strict_literal
+
+:func:`collect` 는 :mod:`benchmarks.run` 에서 사용합니다.
+"""
+
+import asyncio
+import functools
+import inspect
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Literal, cast, get_args
+
+from koreanbots.decorator import strict_literal
+from koreanbots.typing import CORO, WidgetStyle, WidgetType
+
+
+def legacy_strict_literal(argument_names: List[str]) -> Callable[[CORO], CORO]:
+    # strict_literal as of 3.1.0, kept as the baseline.
+    def decorator(f: CORO) -> CORO:
+        @functools.wraps(f)
+        async def decorated_function(*args: Any, **kwargs: Any) -> Any:
+            full_arg_spec = inspect.getfullargspec(f)
+            for argument_name in argument_names:
+                arg_annoration = full_arg_spec.annotations[argument_name]
+                if arg_annoration.__origin__ is Literal:
+                    literal_list = list(get_args(arg_annoration))
+                    arg_index = full_arg_spec.args.index(argument_name)
+                    if arg_index < len(args) and args[arg_index] not in literal_list:
+                        raise ValueError(
+                            f"Arguments do not match. Expected: {literal_list}"
+                        )
+                    elif (
+                        kwargs.get(argument_name)
+                        and kwargs[argument_name] not in literal_list
+                    ):
+                        raise ValueError(
+                            f"Arguments do not match. Expected: {literal_list}"
+                        )
+
+            return await f(*args, **kwargs)
+
+        return cast(CORO, decorated_function)
+
+    return decorator
+
+
+async def get_widget(
+    self: Any,
+    widget_type: WidgetType,
+    bot_id: int,
+    style: WidgetStyle = "flat",
+    scale: float = 1.0,
+    icon: bool = False,
+) -> None:
+    pass
+
+
+def measure(f: Callable[..., Any], number: int) -> float:
+    async def run() -> float:
+        start = perf_counter()
+        for _ in range(number):
+            await f(None, "votes", 653534001742741552, style="classic")
+        return perf_counter() - start
+
+    return asyncio.run(run()) / number
+
+
+def collect(number: int = 100_000) -> Dict[str, float]:
+    """
+    데코레이터가 없는 호출과 strict_literal을 적용한 호출의 시간(초)을 반환합니다.
+    """
+    baseline = measure(get_widget, number)
+    current = measure(strict_literal(["widget_type", "style"])(get_widget), number)
+    return {
+        "strict_literal.call": current,
+        "strict_literal.overhead": current - baseline,
+    }
+
+
+def main(number: int = 100_000) -> None:
+    baseline = measure(get_widget, number)
+    legacy = measure(
+        legacy_strict_literal(["widget_type", "style"])(get_widget), number
+    )
+    current = measure(strict_literal(["widget_type", "style"])(get_widget), number)
+
+    print(f"undecorated      {baseline * 1e9:10.0f} ns/call")
+    print(
+        f"legacy           {legacy * 1e9:10.0f} ns/call "
+        f"(+{(legacy - baseline) * 1e9:.0f} ns)"
+    )
+    print(
+        f"strict_literal   {current * 1e9:10.0f} ns/call "
+        f"(+{(current - baseline) * 1e9:.0f} ns)"
+    )
+
+
+if __name__ == "__main__":
+    main()
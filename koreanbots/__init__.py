@@ -1,11 +1,26 @@
 from typing import Literal, NamedTuple
 
+from .cache import ResponseCache as ResponseCache
+from .cache import VoteCache as VoteCache
 from .client import Koreanbots as Koreanbots
+from .codec import JSONCodec as JSONCodec
+from .connection import ConnectionStats as ConnectionStats
+from .connection import ConnectorConfig as ConnectorConfig
+from .connection import create_session as create_session
 from .errors import *
 from .http import KoreanbotsRequester as KoreanbotsRequester
+from .metrics import RequestMetrics as RequestMetrics
 from .model import KoreanbotsBot as KoreanbotsBot
 from .model import KoreanbotsServer as KoreanbotsServer
 from .model import KoreanbotsUser as KoreanbotsUser
+from .ratelimit import RateLimiter as RateLimiter
+from .retry import CircuitBreaker as CircuitBreaker
+from .retry import HedgePolicy as HedgePolicy
+from .retry import RetryBudget as RetryBudget
+from .retry import RetryPolicy as RetryPolicy
+from .tracing import OpenTelemetryExporter as OpenTelemetryExporter
+from .tracing import RequestSpan as RequestSpan
+from .tracing import RequestTracer as RequestTracer
 
 
 class VersionInfo(NamedTuple):
@@ -0,0 +1,463 @@
+from asyncio import Task, get_running_loop
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from logging import getLogger
+from time import monotonic, time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    get_args,
+)
+
+from .errors import NotFound
+from .model import KoreanbotsVoteResponse
+from .typing import VoteType
+
+V = TypeVar("V")
+
+log = getLogger(__name__)
+
+_VOTE_TYPES = frozenset(get_args(VoteType))
+
+
+@dataclass
+class CacheStats:
+    """
+    캐시의 적중 횟수를 나타내는 클래스입니다.
+    """
+
+    hits: int = 0
+    """캐시 적중 횟수"""
+    misses: int = 0
+    """캐시 미스 횟수"""
+    stale_hits: int = 0
+    """만료되었지만 재검증 기간 안에 있어 반환된 횟수"""
+    negative_hits: int = 0
+    """캐시된 NotFound 응답을 반환한 횟수"""
+    evictions: int = 0
+    """용량 초과로 제거된 항목 수"""
+    refreshes: int = 0
+    """백그라운드에서 갱신한 횟수"""
+
+
+class _Entry:
+    __slots__ = ("value", "error", "expires_at", "stale_until")
+
+    def __init__(
+        self,
+        value: Any,
+        error: Optional[Tuple[Any, Any]],
+        expires_at: float,
+        stale_until: float,
+    ) -> None:
+        self.value = value
+        # (status, message) of a NotFound response. A new exception is raised on
+        # every hit so tracebacks don't pile up on one shared instance.
+        self.error = error
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """
+    응답 모델을 저장하는 TTL + LRU 캐시입니다.
+
+    :param max_size:
+        저장할 수 있는 최대 항목 수입니다. 초과하면 가장 오래 사용되지 않은 항목을 제거합니다. 기본값은 1024입니다.
+    :type max_size:
+        int, optional
+
+    :param ttl:
+        엔드포인트별 TTL(초)입니다. ``bot``, ``user``, ``server`` 를 키로 사용합니다.
+        지정하지 않은 엔드포인트는 default_ttl을 사용합니다. 기본값은 None 입니다.
+    :type ttl:
+        Optional[Dict[str, float]], optional
+
+    :param default_ttl:
+        기본 TTL(초)입니다. 기본값은 60입니다.
+    :type default_ttl:
+        float, optional
+
+    :param stale_ttl:
+        만료된 항목을 반환하면서 백그라운드에서 갱신할 수 있는 기간(초)입니다. 0이면 사용하지 않습니다. 기본값은 30입니다.
+    :type stale_ttl:
+        float, optional
+
+    :param negative_ttl:
+        NotFound 응답을 저장할 기간(초)입니다. 0이면 저장하지 않습니다. 기본값은 30입니다.
+    :type negative_ttl:
+        float, optional
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[Dict[str, float]] = None,
+        default_ttl: float = 60.0,
+        stale_ttl: float = 30.0,
+        negative_ttl: float = 30.0,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size must be greater than 0, not {max_size}")
+
+        self.max_size = max_size
+        self.ttl = ttl or {}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._refreshing: Dict[Tuple[str, Hashable], "Task[None]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Tuple[str, Hashable], value: Any) -> None:
+        now = monotonic()
+        expires_at = now + self.ttl.get(key[0], self.default_ttl)
+        self._entries[key] = _Entry(
+            value, None, expires_at, expires_at + self.stale_ttl
+        )
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _store_error(self, key: Tuple[str, Hashable], error: NotFound) -> None:
+        if self.negative_ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        expires_at = monotonic() + self.negative_ttl
+        self._entries[key] = _Entry(
+            None, (error.status, error.error), expires_at, expires_at
+        )
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def _refresh(
+        self, key: Tuple[str, Hashable], fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            self._store(key, await fetch())
+            self.stats.refreshes += 1
+        except NotFound as e:
+            self._store_error(key, e)
+        except Exception:
+            log.exception("Failed to refresh cached response for %s.", key)
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def get_or_fetch(
+        self, endpoint: str, key: Hashable, fetch: Callable[[], Awaitable[V]]
+    ) -> V:
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 fetch를 호출해 저장한 후 반환합니다.
+
+        :param endpoint:
+            TTL을 구분할 엔드포인트의 이름입니다.
+        :type endpoint:
+            str
+
+        :param key:
+            엔드포인트 안에서 항목을 구분하는 키입니다.
+        :type key:
+            Hashable
+
+        :param fetch:
+            캐시에 값이 없을 때 호출할 함수입니다.
+        :type fetch:
+            Callable[[], Awaitable[V]]
+
+        :raises NotFound:
+            fetch가 NotFound를 발생시켰거나, 저장된 NotFound 응답이 있습니다.
+
+        :rtype:
+            V
+        """
+        cache_key = (endpoint, key)
+        entry = self._entries.get(cache_key)
+
+        if entry is not None:
+            now = monotonic()
+            if now < entry.expires_at:
+                self._entries.move_to_end(cache_key)
+                if entry.error is not None:
+                    self.stats.negative_hits += 1
+                    raise NotFound(*entry.error)
+                self.stats.hits += 1
+                return cast(V, entry.value)
+
+            if now < entry.stale_until:
+                self._entries.move_to_end(cache_key)
+                self.stats.stale_hits += 1
+                if cache_key not in self._refreshing:
+                    self._refreshing[cache_key] = get_running_loop().create_task(
+                        self._refresh(cache_key, fetch)
+                    )
+                return cast(V, entry.value)
+
+            del self._entries[cache_key]
+
+        self.stats.misses += 1
+        try:
+            value = await fetch()
+        except NotFound as e:
+            self._store_error(cache_key, e)
+            raise
+
+        self._store(cache_key, value)
+        return value
+
+    def invalidate(self, endpoint: str, key: Hashable) -> None:
+        """
+        저장된 항목을 제거합니다.
+
+        :param endpoint:
+            엔드포인트의 이름입니다.
+        :type endpoint:
+            str
+
+        :param key:
+            항목의 키입니다.
+        :type key:
+            Hashable
+        """
+        self._entries.pop((endpoint, key), None)
+
+    def clear(self) -> None:
+        """
+        저장된 모든 항목을 제거합니다.
+        """
+        self._entries.clear()
+
+
+class VoteCache:
+    """
+    투표 여부를 저장하는 캐시입니다.
+    투표한 결과는 투표가 유효한 동안(``last_vote + window``) 저장하고,
+    투표하지 않은 결과는 negative_ttl 동안 저장합니다.
+    투표한 결과의 ``last_vote + window`` 가 이미 지났다면 negative_ttl 동안만 저장하지만,
+    저장된 결과는 항상 API가 반환한 그대로 반환합니다.
+
+    각 항목은 정수 키와 정수 값 하나로 저장되므로 많은 수의 (유저, 대상) 쌍을 적은 메모리로 저장할 수 있습니다.
+
+    :param window:
+        투표가 유효한 기간(초)입니다. 기본값은 12시간입니다.
+    :type window:
+        float, optional
+
+    :param negative_ttl:
+        투표하지 않은 결과를 저장할 기간(초)입니다. 기본값은 60입니다.
+    :type negative_ttl:
+        float, optional
+
+    :param max_size:
+        저장할 수 있는 최대 항목 수입니다. 기본값은 1000000입니다.
+    :type max_size:
+        int, optional
+    """
+
+    def __init__(
+        self,
+        window: float = 43200.0,
+        negative_ttl: float = 60.0,
+        max_size: int = 1_000_000,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size must be greater than 0, not {max_size}")
+
+        self.window = window
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.stats = CacheStats()
+        # key -> expiry (ms) << 64 | last_vote (ms)
+        self._positive: Dict[int, int] = {}
+        # key -> expiry (ms) << 64 | last_vote (ms)
+        # Negative entries share one TTL, so insertion order is also expiry order.
+        self._negative: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positive) + len(self._negative)
+
+    @staticmethod
+    def _key(vote_type: VoteType, user_id: int, target_id: int) -> int:
+        # strict_literal only wraps coroutines, so check the literal here.
+        if vote_type not in _VOTE_TYPES:
+            raise ValueError(
+                f"Arguments do not match. Expected: {list(get_args(VoteType))}"
+            )
+        return (int(user_id) << 65) | (int(target_id) << 1) | (vote_type == "server")
+
+    def get(
+        self, vote_type: VoteType, user_id: int, target_id: int
+    ) -> Optional[KoreanbotsVoteResponse]:
+        """
+        저장된 투표 여부를 반환합니다.
+
+        :param vote_type:
+            대상의 종류입니다.
+        :type vote_type:
+            VoteType
+
+        :param user_id:
+            user의 ID입니다.
+        :type user_id:
+            int
+
+        :param target_id:
+            봇 또는 서버의 ID입니다.
+        :type target_id:
+            int
+
+        :return:
+            저장된 결과가 없거나 만료되었으면 None을 반환합니다.
+        :rtype:
+            Optional[KoreanbotsVoteResponse]
+        """
+        key = self._key(vote_type, user_id, target_id)
+        now = int(time() * 1000)
+
+        packed = self._positive.get(key)
+        if packed is not None:
+            if packed >> 64 > now:
+                self.stats.hits += 1
+                return KoreanbotsVoteResponse(
+                    voted=True, last_vote=packed & 0xFFFFFFFFFFFFFFFF
+                )
+            del self._positive[key]
+
+        packed = self._negative.get(key)
+        if packed is not None:
+            if packed >> 64 > now:
+                self.stats.negative_hits += 1
+                return KoreanbotsVoteResponse(
+                    voted=False, last_vote=packed & 0xFFFFFFFFFFFFFFFF
+                )
+            del self._negative[key]
+
+        self.stats.misses += 1
+        return None
+
+    def set(
+        self,
+        vote_type: VoteType,
+        user_id: int,
+        target_id: int,
+        vote: KoreanbotsVoteResponse,
+    ) -> None:
+        """
+        투표 여부를 저장합니다.
+
+        :param vote_type:
+            대상의 종류입니다.
+        :type vote_type:
+            VoteType
+
+        :param user_id:
+            user의 ID입니다.
+        :type user_id:
+            int
+
+        :param target_id:
+            봇 또는 서버의 ID입니다.
+        :type target_id:
+            int
+
+        :param vote:
+            저장할 투표 여부입니다.
+        :type vote:
+            KoreanbotsVoteResponse
+        """
+        key = self._key(vote_type, user_id, target_id)
+        now = int(time() * 1000)
+        last_vote = int(vote.last_vote)
+
+        self._negative.pop(key, None)
+        self._positive.pop(key, None)
+
+        expiry = now + int(self.negative_ttl * 1000)
+        if vote.voted:
+            # The window only bounds how long the vote is cached. A vote the API
+            # still reports past the window is kept for negative_ttl, not flipped.
+            valid_until = last_vote + int(self.window * 1000)
+            if valid_until > now:
+                expiry = valid_until
+            if expiry > now:
+                self._positive[key] = (expiry << 64) | last_vote
+        elif self.negative_ttl > 0:
+            self._negative[key] = (expiry << 64) | last_vote
+
+        if len(self) > self.max_size:
+            self._evict(now)
+
+    def _evict(self, now: int) -> None:
+        # Evict down to 90% of max_size so the scans below stay rare.
+        target = self.max_size * 9 // 10
+
+        # Negative entries share one TTL, so the expired ones are at the front.
+        expired = []
+        for key, packed in self._negative.items():
+            if packed >> 64 > now:
+                break
+            expired.append(key)
+
+        if len(self) - len(expired) > target:
+            expired.extend(
+                key for key, packed in self._positive.items() if packed >> 64 <= now
+            )
+
+        for key in expired:
+            if self._negative.pop(key, None) is None:
+                del self._positive[key]
+        self.stats.evictions += len(expired)
+
+        # Everything left is still valid, so drop the oldest entries.
+        for entries in (self._negative, self._positive):
+            excess = len(self) - target
+            if excess > 0:
+                oldest = list(islice(entries, excess))
+                for key in oldest:
+                    del entries[key]
+                self.stats.evictions += len(oldest)
+
+    def invalidate(self, vote_type: VoteType, user_id: int, target_id: int) -> None:
+        """
+        저장된 투표 여부를 제거합니다.
+
+        :param vote_type:
+            대상의 종류입니다.
+        :type vote_type:
+            VoteType
+
+        :param user_id:
+            user의 ID입니다.
+        :type user_id:
+            int
+
+        :param target_id:
+            봇 또는 서버의 ID입니다.
+        :type target_id:
+            int
+        """
+        key = self._key(vote_type, user_id, target_id)
+        self._positive.pop(key, None)
+        self._negative.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        저장된 모든 항목을 제거합니다.
+        """
+        self._positive.clear()
+        self._negative.clear()
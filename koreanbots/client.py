@@ -1,12 +1,33 @@
+from asyncio import FIRST_COMPLETED, Task, get_running_loop, wait
+from itertools import islice
 from logging import getLogger
-from typing import Optional
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 from warnings import warn
 
 import aiohttp
 
+from koreanbots.cache import ResponseCache, VoteCache
+from koreanbots.codec import JSONCodec
+from koreanbots.connection import ConnectorConfig
 from koreanbots.decorator import strict_literal
 from koreanbots.errors import KoreanbotsException
-from koreanbots.http import KoreanbotsRequester
+from koreanbots.http import VERSION, KoreanbotsRequester
+from koreanbots.metrics import RequestMetrics
 from koreanbots.model import (
     KoreanbotsBotResponse,
     KoreanbotsResponse,
@@ -14,10 +35,17 @@ from koreanbots.model import (
     KoreanbotsUserResponse,
     KoreanbotsVoteResponse,
 )
-from koreanbots.typing import VoteType, WidgetStyle, WidgetType
+from koreanbots.ratelimit import RateLimiter
+from koreanbots.retry import CircuitBreaker, HedgePolicy, RetryBudget, RetryPolicy
+from koreanbots.tracing import RequestTracer
+from koreanbots.typing import OutputMode, VoteType, WidgetStyle, WidgetType
 
 log = getLogger(__name__)
 
+API_VERSION = int(VERSION.lstrip("v"))
+
+VoteResult = Union[KoreanbotsResponse[KoreanbotsVoteResponse], Exception]
+
 
 class Koreanbots(KoreanbotsRequester):
     """
@@ -32,16 +60,113 @@ class Koreanbots(KoreanbotsRequester):
         aiohttp.ClientSession의 클래스입니다. 만약 필요한 경우 이 인수를 지정하세요. 지정하지 않으면 생성합니다.
     :type session:
         Optional[aiohttp.ClientSession]
+
+    :param ratelimiter:
+        라우트별 레이트리밋을 관리하는 클래스입니다. 지정하지 않으면 생성합니다.
+    :type ratelimiter:
+        Optional[RateLimiter]
+
+    :param json_codec:
+        요청 본문과 응답에 사용할 JSON 백엔드입니다. 지정하지 않으면 orjson, ujson, json 순서로 설치된 백엔드를 사용합니다.
+    :type json_codec:
+        Optional[JSONCodec]
+
+    :param connector_config:
+        세션을 생성할 때 사용할 커넥션 풀 설정입니다. session을 지정한 경우 무시됩니다.
+    :type connector_config:
+        Optional[ConnectorConfig]
+
+    :param retry_policies:
+        메소드별 재시도 정책입니다. 지정하지 않으면 GET은 연결 오류와 5xx 응답을, POST는 연결 오류와 502, 503, 504 응답을 재시도합니다.
+    :type retry_policies:
+        Optional[Dict[str, RetryPolicy]]
+
+    :param retry_budget:
+        재시도 횟수를 전체 요청의 일정 비율로 제한하는 클래스입니다. 지정하지 않으면 생성합니다.
+    :type retry_budget:
+        Optional[RetryBudget]
+
+    :param circuit_breaker:
+        API가 연속으로 실패하면 요청을 바로 실패시키는 클래스입니다. 지정하지 않으면 생성합니다.
+    :type circuit_breaker:
+        Optional[CircuitBreaker]
+
+    :param hedge_policy:
+        GET 요청이 늦어질 때 같은 요청을 한 번 더 보내는 설정입니다. 지정하지 않으면 사용하지 않습니다.
+    :type hedge_policy:
+        Optional[HedgePolicy]
+
+    :param metrics:
+        라우트별 요청 지표를 기록할 클래스입니다. 지정하지 않으면 기록하지 않습니다.
+    :type metrics:
+        Optional[RequestMetrics]
+
+    :param tracer:
+        요청마다 단계별 시간을 기록해 콜백에 전달하는 클래스입니다. 지정하지 않으면 기록하지 않습니다.
+    :type tracer:
+        Optional[RequestTracer]
+
+    :param base_url:
+        요청을 보낼 API의 주소입니다. 지정하지 않으면 ``https://koreanbots.dev/api/v2`` 를 사용합니다.
+    :type base_url:
+        Optional[str]
+
+    :param cache:
+        봇, 유저, 서버 정보를 저장할 캐시입니다. 지정하지 않으면 캐시를 사용하지 않습니다.
+    :type cache:
+        Optional[ResponseCache]
+
+    :param vote_cache:
+        투표 여부를 저장할 캐시입니다. 지정하지 않으면 캐시를 사용하지 않습니다.
+    :type vote_cache:
+        Optional[VoteCache]
+
+    :param lazy:
+        유저, 봇, 서버 정보의 ``bots``, ``servers``, ``owners``, ``emojis`` 를 처음 접근할 때 모델로 변환합니다.
+        이름이나 투표 수 같은 값만 필요한 경우 변환 비용을 줄일 수 있습니다. 기본값은 False입니다.
+    :type lazy:
+        bool
     """
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        ratelimiter: Optional[RateLimiter] = None,
+        json_codec: Optional[JSONCodec] = None,
+        cache: Optional[ResponseCache] = None,
+        vote_cache: Optional[VoteCache] = None,
+        lazy: bool = False,
+        connector_config: Optional[ConnectorConfig] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[RequestMetrics] = None,
+        tracer: Optional[RequestTracer] = None,
+        base_url: Optional[str] = None,
     ) -> None:
-        super().__init__(api_key, session)
+        super().__init__(
+            api_key,
+            session,
+            ratelimiter,
+            json_codec,
+            connector_config,
+            retry_policies,
+            retry_budget,
+            circuit_breaker,
+            hedge_policy,
+            metrics,
+            tracer,
+            base_url,
+        )
+        self.cache = cache
+        self.vote_cache = vote_cache
+        self.lazy = lazy
 
-    async def post_guild_count(self, bot_id: int, **kwargs: Optional[int]) -> None:
+    async def post_guild_count(
+        self, bot_id: int, *, deadline: Optional[float] = None, **kwargs: Optional[int]
+    ) -> None:
         """
         길드 개수를 서버에 전송합니다.
 
@@ -49,12 +174,49 @@ class Koreanbots(KoreanbotsRequester):
             요청할 bot의 ID를 지정합니다.
         :type bot_id:
             int
+
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
         """
-        await super().post_update_bot_info(bot_id, **kwargs)
+        await super().post_update_bot_info(bot_id, deadline=deadline, **kwargs)
 
+    @overload
     async def get_user_info(
-        self, user_id: int
-    ) -> KoreanbotsResponse[KoreanbotsUserResponse]:
+        self,
+        user_id: int,
+        *,
+        output: Literal["model"] = "model",
+        deadline: Optional[float] = None,
+    ) -> KoreanbotsResponse[KoreanbotsUserResponse]: ...
+
+    @overload
+    async def get_user_info(
+        self, user_id: int, *, output: Literal["dict"], deadline: Optional[float] = None
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_user_info(
+        self, user_id: int, *, output: Literal["raw"], deadline: Optional[float] = None
+    ) -> bytes: ...
+
+    @overload
+    async def get_user_info(
+        self,
+        user_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsUserResponse], Dict[str, Any], bytes]: ...
+
+    async def get_user_info(
+        self,
+        user_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsUserResponse], Dict[str, Any], bytes]:
         """
         유저 정보를 가져옵니다.
 
@@ -62,24 +224,85 @@ class Koreanbots(KoreanbotsRequester):
             요청할 유저의 ID를 지정합니다.
         :type user_id:
             int
+        :param output:
+            반환할 형식을 지정합니다. ``model`` 은 모델, ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다.
+            ``dict`` 와 ``raw`` 는 캐시를 사용하지 않습니다. 기본값은 model입니다.
+        :type output:
+            OutputMode, optional
+
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 캐시된 값에는 적용되지 않습니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             유저 정보를 담고 있는 KoreanbotsUser클래스입니다.
         :rtype:
             KoreanbotsUser
         """
-        data = await super().get_user_info(user_id)
+        if output != "model":
+            return cast(
+                Union[Dict[str, Any], bytes],
+                await super().get_user_info(user_id, output=output, deadline=deadline),
+            )
+
+        if self.cache is not None:
+            return await self.cache.get_or_fetch(
+                "user", user_id, lambda: self._fetch_user_info(user_id, deadline)
+            )
+
+        return await self._fetch_user_info(user_id, deadline)
+
+    async def _fetch_user_info(
+        self, user_id: int, deadline: Optional[float] = None
+    ) -> KoreanbotsResponse[KoreanbotsUserResponse]:
+        data = await super().get_user_info(user_id, deadline=deadline)
 
         code = data["code"]
         version = data["version"]
         data = data["data"]
 
         return KoreanbotsResponse(
-            code=code, version=version, data=KoreanbotsUserResponse.from_dict(data)
+            code=code,
+            version=version,
+            data=KoreanbotsUserResponse.from_dict(data, self.lazy),
         )
 
+    @overload
     async def get_bot_info(
-        self, bot_id: int
-    ) -> KoreanbotsResponse[KoreanbotsBotResponse]:
+        self,
+        bot_id: int,
+        *,
+        output: Literal["model"] = "model",
+        deadline: Optional[float] = None,
+    ) -> KoreanbotsResponse[KoreanbotsBotResponse]: ...
+
+    @overload
+    async def get_bot_info(
+        self, bot_id: int, *, output: Literal["dict"], deadline: Optional[float] = None
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_bot_info(
+        self, bot_id: int, *, output: Literal["raw"], deadline: Optional[float] = None
+    ) -> bytes: ...
+
+    @overload
+    async def get_bot_info(
+        self,
+        bot_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsBotResponse], Dict[str, Any], bytes]: ...
+
+    async def get_bot_info(
+        self,
+        bot_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsBotResponse], Dict[str, Any], bytes]:
         """
         봇 정보를 가져옵니다.
 
@@ -88,24 +311,93 @@ class Koreanbots(KoreanbotsRequester):
         :type bot_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``model`` 은 모델, ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다.
+            ``dict`` 와 ``raw`` 는 캐시를 사용하지 않습니다. 기본값은 model입니다.
+        :type output:
+            OutputMode, optional
+
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 캐시된 값에는 적용되지 않습니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             봇 정보를 담고 있는 KoreanbotsBot클래스입니다.
         :rtype:
             KoreanbotsBot
         """
-        data = await super().get_bot_info(bot_id)
+        if output != "model":
+            return cast(
+                Union[Dict[str, Any], bytes],
+                await super().get_bot_info(bot_id, output=output, deadline=deadline),
+            )
+
+        if self.cache is not None:
+            return await self.cache.get_or_fetch(
+                "bot", bot_id, lambda: self._fetch_bot_info(bot_id, deadline)
+            )
+
+        return await self._fetch_bot_info(bot_id, deadline)
+
+    async def _fetch_bot_info(
+        self, bot_id: int, deadline: Optional[float] = None
+    ) -> KoreanbotsResponse[KoreanbotsBotResponse]:
+        data = await super().get_bot_info(bot_id, deadline=deadline)
 
         code = data["code"]
         version = data["version"]
         data = data["data"]
 
         return KoreanbotsResponse(
-            code=code, version=version, data=KoreanbotsBotResponse.from_dict(data)
+            code=code,
+            version=version,
+            data=KoreanbotsBotResponse.from_dict(data, self.lazy),
         )
 
+    @overload
     async def get_server_info(
-        self, server_id: int
-    ) -> KoreanbotsResponse[KoreanbotsServerResponse]:
+        self,
+        server_id: int,
+        *,
+        output: Literal["model"] = "model",
+        deadline: Optional[float] = None,
+    ) -> KoreanbotsResponse[KoreanbotsServerResponse]: ...
+
+    @overload
+    async def get_server_info(
+        self,
+        server_id: int,
+        *,
+        output: Literal["dict"],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_server_info(
+        self,
+        server_id: int,
+        *,
+        output: Literal["raw"],
+        deadline: Optional[float] = None,
+    ) -> bytes: ...
+
+    @overload
+    async def get_server_info(
+        self,
+        server_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsServerResponse], Dict[str, Any], bytes]: ...
+
+    async def get_server_info(
+        self,
+        server_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsServerResponse], Dict[str, Any], bytes]:
         """
         서버 정보를 가져옵니다.
 
@@ -114,20 +406,52 @@ class Koreanbots(KoreanbotsRequester):
         :type server_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``model`` 은 모델, ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다.
+            ``dict`` 와 ``raw`` 는 캐시를 사용하지 않습니다. 기본값은 model입니다.
+        :type output:
+            OutputMode, optional
+
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 캐시된 값에는 적용되지 않습니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             봇 정보를 담고 있는 KoreanbotsServer클래스입니다.
         :rtype:
             KoreanbotsServer
         """
-
-        data = await super().get_server_info(server_id)
+        if output != "model":
+            return cast(
+                Union[Dict[str, Any], bytes],
+                await super().get_server_info(
+                    server_id, output=output, deadline=deadline
+                ),
+            )
+
+        if self.cache is not None:
+            return await self.cache.get_or_fetch(
+                "server",
+                server_id,
+                lambda: self._fetch_server_info(server_id, deadline),
+            )
+
+        return await self._fetch_server_info(server_id, deadline)
+
+    async def _fetch_server_info(
+        self, server_id: int, deadline: Optional[float] = None
+    ) -> KoreanbotsResponse[KoreanbotsServerResponse]:
+        data = await super().get_server_info(server_id, deadline=deadline)
 
         code = data["code"]
         version = data["version"]
         data = data["data"]
 
         return KoreanbotsResponse(
-            code=code, version=version, data=KoreanbotsServerResponse.from_dict(data)
+            code=code,
+            version=version,
+            data=KoreanbotsServerResponse.from_dict(data, self.lazy),
         )
 
     @strict_literal(["widget_type", "style"])
@@ -173,9 +497,54 @@ class Koreanbots(KoreanbotsRequester):
         """
         return await self.get_bot_widget_url(widget_type, bot_id, style, scale, icon)
 
+    @overload
     async def get_bot_vote(
-        self, user_id: int, bot_id: int
-    ) -> KoreanbotsResponse[KoreanbotsVoteResponse]:
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: Literal["model"] = "model",
+        deadline: Optional[float] = None,
+    ) -> KoreanbotsResponse[KoreanbotsVoteResponse]: ...
+
+    @overload
+    async def get_bot_vote(
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: Literal["dict"],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_bot_vote(
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: Literal["raw"],
+        deadline: Optional[float] = None,
+    ) -> bytes: ...
+
+    @overload
+    async def get_bot_vote(
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsVoteResponse], Dict[str, Any], bytes]: ...
+
+    async def get_bot_vote(
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsVoteResponse], Dict[str, Any], bytes]:
         """
         user_id를 통해 주어진 bot_id에 대한 투표 여부를 반환합니다.
 
@@ -189,24 +558,97 @@ class Koreanbots(KoreanbotsRequester):
         :type bot_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``model`` 은 모델, ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다.
+            ``dict`` 와 ``raw`` 는 캐시를 사용하지 않습니다. 기본값은 model입니다.
+        :type output:
+            OutputMode, optional
+
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 캐시된 값에는 적용되지 않습니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             투표여부를 담고 있는 KoreanbotsVote클래스입니다.
         :rtype:
             KoreanbotsVote
         """
-        data = await super().get_bot_vote(user_id, bot_id)
+        if output != "model":
+            return cast(
+                Union[Dict[str, Any], bytes],
+                await super().get_bot_vote(
+                    user_id, bot_id, output=output, deadline=deadline
+                ),
+            )
+
+        if self.vote_cache is not None:
+            vote = self.vote_cache.get("bot", user_id, bot_id)
+            if vote is not None:
+                return KoreanbotsResponse(code=200, version=API_VERSION, data=vote)
+
+        data = await super().get_bot_vote(user_id, bot_id, deadline=deadline)
 
         code = data["code"]
         version = data["version"]
         data = data["data"]
 
-        return KoreanbotsResponse(
+        response = KoreanbotsResponse(
             code=code, version=version, data=KoreanbotsVoteResponse.from_dict(data)
         )
+        if self.vote_cache is not None:
+            self.vote_cache.set("bot", user_id, bot_id, response.data)
+
+        return response
 
+    @overload
     async def get_server_vote(
-        self, user_id: int, server_id: int
-    ) -> KoreanbotsResponse[KoreanbotsVoteResponse]:
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: Literal["model"] = "model",
+        deadline: Optional[float] = None,
+    ) -> KoreanbotsResponse[KoreanbotsVoteResponse]: ...
+
+    @overload
+    async def get_server_vote(
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: Literal["dict"],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_server_vote(
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: Literal["raw"],
+        deadline: Optional[float] = None,
+    ) -> bytes: ...
+
+    @overload
+    async def get_server_vote(
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsVoteResponse], Dict[str, Any], bytes]: ...
+
+    async def get_server_vote(
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: OutputMode = "model",
+        deadline: Optional[float] = None,
+    ) -> Union[KoreanbotsResponse[KoreanbotsVoteResponse], Dict[str, Any], bytes]:
         """
         user_id를 통해 주어진 server_id에 대한 투표 여부를 반환합니다.
 
@@ -220,20 +662,194 @@ class Koreanbots(KoreanbotsRequester):
         :type server_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``model`` 은 모델, ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다.
+            ``dict`` 와 ``raw`` 는 캐시를 사용하지 않습니다. 기본값은 model입니다.
+        :type output:
+            OutputMode, optional
+
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 캐시된 값에는 적용되지 않습니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             투표여부를 담고 있는 KoreanbotsVote클래스입니다.
         :rtype:
             KoreanbotsVote
         """
-        data = await super().get_server_vote(user_id, server_id)
+        if output != "model":
+            return cast(
+                Union[Dict[str, Any], bytes],
+                await super().get_server_vote(
+                    user_id, server_id, output=output, deadline=deadline
+                ),
+            )
+
+        if self.vote_cache is not None:
+            vote = self.vote_cache.get("server", user_id, server_id)
+            if vote is not None:
+                return KoreanbotsResponse(code=200, version=API_VERSION, data=vote)
+
+        data = await super().get_server_vote(user_id, server_id, deadline=deadline)
 
         code = data["code"]
         version = data["version"]
         data = data["data"]
 
-        return KoreanbotsResponse(
+        response = KoreanbotsResponse(
             code=code, version=version, data=KoreanbotsVoteResponse.from_dict(data)
         )
+        if self.vote_cache is not None:
+            self.vote_cache.set("server", user_id, server_id, response.data)
+
+        return response
+
+    async def get_bot_votes_many(
+        self,
+        user_ids: Iterable[int],
+        bot_id: int,
+        concurrency: int = 10,
+        *,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, VoteResult]]:
+        """
+        여러 user_id에 대해 주어진 bot_id에 대한 투표 여부를 동시에 확인합니다.
+        결과는 완료되는 순서대로 반환됩니다.
+
+        .. code:: py
+
+            async for user_id, result in kb.get_bot_votes_many(user_ids, bot_id):
+                if isinstance(result, Exception):
+                    continue
+                print(user_id, result.data.voted)
+
+        :param user_ids:
+            요청할 user의 ID 목록을 지정합니다.
+        :type user_ids:
+            Iterable[int]
+
+        :param bot_id:
+            요청할 봇의 ID를 지정합니다.
+        :type bot_id:
+            int
+
+        :param concurrency:
+            동시에 보낼 수 있는 최대 요청 수입니다. 기본값은 10입니다.
+        :type concurrency:
+            int, optional
+
+        :param deadline:
+            모든 요청에 사용할 최대 시간(초)입니다. 시간이 지나면 끝나지 않은 요청의 결과로 ``asyncio.TimeoutError`` 를 반환합니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
+        :return:
+            user_id와 투표여부를 담고 있는 KoreanbotsVote클래스의 튜플입니다.
+            요청에 실패하면 KoreanbotsVote클래스 대신 발생한 예외를 반환합니다.
+        :rtype:
+            AsyncIterator[Tuple[int, Union[KoreanbotsVote, Exception]]]
+        """
+        async for result in self._get_votes_many(
+            lambda user_id, timeout: self.get_bot_vote(
+                user_id, bot_id, deadline=timeout
+            ),
+            user_ids,
+            concurrency,
+            deadline,
+        ):
+            yield result
+
+    async def get_server_votes_many(
+        self,
+        user_ids: Iterable[int],
+        server_id: int,
+        concurrency: int = 10,
+        *,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, VoteResult]]:
+        """
+        여러 user_id에 대해 주어진 server_id에 대한 투표 여부를 동시에 확인합니다.
+        결과는 완료되는 순서대로 반환됩니다.
+
+        :param user_ids:
+            요청할 user의 ID 목록을 지정합니다.
+        :type user_ids:
+            Iterable[int]
+
+        :param server_id:
+            요청할 서버의 ID를 지정합니다.
+        :type server_id:
+            int
+
+        :param concurrency:
+            동시에 보낼 수 있는 최대 요청 수입니다. 기본값은 10입니다.
+        :type concurrency:
+            int, optional
+
+        :param deadline:
+            모든 요청에 사용할 최대 시간(초)입니다. 시간이 지나면 끝나지 않은 요청의 결과로 ``asyncio.TimeoutError`` 를 반환합니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
+        :return:
+            user_id와 투표여부를 담고 있는 KoreanbotsVote클래스의 튜플입니다.
+            요청에 실패하면 KoreanbotsVote클래스 대신 발생한 예외를 반환합니다.
+        :rtype:
+            AsyncIterator[Tuple[int, Union[KoreanbotsVote, Exception]]]
+        """
+        async for result in self._get_votes_many(
+            lambda user_id, timeout: self.get_server_vote(
+                user_id, server_id, deadline=timeout
+            ),
+            user_ids,
+            concurrency,
+            deadline,
+        ):
+            yield result
+
+    async def _get_votes_many(
+        self,
+        fetch: Callable[
+            [int, Optional[float]],
+            Awaitable[KoreanbotsResponse[KoreanbotsVoteResponse]],
+        ],
+        user_ids: Iterable[int],
+        concurrency: int,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, VoteResult]]:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+
+        end = None if deadline is None else monotonic() + deadline
+
+        async def run(user_id: int) -> Tuple[int, VoteResult]:
+            # Requests started later get whatever is left of the batch deadline.
+            timeout = None if end is None else max(end - monotonic(), 0)
+            try:
+                return user_id, await fetch(user_id, timeout)
+            except Exception as e:
+                return user_id, e
+
+        loop = get_running_loop()
+        remaining = iter(user_ids)
+        pending: Set["Task[Tuple[int, VoteResult]]"] = {
+            loop.create_task(run(user_id)) for user_id in islice(remaining, concurrency)
+        }
+
+        try:
+            while pending:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                # Keep the pool full before handing results back to the caller.
+                pending.update(
+                    loop.create_task(run(user_id))
+                    for user_id in islice(remaining, len(done))
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     # deprecated since 3.0.0
 
@@ -0,0 +1,222 @@
+import os
+from asyncio import (
+    AbstractServer,
+    IncompleteReadError,
+    LimitOverrunError,
+    StreamReader,
+    StreamWriter,
+)
+from logging import getLogger
+from socket import gethostname
+from time import monotonic
+from typing import IO, Any, Dict, Optional, Tuple
+
+from .codec import JSONCodec, default_codec
+
+log = getLogger(__name__)
+
+_COUNT_KEYS = frozenset(("servers", "shards"))
+
+
+def _parse_counts(counts: Any) -> Dict[str, int]:
+    # Reports come from other processes, so check them before they reach totals().
+    if (
+        not isinstance(counts, dict)
+        or "servers" not in counts
+        or not _COUNT_KEYS.issuperset(counts)
+        or not all(type(value) is int and value >= 0 for value in counts.values())
+    ):
+        raise ValueError(f"Invalid cluster counts: {counts!r}")
+    return counts
+
+
+class ClusterAggregator:
+    """
+    한 호스트에서 여러 프로세스로 나뉘어 실행되는 봇의 길드 개수를 모으는 클래스입니다.
+
+    각 프로세스는 :meth:`report` 로 자신의 길드 개수를 보고합니다.
+    잠금 파일을 먼저 잡은 프로세스가 리더가 되어 유닉스 소켓으로 다른 프로세스의 보고를 받고,
+    :meth:`totals` 로 합계를 계산합니다. 리더가 종료되면 다음으로 보고하는 프로세스가 리더가 됩니다.
+    유닉스 소켓과 ``fcntl`` 을 사용하므로, 이를 지원하지 않는 Windows에서는 다른 프로세스의 보고를 받지 않고
+    이 프로세스의 길드 개수만 합계로 사용합니다.
+
+    :param path:
+        유닉스 소켓의 경로입니다. 잠금 파일로 ``path + ".lock"`` 을 사용합니다.
+    :type path:
+        str
+
+    :param node_id:
+        프로세스를 구분하는 이름입니다. 지정하지 않으면 호스트 이름과 PID를 사용합니다. 기본값은 None 입니다.
+    :type node_id:
+        Optional[str], optional
+
+    :param stale_after:
+        이 시간(초) 동안 보고하지 않은 프로세스는 합계에서 제외합니다. 기본값은 180입니다.
+    :type stale_after:
+        float, optional
+
+    :param settle:
+        리더가 된 뒤 다른 프로세스의 보고를 기다릴 시간(초)입니다. 이 시간이 지나기 전에는 :attr:`ready` 가 False입니다. 기본값은 90입니다.
+    :type settle:
+        float, optional
+
+    :param json_codec:
+        보고에 사용할 JSON 백엔드입니다. 기본값은 None 입니다.
+    :type json_codec:
+        Optional[JSONCodec], optional
+    """
+
+    def __init__(
+        self,
+        path: str,
+        node_id: Optional[str] = None,
+        stale_after: float = 180,
+        settle: float = 90,
+        json_codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self.path = path
+        self.node_id = node_id or f"{gethostname()}-{os.getpid()}"
+        self.stale_after = stale_after
+        self.settle = settle
+        self.json_codec = json_codec or default_codec
+        self._lock_file: Optional[IO[str]] = None
+        self._server: Optional[AbstractServer] = None
+        self._standalone = False
+        self._leader_since = 0.0
+        self._reports: Dict[str, Tuple[float, Dict[str, int]]] = {}
+
+    @property
+    def is_leader(self) -> bool:
+        """이 프로세스가 리더인지 여부"""
+        return self._server is not None or self._standalone
+
+    @property
+    def ready(self) -> bool:
+        """리더이고, 다른 프로세스의 보고를 충분히 기다렸는지 여부"""
+        if self._standalone:
+            return True
+        return self.is_leader and monotonic() - self._leader_since >= self.settle
+
+    async def report(self, counts: Dict[str, int]) -> None:
+        """
+        이 프로세스의 길드 개수를 리더에게 보고합니다.
+        리더가 없으면 이 프로세스가 리더가 됩니다.
+
+        :param counts:
+            ``servers``, ``shards`` 를 키로 하는 값입니다.
+        :type counts:
+            Dict[str, int]
+        """
+        if not self.is_leader:
+            await self._try_lead()
+
+        if self.is_leader:
+            self._record(self.node_id, counts)
+            return
+
+        from asyncio import open_unix_connection
+
+        line = self.json_codec.dumps({"node": self.node_id, "counts": counts})
+        if isinstance(line, str):
+            line = line.encode()
+        try:
+            _, writer = await open_unix_connection(self.path)
+        except OSError:
+            # The leader is gone or restarting; the next report will elect one.
+            log.debug("No cluster leader is listening on %s.", self.path)
+            return
+        try:
+            writer.write(line + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def totals(self) -> Dict[str, int]:
+        """
+        보고된 길드 개수의 합계를 반환합니다.
+        ``servers`` 는 모든 프로세스의 합, ``shards`` 는 보고된 값 중 가장 큰 값입니다.
+
+        :rtype:
+            Dict[str, int]
+        """
+        deadline = monotonic() - self.stale_after
+        for node, (reported_at, _) in list(self._reports.items()):
+            if reported_at < deadline:
+                log.info("Cluster node %s stopped reporting.", node)
+                del self._reports[node]
+
+        totals = {"servers": 0}
+        for _, counts in self._reports.values():
+            totals["servers"] += counts.get("servers", 0)
+            if "shards" in counts:
+                totals["shards"] = max(totals.get("shards", 0), counts["shards"])
+        return totals
+
+    async def close(self) -> None:
+        """
+        리더라면 소켓을 닫고 잠금을 해제합니다.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+        if self._lock_file is not None:
+            import fcntl
+
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _record(self, node: str, counts: Dict[str, int]) -> None:
+        self._reports[node] = (monotonic(), dict(counts))
+
+    async def _try_lead(self) -> None:
+        try:
+            import fcntl
+            from asyncio import start_unix_server
+        except ImportError:
+            # Neither flock nor unix sockets exist on Windows, so count this
+            # process alone instead of failing to post at all.
+            log.warning(
+                "Cluster aggregation is not supported on this platform. "
+                "Only this process's guild count will be posted."
+            )
+            self._standalone = True
+            return
+
+        if self._lock_file is None:
+            self._lock_file = open(self.path + ".lock", "a+")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+
+        # Holding the lock means any existing socket belongs to a dead leader.
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        self._server = await start_unix_server(self._handle, self.path)
+        self._leader_since = monotonic()
+        self._reports.clear()
+        log.info("Became cluster leader on %s.", self.path)
+
+    async def _handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except (IncompleteReadError, LimitOverrunError):
+                    break
+                try:
+                    message: Any = self.json_codec.loads(line)
+                    self._record(str(message["node"]), _parse_counts(message["counts"]))
+                except (ValueError, KeyError, TypeError):
+                    log.warning("Ignoring a malformed cluster report.")
+        finally:
+            writer.close()
@@ -0,0 +1,104 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, Union
+
+from .typing import JSONBackend
+
+JSONInput = Union[str, bytes]
+
+
+@dataclass
+class DecodeStats:
+    """
+    엔드포인트별 응답 디코딩 시간을 나타내는 클래스입니다.
+    """
+
+    count: int = 0
+    """디코딩한 응답 수"""
+    seconds: float = 0.0
+    """디코딩에 걸린 총 시간(초)"""
+    bytes: int = 0
+    """디코딩한 응답의 총 크기"""
+
+    @property
+    def average(self) -> float:
+        """응답 하나를 디코딩하는 데 걸린 평균 시간(초)"""
+        return self.seconds / self.count if self.count else 0.0
+
+
+class JSONCodec:
+    """
+    요청 본문을 인코딩하고 응답을 디코딩하는 JSON 백엔드입니다.
+
+    :param name:
+        백엔드의 이름입니다.
+    :type name:
+        str
+
+    :param loads:
+        str 또는 bytes를 받아 파이썬 객체로 변환하는 함수입니다.
+    :type loads:
+        Callable[[Union[str, bytes]], Any]
+
+    :param dumps:
+        파이썬 객체를 str 또는 bytes로 변환하는 함수입니다.
+    :type dumps:
+        Callable[[Any], Union[str, bytes]]
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[JSONInput], Any],
+        dumps: Callable[[Any], JSONInput],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"<JSONCodec name={self.name!r}>"
+
+    @classmethod
+    def from_name(cls, name: Optional[JSONBackend] = None) -> "JSONCodec":
+        """
+        이름으로 JSON 백엔드를 만듭니다.
+        이름을 지정하지 않으면 orjson, ujson, json 순서로 설치된 백엔드를 사용합니다.
+
+        :param name:
+            백엔드의 이름입니다. 기본값은 None 입니다.
+        :type name:
+            Optional[JSONBackend], optional
+
+        :raises ImportError:
+            지정한 백엔드가 설치되어 있지 않습니다.
+
+        :rtype:
+            JSONCodec
+        """
+        if name is None:
+            backends: Tuple[JSONBackend, ...] = ("orjson", "ujson")
+            for backend in backends:
+                try:
+                    return cls.from_name(backend)
+                except ImportError:
+                    pass
+            return cls.from_name("json")
+
+        if name == "orjson":
+            import orjson  # type: ignore[import-not-found, unused-ignore]
+
+            return cls("orjson", orjson.loads, orjson.dumps)
+
+        if name == "ujson":
+            import ujson  # type: ignore[import-untyped, unused-ignore]
+
+            return cls("ujson", ujson.loads, ujson.dumps)
+
+        if name == "json":
+            return cls("json", json.loads, json.dumps)
+
+        raise ValueError(f"Unknown JSON backend: {name}")
+
+
+default_codec = JSONCodec.from_name()
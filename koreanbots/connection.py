@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+from ssl import SSLContext, create_default_context
+from types import SimpleNamespace
+from typing import Any, Optional, Union
+
+import aiohttp
+
+
+@dataclass
+class ConnectionStats:
+    """
+    세션이 새로 연결한 횟수와 기존 연결을 재사용한 횟수를 나타내는 클래스입니다.
+    """
+
+    created: int = 0
+    """새로 연결한 횟수"""
+    reused: int = 0
+    """기존 연결을 재사용한 횟수"""
+
+    @property
+    def reuse_ratio(self) -> float:
+        """요청 중 기존 연결을 재사용한 비율"""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        연결 횟수를 기록하는 :class:`aiohttp.TraceConfig` 를 반환합니다.
+
+        :rtype:
+            aiohttp.TraceConfig
+        """
+
+        async def on_create(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateEndParams,
+        ) -> None:
+            self.created += 1
+
+        async def on_reuse(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionReuseconnParams,
+        ) -> None:
+            self.reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+
+@dataclass
+class ConnectorConfig:
+    """
+    세션의 커넥션 풀 설정을 나타내는 클래스입니다.
+    """
+
+    limit: int = 100
+    """전체 동시 연결 수의 최대값입니다. 0이면 제한하지 않습니다."""
+    limit_per_host: int = 0
+    """호스트별 동시 연결 수의 최대값입니다. 0이면 제한하지 않습니다."""
+    keepalive_timeout: float = 30.0
+    """사용하지 않는 연결을 유지할 시간(초)입니다."""
+    ttl_dns_cache: Optional[int] = 300
+    """DNS 조회 결과를 캐시할 시간(초)입니다. None이면 만료되지 않습니다."""
+    ssl: Union[SSLContext, bool] = field(default_factory=create_default_context)
+    """
+    TLS 연결에 사용할 :class:`ssl.SSLContext` 입니다.
+    같은 컨텍스트를 공유하는 연결은 TLS 세션을 재사용합니다.
+    """
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        설정으로 :class:`aiohttp.TCPConnector` 를 만듭니다.
+
+        :rtype:
+            aiohttp.TCPConnector
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            ssl=self.ssl,
+        )
+
+
+def create_session(
+    config: Optional[ConnectorConfig] = None,
+    stats: Optional[ConnectionStats] = None,
+    **kwargs: Any,
+) -> aiohttp.ClientSession:
+    """
+    여러 클라이언트가 함께 사용할 수 있는 세션을 만듭니다.
+    토큰은 요청마다 헤더에 추가되므로 세션에 토큰을 지정하지 않습니다.
+
+    :param config:
+        커넥션 풀 설정입니다. 기본값은 None 입니다.
+    :type config:
+        Optional[ConnectorConfig], optional
+
+    :param stats:
+        연결 횟수를 기록할 클래스입니다. 기본값은 None 입니다.
+    :type stats:
+        Optional[ConnectionStats], optional
+
+    :param kwargs:
+        :class:`aiohttp.ClientSession` 에 전달할 인자입니다.
+
+    :rtype:
+        aiohttp.ClientSession
+    """
+    if stats is not None:
+        kwargs["trace_configs"] = [
+            *kwargs.get("trace_configs", ()),
+            stats.trace_config(),
+        ]
+
+    return aiohttp.ClientSession(
+        connector=(config or ConnectorConfig()).create_connector(), **kwargs
+    )
@@ -0,0 +1,252 @@
+from collections.abc import Sequence as SequenceABC
+from dataclasses import MISSING, fields, is_dataclass
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+
+T = TypeVar("T")
+
+Decoder = Callable[[Dict[str, Any]], T]
+
+_decoders: Dict[Tuple[type, bool], Callable[[Dict[str, Any]], Any]] = {}
+_building: Set[Tuple[type, bool]] = set()
+
+
+class LazySequence(Sequence[T]):
+    """
+    처음 접근할 때 모델로 변환되는 시퀀스입니다.
+    길이는 변환하지 않고 확인할 수 있습니다.
+    """
+
+    __slots__ = ("_raw", "_decode", "_items")
+
+    def __init__(self, raw: List[Dict[str, Any]], decode: Decoder[T]) -> None:
+        self._raw: Optional[List[Dict[str, Any]]] = raw
+        self._decode = decode
+        self._items: Optional[Tuple[T, ...]] = None
+
+    @property
+    def decoded(self) -> bool:
+        """모델로 변환되었는지 여부"""
+        return self._items is not None
+
+    def _materialize(self) -> Tuple[T, ...]:
+        items = self._items
+        if items is None:
+            decode = self._decode
+            items = self._items = tuple(
+                [decode(v) for v in cast(List[Dict[str, Any]], self._raw)]
+            )
+            # The raw payload is no longer needed once decoded.
+            self._raw = None
+        return items
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[T, ...]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, Tuple[T, ...]]:
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return len(cast(List[Dict[str, Any]], self._raw))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySequence):
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __repr__(self) -> str:
+        if self._items is None:
+            return f"<LazySequence len={len(self)}>"
+        return repr(self._items)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Generated decoders can't be pickled, so pickle the decoded items.
+        return tuple, (self._materialize(),)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _setter(cls: type, name: str) -> Callable[[Any, Any], None]:
+    # Slot descriptors skip the frozen __setattr__, which is the fastest way in.
+    for klass in cls.__mro__:
+        descriptor = klass.__dict__.get(name)
+        if descriptor is not None and type(descriptor).__name__ == "member_descriptor":
+            return cast(Callable[[Any, Any], None], descriptor.__set__)
+
+    def setter(obj: Any, value: Any) -> None:
+        object.__setattr__(obj, name, value)
+
+    return setter
+
+
+def _intern_items(value: Any) -> Any:
+    # Fields such as category may hold a list of strings instead of one.
+    if isinstance(value, (list, tuple)):
+        return tuple(intern(v) if type(v) is str else v for v in value)
+    return value
+
+
+def _nested(cls: Any, lazy: bool, namespace: Dict[str, Any]) -> str:
+    name = f"_decode_{cls.__name__}_{id(cls)}"
+    if (cls, lazy) in _building:
+        # A type that is still being built can only be looked up at call time.
+        namespace["_get_decoder"] = get_decoder
+        namespace[f"_type_{id(cls)}"] = cls
+        return f"_get_decoder(_type_{id(cls)}, {lazy})"
+    namespace[name] = get_decoder(cls, lazy)
+    return name
+
+
+def _build(cls: type, lazy: bool) -> Callable[[Dict[str, Any]], Any]:
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {
+        "_cls": cls,
+        "_new": object.__new__,
+        "_intern": intern,
+        "_intern_items": _intern_items,
+        "_tuple": tuple,
+        "_lazy": LazySequence,
+    }
+    lines = ["def decode(data):", "    get = data.get", "    obj = _new(_cls)"]
+
+    for f in fields(cls):
+        if not f.init:
+            continue
+
+        key = f.metadata.get("key", f.name)
+        annotation = _unwrap_optional(hints[f.name])
+        setter = f"_set_{f.name}"
+        default = f"_default_{f.name}"
+        namespace[setter] = _setter(cls, f.name)
+
+        if f.default is not MISSING:
+            namespace[default] = f.default
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            default = f"_factory_{f.name}()"
+        else:
+            lines.append(f"    {setter}(obj, data[{key!r}])")
+            continue
+
+        if get_origin(annotation) in (tuple, SequenceABC):
+            item = _unwrap_optional(get_args(annotation)[0])
+            if not is_dataclass(item):
+                convert = "_tuple(value)"
+            elif lazy:
+                convert = f"_lazy(value, {_nested(item, lazy, namespace)})"
+            else:
+                convert = (
+                    f"_tuple([{_nested(item, lazy, namespace)}(v) for v in value])"
+                )
+        elif is_dataclass(annotation):
+            convert = f"{_nested(annotation, lazy, namespace)}(value)"
+        elif f.metadata.get("intern"):
+            convert = "_intern(value) if type(value) is str else _intern_items(value)"
+        else:
+            lines.append(f"    {setter}(obj, get({key!r}, {default}))")
+            continue
+
+        lines.append(f"    value = get({key!r})")
+        lines.append(f"    {setter}(obj, {default} if value is None else {convert})")
+
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)
+    return cast(Callable[[Dict[str, Any]], Any], namespace["decode"])
+
+
+def get_decoder(cls: Type[T], lazy: bool = False) -> Decoder[T]:
+    """
+    dataclass의 필드를 바탕으로 API 응답을 모델로 변환하는 함수를 만들어 반환합니다.
+    함수는 클래스마다 처음 호출될 때 한 번만 만들어집니다.
+
+    - 필드의 ``metadata`` 에 ``key`` 가 있으면 해당 키의 값을 사용합니다.
+    - 필드의 ``metadata`` 에 ``intern`` 이 있으면 문자열을 intern합니다. 리스트라면 각 문자열을 intern한 튜플로 만듭니다.
+    - 응답에 없는 필드는 기본값을 사용하고, 모델에 없는 키는 무시합니다.
+    - 다른 dataclass 타입이나 그 시퀀스인 필드는 재귀적으로 변환합니다.
+
+    :param cls:
+        변환할 dataclass입니다.
+    :type cls:
+        Type[T]
+
+    :param lazy:
+        모델의 시퀀스를 처음 접근할 때 변환하는 :class:`LazySequence` 로 만들지 여부입니다. 기본값은 False입니다.
+    :type lazy:
+        bool, optional
+
+    :rtype:
+        Callable[[Dict[str, Any]], T]
+    """
+    key = (cls, lazy)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        if not is_dataclass(cls):
+            raise TypeError(f"{cls!r} is not a dataclass")
+
+        _building.add(key)
+        try:
+            decoder = _decoders[key] = _build(cls, lazy)
+        finally:
+            _building.discard(key)
+
+    return cast(Decoder[T], decoder)
+
+
+def decode(cls: Type[T], data: Dict[str, Any], lazy: bool = False) -> T:
+    """
+    API 응답을 주어진 모델로 변환합니다.
+
+    :param cls:
+        변환할 dataclass입니다.
+    :type cls:
+        Type[T]
+
+    :param data:
+        API 응답의 ``data`` 입니다.
+    :type data:
+        Dict[str, Any]
+
+    :param lazy:
+        모델의 시퀀스를 처음 접근할 때 변환할지 여부입니다. 기본값은 False입니다.
+    :type lazy:
+        bool, optional
+
+    :rtype:
+        T
+    """
+    return get_decoder(cls, lazy)(data)
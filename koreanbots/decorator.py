@@ -1,39 +1,47 @@
 import functools
 import inspect
-from typing import Any, Callable, List, Literal, cast, get_args
+from typing import Any, Callable, List, Literal, cast, get_args, get_origin
 
 from koreanbots.typing import CORO
 
 
 def strict_literal(argument_names: List[str]) -> Callable[[CORO], CORO]:
     def decorator(f: CORO) -> CORO:
+        # Resolve everything once here so a call only does a set lookup per argument.
+        full_arg_spec = inspect.getfullargspec(f)
+        checks = []
+        for argument_name in argument_names:
+            arg_annotation = full_arg_spec.annotations[argument_name]
+            if get_origin(arg_annotation) is Literal:
+                literal_values = get_args(arg_annotation)
+                checks.append(
+                    (
+                        full_arg_spec.args.index(argument_name),
+                        argument_name,
+                        frozenset(literal_values),
+                        f"Arguments do not match. Expected: {list(literal_values)}",
+                    )
+                )
+
         @functools.wraps(f)
         async def decorated_function(*args: Any, **kwargs: Any) -> Any:
-            # First get about func args
-            full_arg_spec = inspect.getfullargspec(f)
-            for argument_name in argument_names:
-                # Get annotation
-                arg_annoration = full_arg_spec.annotations[argument_name]
-                # Check annotation is Lireral
-                if arg_annoration.__origin__ is Literal:
-                    # Literal -> list
-                    literal_list = list(get_args(arg_annoration))
-                    # Get index
-                    arg_index = full_arg_spec.args.index(argument_name)
-                    # Handle arguments
-                    if arg_index < len(args) and args[arg_index] not in literal_list:
-                        raise ValueError(
-                            f"Arguments do not match. Expected: {literal_list}"
-                        )
-                    # Handle keyword arguments
-                    elif (
-                        kwargs.get(argument_name)
-                        and kwargs[argument_name] not in literal_list
-                    ):
-                        if kwargs[argument_name] not in literal_list:
-                            raise ValueError(
-                                f"Arguments do not match. Expected: {literal_list}"
-                            )
+            for arg_index, argument_name, allowed, message in checks:
+                # Handle arguments
+                if arg_index < len(args):
+                    value = args[arg_index]
+                # Handle keyword arguments
+                elif argument_name in kwargs:
+                    value = kwargs[argument_name]
+                else:
+                    continue
+
+                try:
+                    valid = value in allowed
+                except TypeError:
+                    valid = False
+
+                if not valid:
+                    raise ValueError(message)
 
             return await f(*args, **kwargs)
 
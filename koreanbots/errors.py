@@ -9,6 +9,14 @@ class AuthorizeError(KoreanbotsException):
     pass
 
 
+class CircuitOpenError(KoreanbotsException):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            f"Koreanbots API is unavailable. Retry after {retry_after:.1f} seconds."
+        )
+
+
 class HTTPException(KoreanbotsException):
     def __init__(self, code: Any, message: Union[Any, Dict[str, Any]]):
         self.status = code
@@ -1,16 +1,30 @@
-from asyncio import sleep
-from asyncio.events import get_event_loop
+from asyncio import FIRST_COMPLETED, Task, TimeoutError, shield, sleep, wait, wait_for
+from asyncio.events import get_event_loop, get_running_loop
 from asyncio.locks import Event
-from datetime import datetime
+from collections import deque
 from functools import wraps
 from logging import getLogger
-from typing import Any, Literal, Optional, cast
+from time import perf_counter
+from typing import Any, Deque, Dict, Hashable, Literal, Optional, cast
 
 import aiohttp
 
+from .codec import DecodeStats, JSONCodec, default_codec
+from .connection import ConnectionStats, ConnectorConfig, create_session
 from .decorator import strict_literal
 from .errors import ERROR_MAPPING, AuthorizeError, HTTPException
-from .typing import CORO, WidgetStyle, WidgetType
+from .metrics import EndpointMetrics, RequestMetrics
+from .ratelimit import RateLimiter, get_route
+from .retry import (
+    DEFAULT_RETRY_POLICIES,
+    NO_RETRY,
+    CircuitBreaker,
+    HedgePolicy,
+    RetryBudget,
+    RetryPolicy,
+)
+from .tracing import RequestTracer
+from .typing import CORO, RawOutputMode, WidgetStyle, WidgetType
 
 BASE = "https://koreanbots.dev/api/"
 VERSION = "v2"
@@ -19,6 +33,15 @@ KOREANBOTS_URL = BASE + VERSION
 
 log = getLogger(__name__)
 
+# 429 responses are retried separately from the retry policy.
+_RATE_LIMIT_RETRIES = 4
+
+_CONNECTION_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    TimeoutError,
+)
+
 
 def required(f: CORO) -> CORO:
     @wraps(f)
@@ -33,6 +56,34 @@ def required(f: CORO) -> CORO:
     return cast(CORO, decorator_function)
 
 
+def _request_key(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Hashable:
+    return (
+        method,
+        endpoint,
+        tuple(
+            sorted(
+                (k, tuple(sorted(v.items())) if isinstance(v, dict) else v)
+                for k, v in kwargs.items()
+            )
+        ),
+    )
+
+
+def _observe(metrics: EndpointMetrics, status: int, start: float, size: int) -> None:
+    metrics.requests += 1
+    metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+    metrics.latency.observe(perf_counter() - start)
+    metrics.bytes += size
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
 class KoreanbotsRequester:
     """
     Koreanbots의 API를 요청하는 클래스입니다.
@@ -44,39 +95,138 @@ class KoreanbotsRequester:
 
     :param session:
         aiohttp.ClientSession의 클래스입니다. 전달되지 않으면 생성합니다. 기본값은 None 입니다.
+        토큰은 요청마다 헤더에 추가되므로 토큰이 다른 여러 클라이언트가 하나의 세션을 공유할 수 있습니다.
+        전달된 세션은 닫지 않습니다.
     :type session:
         Optional[aiohttp.ClientSession], optional
+
+    :param ratelimiter:
+        라우트별 레이트리밋을 관리하는 클래스입니다. 전달되지 않으면 생성합니다. 기본값은 None 입니다.
+    :type ratelimiter:
+        Optional[RateLimiter], optional
+
+    :param json_codec:
+        요청 본문과 응답에 사용할 JSON 백엔드입니다. 전달되지 않으면 orjson, ujson, json 순서로 설치된 백엔드를 사용합니다. 기본값은 None 입니다.
+    :type json_codec:
+        Optional[JSONCodec], optional
+
+    :param connector_config:
+        세션을 생성할 때 사용할 커넥션 풀 설정입니다. session이 전달된 경우 무시됩니다. 기본값은 None 입니다.
+    :type connector_config:
+        Optional[ConnectorConfig], optional
+
+    :param retry_policies:
+        메소드별 재시도 정책입니다. 정책이 없는 메소드는 재시도하지 않습니다.
+        전달되지 않으면 GET은 연결 오류와 5xx 응답을, POST는 연결 오류와 502, 503, 504 응답을 재시도합니다. 기본값은 None 입니다.
+    :type retry_policies:
+        Optional[Dict[str, RetryPolicy]], optional
+
+    :param retry_budget:
+        재시도 횟수를 전체 요청의 일정 비율로 제한하는 클래스입니다. 전달되지 않으면 생성합니다. 기본값은 None 입니다.
+    :type retry_budget:
+        Optional[RetryBudget], optional
+
+    :param circuit_breaker:
+        API가 연속으로 실패하면 요청을 바로 실패시키는 클래스입니다. 전달되지 않으면 생성합니다. 기본값은 None 입니다.
+    :type circuit_breaker:
+        Optional[CircuitBreaker], optional
+
+    :param hedge_policy:
+        GET 요청이 늦어질 때 같은 요청을 한 번 더 보내는 설정입니다. 전달되지 않으면 사용하지 않습니다. 기본값은 None 입니다.
+    :type hedge_policy:
+        Optional[HedgePolicy], optional
+
+    :param metrics:
+        라우트별 요청 수, 상태 코드, 응답 시간, 재시도, 레이트리밋 대기 시간을 기록할 클래스입니다. 전달되지 않으면 기록하지 않습니다. 기본값은 None 입니다.
+    :type metrics:
+        Optional[RequestMetrics], optional
+
+    :param tracer:
+        요청마다 DNS 조회, 연결, 응답 대기, 본문 읽기 시간을 기록해 콜백에 전달하는 클래스입니다.
+        단계별 시간은 요청 클래스가 세션을 생성한 경우에만 기록됩니다. 전달되지 않으면 기록하지 않습니다. 기본값은 None 입니다.
+    :type tracer:
+        Optional[RequestTracer], optional
+
+    :param base_url:
+        요청을 보낼 API의 주소입니다. :class:`~koreanbots.mock.MockKoreanbotsServer` 같은 대체 서버를 사용할 때 지정합니다.
+        전달되지 않으면 ``https://koreanbots.dev/api/v2`` 를 사용합니다. 기본값은 None 입니다.
+    :type base_url:
+        Optional[str], optional
+
+    :param owns_session:
+        :meth:`close` 에서 session을 닫을지 여부입니다. 전달되지 않으면 session이 전달되지 않은 경우에만 닫습니다.
+        요청 클래스가 직접 생성한 세션은 항상 닫습니다. 기본값은 None 입니다.
+    :type owns_session:
+        Optional[bool], optional
     """
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        ratelimiter: Optional[RateLimiter] = None,
+        json_codec: Optional[JSONCodec] = None,
+        connector_config: Optional[ConnectorConfig] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[RequestMetrics] = None,
+        tracer: Optional[RequestTracer] = None,
+        base_url: Optional[str] = None,
+        owns_session: Optional[bool] = None,
     ) -> None:
         self.session = session
+        self.base_url = base_url
+        self.metrics = metrics
+        self.tracer = tracer
+        self.connector_config = connector_config or ConnectorConfig()
+        self.connection_stats = ConnectionStats()
+        self.retry_policies = (
+            DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+        )
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._owns_session = session is None if owns_session is None else owns_session
         self.api_key = api_key
+        self.ratelimiter = ratelimiter or RateLimiter()
+        self.json_codec = json_codec or default_codec
         self._global_limit = Event()
         self._global_limit.set()
+        self.hedge_policy = hedge_policy
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._inflight: Dict[Hashable, _Flight] = {}
 
     # How to close the session if discord.Client is not specified.
     def __del__(self) -> None:
-        if self.session:
+        if self.session and self._owns_session:
             if not self.session.closed:
                 loop = get_event_loop()
                 if loop.is_running():
                     loop.create_task(self.session.close())
                 else:
                     loop.run_until_complete(self.session.close())
+
+    async def close(self) -> None:
+        """
+        클라이언트가 생성한 세션을 닫습니다. 전달된 세션은 닫지 않습니다.
+        """
+        if self.session and self._owns_session and not self.session.closed:
+            await self.session.close()
+
     @required
     async def request(
         self,
         method: Literal["GET", "POST"],
         endpoint: str,
+        raw: bool = False,
+        deadline: Optional[float] = None,
         **kwargs: Any,
     ) -> Any:
         """
         Koreanbots의 url을 기반으로 요청합니다.
-        레이트리밋을 핸들합니다.
+        라우트별로 레이트리밋을 핸들합니다.
+        동시에 들어온 같은 GET 요청은 하나의 요청으로 합쳐 결과를 공유합니다.
 
         :param method:
             HTTP 메소드입니다. GET, POST만 사용할 수 있습니다.
@@ -86,6 +236,14 @@ class KoreanbotsRequester:
             요청을 실행할 API 페이지의 주소입니다.
         :type endpoint:
             str
+        :param raw:
+            응답을 파싱하지 않고 본문을 그대로 반환할지 여부입니다. 기본값은 False입니다.
+        :type raw:
+            bool, optional
+        :param deadline:
+            레이트리밋 대기와 재시도를 포함해 요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
 
         :raises NotFound:
             요청할 수 없는 페이지입니다.
@@ -96,49 +254,293 @@ class KoreanbotsRequester:
 
         :raises HTTPException:
             응답에 오류가 있습니다.
+        :raises CircuitOpenError:
+            API가 연속으로 실패해 요청을 보내지 않았습니다.
+        :raises asyncio.TimeoutError:
+            deadline 안에 응답을 받지 못했습니다.
 
         :return:
-            요청 결과를 반환합니다.
+            요청 결과를 반환합니다. raw가 True이면 응답 본문을 반환합니다.
         :rtype:
-            Dict[str, Any]
+            Union[Dict[str, Any], bytes]
         """
 
+        if method != "GET":
+            return await wait_for(
+                self._request(method, endpoint, raw, **kwargs), deadline
+            )
+
+        try:
+            key = (raw, _request_key(method, endpoint, kwargs))
+            flight = self._inflight.get(key)
+        except TypeError:
+            # Unhashable arguments can't be coalesced.
+            return await wait_for(
+                self._request(method, endpoint, raw, **kwargs), deadline
+            )
+
+        if flight is None:
+            if self.hedge_policy is not None:
+                coro = self._hedged_request(method, endpoint, raw, **kwargs)
+            else:
+                coro = self._request(method, endpoint, raw, **kwargs)
+            flight = self._inflight[key] = _Flight(get_running_loop().create_task(coro))
+
+            def done(t: "Task[Any]") -> None:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                # Retrieve the exception so it isn't reported when every waiter is gone.
+                if not t.cancelled():
+                    t.exception()
+
+            flight.task.add_done_callback(done)
+
+        # Cancelling one waiter must not cancel the request shared with the others.
+        flight.waiters += 1
+        try:
+            return await wait_for(shield(flight.task), deadline)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Nobody is left to use the result. Forget the flight first so a
+                # request made before the task finishes cancelling starts anew.
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.task.cancel()
+
+    async def _hedged_request(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        assert self.hedge_policy is not None
+        samples = self._latencies.get(get_route(method, endpoint))
+        if samples is None:
+            samples = self._latencies[get_route(method, endpoint)] = deque(
+                maxlen=self.hedge_policy.window
+            )
+
+        async def attempt() -> Any:
+            start = perf_counter()
+            result = await self._request(method, endpoint, raw, **kwargs)
+            samples.append(perf_counter() - start)
+            return result
+
+        loop = get_running_loop()
+        tasks = {loop.create_task(attempt())}
+        try:
+            done, _ = await wait(tasks, timeout=self.hedge_policy.delay(samples))
+            # A hedge costs an extra request, so it comes out of the retry budget.
+            if not done and self.retry_budget.withdraw():
+                log.debug("Hedging slow request to %s.", endpoint)
+                tasks.add(loop.create_task(attempt()))
+
+            while True:
+                done, tasks = await wait(tasks, return_when=FIRST_COMPLETED)
+                for task in done:
+                    # Prefer a result, but fall back to the error once both fail.
+                    if task.exception() is None or not tasks:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _request(
+        self,
+        method: Literal["GET", "POST"],
+        endpoint: str,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Any:
         if not self.session:
-            self.session = aiohttp.ClientSession(headers={"Authorization": self.api_key})
-
-        if not self._global_limit.is_set():
-            await self._global_limit.wait()
-
-        for _ in range(5):
-            async with self.session.request(
-                method, KOREANBOTS_URL + endpoint, **kwargs
-            ) as response:
-                remain_limit = response.headers.get("x-ratelimit-remaining")
-                if (
-                    remain_limit is not None
-                    and int(remain_limit) == 0
-                    or response.status == 429
-                ):
-                    reset_limit_timestamp = int(response.headers["x-ratelimit-reset"])
-                    reset_limit = datetime.fromtimestamp(reset_limit_timestamp)
-                    retry_after = reset_limit - datetime.now()
-                    self._global_limit.clear()
-                    await sleep(retry_after.total_seconds())
-                    self._global_limit.set()
-                    continue
-
-                if response.status != 200:
-                    if ERROR_MAPPING.get(response.status):
-                        raise ERROR_MAPPING[response.status](
-                            response.status, await response.json()
+            self.session = create_session(
+                self.connector_config,
+                self.connection_stats,
+                trace_configs=(
+                    [self.tracer.trace_config()] if self.tracer is not None else []
+                ),
+            )
+            self._owns_session = True
+
+        bucket = self.ratelimiter.get_bucket(get_route(method, endpoint))
+
+        # The token goes on each request so the session can be shared.
+        headers = {**kwargs.get("headers", {}), "Authorization": self.api_key}
+        if "json" in kwargs:
+            kwargs["data"] = self.json_codec.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+        kwargs["headers"] = headers
+
+        policy = self.retry_policies.get(method, NO_RETRY)
+        self.retry_budget.deposit()
+        attempt = 0
+        rate_limited = 0
+
+        metrics = self.metrics.get(bucket.route) if self.metrics is not None else None
+        tracer = self.tracer
+
+        while True:
+            if not self._global_limit.is_set():
+                start = perf_counter()
+                await self._global_limit.wait()
+                if metrics is not None:
+                    waited = perf_counter() - start
+                    metrics.rate_limit_wait += waited
+                    metrics.global_limit_wait += waited
+
+            self.circuit_breaker.before_request()
+            waited = await bucket.acquire()
+            if metrics is not None:
+                metrics.rate_limit_wait += waited
+
+            span = None
+            if tracer is not None:
+                span = tracer.start(method, bucket.route, attempt + rate_limited + 1)
+
+            start = perf_counter()
+            try:
+                async with self.session.request(
+                    method,
+                    (self.base_url or KOREANBOTS_URL) + endpoint,
+                    trace_request_ctx=span,
+                    **kwargs,
+                ) as response:
+                    bucket.update(response.headers)
+                    status = response.status
+
+                    if status == 429 and rate_limited < _RATE_LIMIT_RETRIES:
+                        self.circuit_breaker.record_success()
+                        rate_limited += 1
+                        retry_after = bucket.exhaust(response.headers)
+                        if tracer is not None and span is not None:
+                            tracer.finish(span, status)
+                        if metrics is not None:
+                            _observe(metrics, status, start, 0)
+                            metrics.rate_limited += 1
+                        log.warning(
+                            "Rate limited on %s. Retrying in %.2f seconds.",
+                            bucket.route,
+                            retry_after,
                         )
-                    else:
-                        raise HTTPException(response.status, await response.json())
-                return await response.json()
+                        if bucket.limit is None:
+                            # Without rate limit headers the scope of the limit is
+                            # unknown, so hold every route until it resets.
+                            self._global_limit.clear()
+                            await sleep(retry_after)
+                            self._global_limit.set()
+                            if metrics is not None:
+                                metrics.rate_limit_wait += retry_after
+                                metrics.global_limit_wait += retry_after
+                        continue
+
+                    body = await response.read()
+                    if tracer is not None and span is not None:
+                        tracer.finish(span, status)
+            except _CONNECTION_ERRORS as e:
+                if tracer is not None and span is not None:
+                    tracer.finish(span, error=e)
+                self.circuit_breaker.record_failure()
+                if metrics is not None:
+                    metrics.connection_errors += 1
+                if not policy.retry_connection_errors or not self._can_retry(
+                    policy, attempt
+                ):
+                    raise
+                delay = policy.backoff(attempt)
+                log.warning(
+                    "%s failed with %r. Retrying in %.2f seconds.",
+                    bucket.route,
+                    e,
+                    delay,
+                )
+                attempt += 1
+                if metrics is not None:
+                    metrics.retries += 1
+                await sleep(delay)
+                continue
+            except BaseException as e:
+                # Cancelled by a deadline or a hedge, or a non-retryable error.
+                if tracer is not None and span is not None:
+                    tracer.finish(span, error=e)
+                raise
+
+            if metrics is not None:
+                _observe(metrics, status, start, len(body))
+
+            if status >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            if status in policy.retry_statuses and self._can_retry(policy, attempt):
+                delay = policy.backoff(attempt)
+                log.warning(
+                    "%s returned %d. Retrying in %.2f seconds.",
+                    bucket.route,
+                    status,
+                    delay,
+                )
+                attempt += 1
+                if metrics is not None:
+                    metrics.retries += 1
+                await sleep(delay)
+                continue
+
+            if raw and status == 200:
+                return body
+
+            data = self._decode(bucket.route, body)
+
+            if status != 200:
+                if ERROR_MAPPING.get(status):
+                    raise ERROR_MAPPING[status](status, data)
+                else:
+                    raise HTTPException(status, data)
+            return data
 
-        assert None
+    def _can_retry(self, policy: RetryPolicy, attempt: int) -> bool:
+        return attempt + 1 < policy.max_attempts and self.retry_budget.withdraw()
 
-    async def get_bot_info(self, bot_id: int) -> Any:
+    @property
+    def decode_stats(self) -> Dict[str, DecodeStats]:
+        """
+        라우트별 응답 디코딩 시간입니다. ``metrics`` 가 전달된 경우에만 기록되며, 그렇지 않으면 비어 있습니다.
+
+        :rtype:
+            Dict[str, DecodeStats]
+        """
+        if self.metrics is None:
+            return {}
+        return {route: m.decode for route, m in self.metrics.snapshot().items()}
+
+    def _decode(self, route: str, body: bytes) -> Any:
+        if self.metrics is None:
+            return self._loads(body)
+
+        start = perf_counter()
+        data = self._loads(body)
+        stats = self.metrics.get(route).decode
+        stats.count += 1
+        stats.seconds += perf_counter() - start
+        stats.bytes += len(body)
+        return data
+
+    def _loads(self, body: bytes) -> Any:
+        try:
+            return self.json_codec.loads(body)
+        except ValueError:
+            # Error pages from proxies are not always JSON.
+            return body.decode(errors="replace")
+
+    async def get_bot_info(
+        self,
+        bot_id: int,
+        *,
+        output: RawOutputMode = "dict",
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         주어진 bot_id로 bot의 정보를 반환합니다.
 
@@ -147,15 +549,26 @@ class KoreanbotsRequester:
         :type bot_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다. 기본값은 dict입니다.
+        :type output:
+            RawOutputMode, optional
+
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :return:
             요청 결과를 반환합니다.
         :rtype:
             Dict[str, Any]
         """
-        return await self.request("GET", f"/bots/{bot_id}")
-
+        return await self.request("GET", f"/bots/{bot_id}", output == "raw", deadline)
 
-    async def post_update_bot_info(self, bot_id: int, **kwargs: Optional[int]) -> Any:
+    async def post_update_bot_info(
+        self, bot_id: int, *, deadline: Optional[float] = None, **kwargs: Optional[int]
+    ) -> Any:
         """
         주어진 bot_id로 bot의 정보를 갱신합니다.
 
@@ -170,6 +583,11 @@ class KoreanbotsRequester:
         :type kwargs:
             int
 
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         :raises AuthorizeError:
             api_key가 없거나 유효하지 않은 경우。
 
@@ -182,6 +600,7 @@ class KoreanbotsRequester:
         return await self.request(
             "POST",
             f"/bots/{bot_id}/stats",
+            deadline=deadline,
             json={x: kwargs[x] for x in kwargs if x in ["servers", "shards"]},
         )
 
@@ -234,7 +653,13 @@ class KoreanbotsRequester:
             + f"/widget/bots/{widget_type}/{bot_id}.svg?style={style}&scale={scale}&icon={icon}"
         )
 
-    async def get_user_info(self, user_id: int) -> Any:
+    async def get_user_info(
+        self,
+        user_id: int,
+        *,
+        output: RawOutputMode = "dict",
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         주어진 user_id로 user의 정보를 반환합니다.
 
@@ -242,11 +667,28 @@ class KoreanbotsRequester:
             요청할 user의 ID를 지정합니다.
         :type user_id:
             int
-        """
-        return await self.request("GET", f"/users/{user_id}")
 
+        :param output:
+            반환할 형식을 지정합니다. ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다. 기본값은 dict입니다.
+        :type output:
+            RawOutputMode, optional
+
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
 
-    async def get_bot_vote(self, user_id: int, bot_id: int) -> Any:
+        """
+        return await self.request("GET", f"/users/{user_id}", output == "raw", deadline)
+
+    async def get_bot_vote(
+        self,
+        user_id: int,
+        bot_id: int,
+        *,
+        output: RawOutputMode = "dict",
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         주어진 bot_id로 user_id를 통해 해당 user의 투표 여부를 반환합니다.
 
@@ -260,14 +702,32 @@ class KoreanbotsRequester:
         :type bot_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다. 기본값은 dict입니다.
+        :type output:
+            RawOutputMode, optional
+
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         """
         return await self.request(
             "GET",
             f"/bots/{bot_id}/vote",
+            output == "raw",
+            deadline,
             params={"userID": user_id},
         )
 
-    async def get_server_info(self, server_id: int) -> Any:
+    async def get_server_info(
+        self,
+        server_id: int,
+        *,
+        output: RawOutputMode = "dict",
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         주어진 server_id로 server의 정보를 반환합니다.
 
@@ -276,11 +736,29 @@ class KoreanbotsRequester:
         :type server_id:
             int
 
-        """
-        return await self.request("GET", f"/servers/{server_id}")
+        :param output:
+            반환할 형식을 지정합니다. ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다. 기본값은 dict입니다.
+        :type output:
+            RawOutputMode, optional
 
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
 
-    async def get_server_vote(self, user_id: int, server_id: int) -> Any:
+        """
+        return await self.request(
+            "GET", f"/servers/{server_id}", output == "raw", deadline
+        )
+
+    async def get_server_vote(
+        self,
+        user_id: int,
+        server_id: int,
+        *,
+        output: RawOutputMode = "dict",
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         주어진 server_id로 user_id를 통해 해당 user의 투표 여부를 반환합니다.
 
@@ -294,9 +772,21 @@ class KoreanbotsRequester:
         :type server_id:
             int
 
+        :param output:
+            반환할 형식을 지정합니다. ``dict`` 는 파싱한 딕셔너리, ``raw`` 는 파싱하지 않은 응답 본문을 반환합니다. 기본값은 dict입니다.
+        :type output:
+            RawOutputMode, optional
+
+        :param deadline:
+            요청에 사용할 최대 시간(초)입니다. 기본값은 None 입니다.
+        :type deadline:
+            Optional[float], optional
+
         """
         return await self.request(
             "GET",
             f"/servers/{server_id}/vote",
+            output == "raw",
+            deadline,
             params={"userID": user_id},
         )
@@ -0,0 +1,144 @@
+from abc import abstractmethod
+from asyncio import CancelledError, Event, Task, TimeoutError, current_task, wait_for
+from asyncio.events import get_event_loop
+from logging import getLogger
+from typing import Dict, Optional
+
+from koreanbots.client import Koreanbots
+from koreanbots.cluster import ClusterAggregator
+from koreanbots.integrations.poster import GuildCountPolicy, GuildCountPoster
+
+log = getLogger(__name__)
+
+# How long to wait between checks while the bot's ID is not known yet.
+_IDLE_RETRY = 5.0
+
+
+class IntegrationKoreanbots(Koreanbots):
+    """
+    디스코드 라이브러리와 함께 길드 개수를 전송하는 클라이언트의 기반 클래스입니다.
+    라이브러리마다 준비 대기, 봇 ID, 길드 개수, 종료 여부를 구현합니다.
+
+    길드 개수 전송 작업은 기다리는 동안 이벤트 루프를 점유하지 않으며,
+    :meth:`close` 가 호출되면 즉시 종료됩니다.
+
+    ``cluster`` 가 지정되면 각 프로세스는 길드 개수를 리더에게 보고하고,
+    리더만 모든 프로세스의 합계를 전송합니다.
+    """
+
+    guildcount_sender: Optional["Task[None]"] = None
+    include_shard_count: bool = False
+    post_policy: Optional[GuildCountPolicy] = None
+    cluster: Optional[ClusterAggregator] = None
+    _stopped_event: Optional[Event] = None
+
+    @abstractmethod
+    async def wait_until_client_ready(self) -> None:
+        """클라이언트가 준비될 때까지 기다립니다."""
+
+    @abstractmethod
+    def get_client_bot_id(self) -> Optional[int]:
+        """클라이언트의 봇 ID를 반환합니다. 아직 알 수 없으면 None을 반환합니다."""
+
+    @abstractmethod
+    def get_client_guild_counts(self) -> Dict[str, int]:
+        """``servers``, ``shards`` 를 키로 하는 현재 값을 반환합니다."""
+
+    @abstractmethod
+    def is_client_closed(self) -> bool:
+        """클라이언트가 종료되었는지 여부를 반환합니다."""
+
+    @property
+    def _stopped(self) -> Event:
+        # Created lazily so it binds to the loop the task runs on.
+        if self._stopped_event is None:
+            self._stopped_event = Event()
+        return self._stopped_event
+
+    @property
+    def is_running(self) -> bool:
+        """길드 개수 전송 작업이 실행 중인지 여부"""
+        return self.guildcount_sender is not None and not self.guildcount_sender.done()
+
+    def run_post_guild_count_task(self) -> None:
+        """
+        tasks_send_guildcount를 호출하는 함수입니다.
+        사용자가 on_ready 이벤트 핸들러를 정의할 때, 이 함수를 호출해 길드 개수를 지속적으로 갱신할 수 있습니다.
+        """
+        if not self.is_running:
+            self.guildcount_sender = get_event_loop().create_task(
+                self.tasks_send_guildcount()
+            )
+
+    async def close(self) -> None:
+        """
+        길드 개수 전송 작업을 멈추고, 클라이언트가 생성한 세션을 닫습니다.
+        """
+        self._stopped.set()
+        task = self.guildcount_sender
+        if task is not None and not task.done() and task is not current_task():
+            task.cancel()
+            try:
+                await task
+            except CancelledError:
+                pass
+        if self.cluster is not None:
+            await self.cluster.close()
+        await super().close()
+
+    async def _wait_stopped(self, timeout: float) -> bool:
+        # Sleep, but wake up as soon as close() is called.
+        try:
+            await wait_for(self._stopped.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def tasks_send_guildcount(self) -> None:
+        """
+        길드 개수를 서버에 전송하는 태스크 입니다.
+        길드 개수가 변하지 않았으면 전송하지 않고, 크게 변하면 더 빨리 전송합니다.
+        자세한 동작은 :class:`~koreanbots.integrations.poster.GuildCountPoster` 를 참고하세요.
+
+        :raises RuntimeError:
+            클라이언트를 찾을 수 없습니다.
+        """
+        await self.wait_until_client_ready()
+
+        poster = GuildCountPoster(self.post_policy)
+        while not self.is_client_closed() and not self._stopped.is_set():
+            bot_id = self.get_client_bot_id()
+            if bot_id is None:
+                if await self._wait_stopped(_IDLE_RETRY):
+                    break
+                continue
+
+            delay = poster.policy.check_interval
+            counts = self.get_client_guild_counts()
+            if self.cluster is not None:
+                await self.cluster.report(counts)
+                if not self.cluster.ready:
+                    if await self._wait_stopped(delay):
+                        break
+                    continue
+                counts = self.cluster.totals()
+            if not self.include_shard_count:
+                counts.pop("shards", None)
+
+            if poster.should_post(counts):
+                log.info("Initiating guild count update...")
+                try:
+                    await self.post_guild_count(bot_id, **counts)
+                except Exception:
+                    retry_after = poster.failed()
+                    delay = min(delay, retry_after)
+                    log.exception(
+                        "Guild count update failed due to an error. Retrying in %.0f seconds.",
+                        retry_after,
+                    )
+                else:
+                    poster.posted(counts)
+                    log.info("Guild count updated successfully.")
+
+            if await self._wait_stopped(delay):
+                break
@@ -1,7 +1,5 @@
 import logging
-from asyncio.events import get_event_loop
-from asyncio.tasks import sleep
-from typing import Optional
+from typing import Dict, Optional
 
 from aiohttp import ClientSession
 
@@ -10,12 +8,14 @@ try:
 except ImportError:
     pass
 
-from koreanbots.client import Koreanbots
+from koreanbots.cluster import ClusterAggregator
+from koreanbots.integrations.base import IntegrationKoreanbots
+from koreanbots.integrations.poster import GuildCountPolicy
 
 log = logging.getLogger(__name__)
 
 
-class DicoKoreanbots(Koreanbots):
+class DicoKoreanbots(IntegrationKoreanbots):
     """
     KoreanbotsRequester를 감싸는 클라이언트 클래스입니다.
     dico 전용입니다.
@@ -44,6 +44,16 @@ class DicoKoreanbots(Koreanbots):
         샤드 개수를 포함할지 지정합니다. 만약 아니라면 지정하지 않습니다.
     :type include_shard_count:
         bool
+
+    :param post_policy:
+        길드 개수를 언제 전송할지 정하는 설정입니다. 지정하지 않으면 기본 설정을 사용합니다.
+    :type post_policy:
+        Optional[GuildCountPolicy]
+
+    :param cluster:
+        여러 프로세스의 길드 개수를 모아 리더만 전송하게 합니다. 지정하지 않으면 이 프로세스의 길드 개수만 전송합니다.
+    :type cluster:
+        Optional[ClusterAggregator]
     """
 
     def __init__(
@@ -53,6 +63,8 @@ class DicoKoreanbots(Koreanbots):
         session: Optional[ClientSession] = None,
         run_task: bool = False,
         include_shard_count: bool = False,
+        post_policy: Optional[GuildCountPolicy] = None,
+        cluster: Optional[ClusterAggregator] = None,
     ):
         self.client = client
 
@@ -60,46 +72,35 @@ class DicoKoreanbots(Koreanbots):
             original_close = getattr(client, "close")
 
             async def close() -> None:
-                if self.session is not None and not self.session.closed:
-                    await self.session.close()
+                await self.close()
                 await original_close()
 
             setattr(client, "close", close)
 
         self.include_shard_count = include_shard_count
+        self.post_policy = post_policy
+        self.cluster = cluster
         super().__init__(api_key, session)
 
         if run_task:
-            get_event_loop().create_task(self.tasks_send_guildcount())
-
-    async def tasks_send_guildcount(self) -> None:
-        """
-        길드 개수를 서버에 전송하는 태스크 입니다.
-
-        :raises RuntimeError:
-            클라이언트를 찾을 수 없습니다.
-        """
+            self.run_post_guild_count_task()
 
+    async def wait_until_client_ready(self) -> None:
         if not self.client:
             raise RuntimeError("Client Not Found")
 
         await self.client.wait_ready()
 
-        while not self.client.websocket_closed:
-            if not self.client.application_id:
-                continue
-
-            kwargs = {"servers": self.client.guild_count}
-            if self.include_shard_count:
-                if self.client.shard_count:
-                    kwargs.update({"shards": self.client.shard_count})
-            log.info("Initiating guild count update...")
-            try:
-                await self.post_guild_count(int(self.client.application_id), **kwargs)
-            except:
-                log.exception("Guild count update failed due to an error.")
-            else:
-                log.info(
-                    "Guild count updated successfully. Waiting 30 minutes for the next update."
-                )
-            await sleep(1800)
+    def get_client_bot_id(self) -> Optional[int]:
+        if not self.client.application_id:
+            return None
+        return int(self.client.application_id)
+
+    def get_client_guild_counts(self) -> Dict[str, int]:
+        counts = {"servers": self.client.guild_count}
+        if self.client.shard_count:
+            counts["shards"] = self.client.shard_count
+        return counts
+
+    def is_client_closed(self) -> bool:
+        return bool(self.client.websocket_closed)
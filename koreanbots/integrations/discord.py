@@ -1,10 +1,10 @@
-from asyncio.tasks import Task, sleep
 from logging import getLogger
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
+    Dict,
     Optional,
     TypeVar,
     Union,
@@ -13,7 +13,9 @@ from typing import (
 
 from aiohttp import ClientSession
 
-from koreanbots.client import Koreanbots
+from koreanbots.cluster import ClusterAggregator
+from koreanbots.integrations.base import IntegrationKoreanbots
+from koreanbots.integrations.poster import GuildCountPolicy
 
 if TYPE_CHECKING:
     import nextcord
@@ -27,7 +29,7 @@ CoroT = TypeVar("CoroT", bound=Callable[..., Coro[Any]])
 log = getLogger(__name__)
 
 
-class DiscordpyKoreanbots(Koreanbots):
+class DiscordpyKoreanbots(IntegrationKoreanbots):
     """
     Koreanbots를 감싸는 클라이언트 클래스입니다.
     discord.py 및 해당 라이브러리의 포크 전용입니다.
@@ -56,6 +58,16 @@ class DiscordpyKoreanbots(Koreanbots):
         샤드 개수를 포함할지 지정합니다. 만약 아니라면 지정하지 않습니다.
     :type include_shard_count:
         bool
+
+    :param post_policy:
+        길드 개수를 언제 전송할지 정하는 설정입니다. 지정하지 않으면 기본 설정을 사용합니다.
+    :type post_policy:
+        Optional[GuildCountPolicy]
+
+    :param cluster:
+        여러 프로세스의 길드 개수를 모아 리더만 전송하게 합니다. 지정하지 않으면 이 프로세스의 길드 개수만 전송합니다.
+    :type cluster:
+        Optional[ClusterAggregator]
     """
 
     def __init__(
@@ -65,6 +77,8 @@ class DiscordpyKoreanbots(Koreanbots):
         session: Optional[ClientSession] = None,
         run_task: bool = False,
         include_shard_count: bool = False,
+        post_policy: Optional[GuildCountPolicy] = None,
+        cluster: Optional[ClusterAggregator] = None,
     ):
         self.client = client
 
@@ -72,19 +86,19 @@ class DiscordpyKoreanbots(Koreanbots):
         original_close = getattr(client, "close")
 
         async def close() -> None:
-            if self.session is not None and not self.session.closed:
-                await self.session.close()
+            await self.close()
             await original_close()
 
         setattr(client, "close", close)
 
         self.include_shard_count = include_shard_count
+        self.post_policy = post_policy
+        self.cluster = cluster
         super().__init__(api_key, session)
 
         if run_task:
             client_ready = getattr(client, "on_ready", None)
             client_event = getattr(client, "event")
-            self.guildcount_sender: Optional[Task[None]] = None
 
             # Set default on_ready handler to start send_guildcount task.
             if client_ready is not None:
@@ -112,48 +126,22 @@ class DiscordpyKoreanbots(Koreanbots):
             client.event(on_ready)
             setattr(client, "event", event)
 
-    @property
-    def is_running(self) -> bool:
-        return self.guildcount_sender is not None and not self.guildcount_sender.done()
-
-    def run_post_guild_count_task(self) -> None:
-        """
-        tasks_send_guildcount를 호출하는 함수입니다.
-        사용자가 on_ready 이벤트 핸들러를 정의할 때, 이 함수를 호출해 길드 개수를 지속적으로 갱신할 수 있습니다.
-        """
-        if not self.is_running:
-            self.guildcount_sender = self.client.loop.create_task(
-                self.tasks_send_guildcount()
-            )
-
-    async def tasks_send_guildcount(self) -> None:
-        """
-        길드 개수를 서버에 전송하는 태스크 입니다.
-
-        :raises RuntimeError:
-            클라이언트를 찾을 수 없습니다.
-        """
-
+    async def wait_until_client_ready(self) -> None:
         if not self.client:
             raise RuntimeError("Client Not Found")
 
         await self.client.wait_until_ready()
 
-        while not self.client.is_closed():
-            if not self.client.user:
-                continue
-
-            kwargs = {"servers": len(self.client.guilds)}
-            if self.include_shard_count:
-                if self.client.shard_count:
-                    kwargs.update({"shards": self.client.shard_count})
-            log.info("Initiating guild count update...")
-            try:
-                await self.post_guild_count(int(self.client.user.id), **kwargs)
-            except:
-                log.exception("Guild count update failed due to an error.")
-            else:
-                log.info(
-                    "Guild count updated successfully. Waiting 30 minutes for the next update."
-                )
-            await sleep(1800)
+    def get_client_bot_id(self) -> Optional[int]:
+        if not self.client.user:
+            return None
+        return int(self.client.user.id)
+
+    def get_client_guild_counts(self) -> Dict[str, int]:
+        counts = {"servers": len(self.client.guilds)}
+        if self.client.shard_count:
+            counts["shards"] = self.client.shard_count
+        return counts
+
+    def is_client_closed(self) -> bool:
+        return bool(self.client.is_closed())
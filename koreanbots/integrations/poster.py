@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from random import uniform
+from time import monotonic
+from typing import Dict, Optional
+
+
+@dataclass
+class GuildCountPolicy:
+    """
+    길드 개수를 언제 전송할지 정하는 설정입니다.
+    """
+
+    check_interval: float = 60
+    """길드 개수를 확인하는 주기(초)입니다."""
+    min_interval: float = 300
+    """전송 사이의 최소 간격(초)입니다."""
+    max_interval: float = 1800
+    """전송 사이의 최대 간격(초)입니다. 변경된 값은 늦어도 이 시간 안에 전송됩니다."""
+    threshold: float = 0.05
+    """이 비율 이상 변하면 큰 변화로 보고 ``min_interval`` 이 지나는 대로 전송합니다."""
+    debounce: float = 30
+    """큰 변화가 있을 때 이어지는 변화를 모아 전송하기 위해, 전송하지 않은 첫 변화부터 기다릴 시간(초)입니다."""
+    retry_base: float = 15
+    """전송에 실패했을 때 처음 재시도할 때까지의 시간(초)입니다. 실패할 때마다 두 배로 늘어납니다."""
+    retry_max: float = 900
+    """재시도할 때까지의 최대 시간(초)입니다."""
+
+
+class GuildCountPoster:
+    """
+    길드 개수의 변화에 따라 전송 여부를 결정하는 클래스입니다.
+
+    - 마지막으로 전송한 값과 같으면 전송하지 않습니다.
+    - 값이 변하면 변화의 크기와 관계없이 늦어도 현재 간격이 지난 뒤 전송합니다.
+    - 값이 크게 변하면 전송하지 않은 첫 변화부터 ``debounce`` 동안 기다린 뒤, ``min_interval`` 이 지났다면 바로 전송합니다.
+    - 큰 변화가 이어지면 간격을 절반으로 줄이고, 작은 변화만 있으면 두 배로 늘립니다.
+    - 전송에 실패하면 지터를 더한 지수 백오프 후 다시 전송합니다.
+
+    :param policy:
+        전송 설정입니다. 기본값은 None 입니다.
+    :type policy:
+        Optional[GuildCountPolicy], optional
+    """
+
+    def __init__(self, policy: Optional[GuildCountPolicy] = None) -> None:
+        self.policy = policy or GuildCountPolicy()
+        self.interval = self.policy.max_interval
+        self.last_posted: Optional[Dict[str, int]] = None
+        self.last_posted_at: Optional[float] = None
+        self.failures = 0
+        # When the count first differed from last_posted.
+        self._pending_since: Optional[float] = None
+        self._retry_at = 0.0
+
+    def _significant(self, counts: Dict[str, int]) -> bool:
+        if self.last_posted is None:
+            return True
+        for key, value in counts.items():
+            previous = self.last_posted.get(key)
+            if previous is None:
+                return True
+            if abs(value - previous) >= max(previous, 1) * self.policy.threshold:
+                return True
+        return False
+
+    def should_post(self, counts: Dict[str, int], now: Optional[float] = None) -> bool:
+        """
+        주어진 길드 개수를 지금 전송해야 하는지 반환합니다.
+
+        :param counts:
+            ``servers``, ``shards`` 를 키로 하는 현재 값입니다.
+        :type counts:
+            Dict[str, int]
+
+        :param now:
+            현재 시각입니다. 지정하지 않으면 :func:`time.monotonic` 을 사용합니다. 기본값은 None 입니다.
+        :type now:
+            Optional[float], optional
+
+        :rtype:
+            bool
+        """
+        if now is None:
+            now = monotonic()
+
+        if counts == self.last_posted:
+            self._pending_since = None
+            return False
+        if self._pending_since is None:
+            self._pending_since = now
+
+        if now < self._retry_at:
+            return False
+
+        if self.last_posted_at is None:
+            return True
+
+        elapsed = now - self.last_posted_at
+        if elapsed >= min(self.interval, self.policy.max_interval):
+            return True
+        # A count that keeps moving can't hold a post back past the debounce,
+        # since it is measured from the first change that wasn't posted.
+        return (
+            self._significant(counts)
+            and elapsed >= self.policy.min_interval
+            and now - self._pending_since >= self.policy.debounce
+        )
+
+    def posted(self, counts: Dict[str, int], now: Optional[float] = None) -> None:
+        """
+        전송에 성공했음을 기록하고 다음 간격을 조정합니다.
+
+        :param counts:
+            전송한 값입니다.
+        :type counts:
+            Dict[str, int]
+
+        :param now:
+            현재 시각입니다. 기본값은 None 입니다.
+        :type now:
+            Optional[float], optional
+        """
+        if now is None:
+            now = monotonic()
+
+        if self.last_posted is not None and self._significant(counts):
+            self.interval = max(self.interval / 2, self.policy.min_interval)
+        else:
+            self.interval = min(self.interval * 2, self.policy.max_interval)
+
+        self.last_posted = dict(counts)
+        self.last_posted_at = now
+        self.failures = 0
+        self._retry_at = 0.0
+        self._pending_since = None
+
+    def failed(self, now: Optional[float] = None) -> float:
+        """
+        전송에 실패했음을 기록합니다.
+
+        :param now:
+            현재 시각입니다. 기본값은 None 입니다.
+        :type now:
+            Optional[float], optional
+
+        :return:
+            다시 전송할 때까지 기다릴 시간(초)을 반환합니다.
+        :rtype:
+            float
+        """
+        if now is None:
+            now = monotonic()
+
+        backoff = min(self.policy.retry_base * 2**self.failures, self.policy.retry_max)
+        # Jitter keeps many bots from retrying in lockstep.
+        delay = uniform(backoff / 2, backoff)
+        self.failures += 1
+        self._retry_at = now + delay
+        return delay
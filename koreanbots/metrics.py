@@ -0,0 +1,264 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Sequence, Tuple
+
+from .codec import DecodeStats
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""응답 시간 히스토그램의 기본 구간(초)입니다."""
+
+
+class Histogram:
+    """
+    값의 분포를 구간별 개수로 기록하는 히스토그램입니다.
+
+    :param buckets:
+        구간의 상한값입니다. 오름차순이어야 합니다. 기본값은 :data:`DEFAULT_BUCKETS` 입니다.
+    :type buckets:
+        Sequence[float], optional
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        # The last slot counts values above every bucket (+Inf).
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Histogram count={self.count} sum={self.sum:.3f}>"
+
+    def observe(self, value: float) -> None:
+        """
+        값을 기록합니다.
+
+        :param value:
+            기록할 값입니다.
+        :type value:
+            float
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        구간의 상한값과 그 이하인 값의 개수를 반환합니다. 마지막 구간의 상한값은 ``inf`` 입니다.
+
+        :rtype:
+            List[Tuple[float, int]]
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def copy(self) -> "Histogram":
+        """
+        히스토그램을 복사합니다.
+
+        :rtype:
+            Histogram
+        """
+        histogram = Histogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        return histogram
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    라우트별 요청 지표를 나타내는 클래스입니다.
+    """
+
+    requests: int = 0
+    """응답을 받은 요청 수. 재시도한 요청도 각각 셉니다."""
+    statuses: Dict[int, int] = field(default_factory=dict)
+    """응답 상태 코드별 요청 수"""
+    latency: Histogram = field(default_factory=Histogram)
+    """요청을 보내고 응답 본문을 모두 받을 때까지 걸린 시간(초)의 분포"""
+    bytes: int = 0
+    """받은 응답 본문의 총 크기"""
+    decode: DecodeStats = field(default_factory=DecodeStats)
+    """응답을 디코딩한 횟수, 시간, 크기"""
+    retries: int = 0
+    """재시도한 횟수"""
+    connection_errors: int = 0
+    """연결 오류와 타임아웃 횟수"""
+    rate_limited: int = 0
+    """``429`` 응답을 받은 횟수"""
+    rate_limit_wait: float = 0.0
+    """레이트리밋 때문에 기다린 총 시간(초). 같은 라우트의 다른 요청 뒤에서 기다린 시간도 포함합니다."""
+    global_limit_wait: float = 0.0
+    """rate_limit_wait 중 레이트리밋 헤더 없는 ``429`` 때문에 모든 라우트가 멈춘 동안 기다린 시간(초)"""
+
+    @property
+    def decode_seconds(self) -> float:
+        """응답을 디코딩하는 데 걸린 총 시간(초)"""
+        return self.decode.seconds
+
+    def copy(self) -> "EndpointMetrics":
+        """
+        지표를 복사합니다.
+
+        :rtype:
+            EndpointMetrics
+        """
+        return EndpointMetrics(
+            self.requests,
+            dict(self.statuses),
+            self.latency.copy(),
+            self.bytes,
+            replace(self.decode),
+            self.retries,
+            self.connection_errors,
+            self.rate_limited,
+            self.rate_limit_wait,
+            self.global_limit_wait,
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class RequestMetrics:
+    """
+    :class:`KoreanbotsRequester` 의 요청 지표를 라우트별로 모으는 클래스입니다.
+    요청 클래스에 ``metrics`` 인자로 전달하면 기록되며, 전달하지 않으면 기록하지 않습니다.
+
+    .. code-block:: python
+
+        metrics = RequestMetrics()
+        kb = Koreanbots(api_key, metrics=metrics)
+        ...
+        print(metrics.to_prometheus())
+
+    :param buckets:
+        응답 시간 히스토그램의 구간(초)입니다. 기본값은 :data:`DEFAULT_BUCKETS` 입니다.
+    :type buckets:
+        Sequence[float], optional
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def get(self, route: str) -> EndpointMetrics:
+        """
+        라우트의 지표를 반환합니다. 없으면 생성합니다.
+
+        :param route:
+            :func:`~koreanbots.ratelimit.get_route` 로 만든 라우트입니다.
+        :type route:
+            str
+
+        :rtype:
+            EndpointMetrics
+        """
+        metrics = self._endpoints.get(route)
+        if metrics is None:
+            metrics = self._endpoints[route] = EndpointMetrics(
+                latency=Histogram(self.buckets)
+            )
+        return metrics
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """
+        모든 라우트의 지표를 복사해 반환합니다. 반환된 값은 이후 요청에 의해 바뀌지 않습니다.
+
+        :rtype:
+            Dict[str, EndpointMetrics]
+        """
+        return {route: metrics.copy() for route, metrics in self._endpoints.items()}
+
+    def reset(self) -> None:
+        """모든 지표를 초기화합니다."""
+        self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "koreanbots") -> str:
+        """
+        지표를 Prometheus 텍스트 형식으로 반환합니다.
+
+        :param prefix:
+            지표 이름 앞에 붙일 문자열입니다. 기본값은 ``koreanbots`` 입니다.
+        :type prefix:
+            str, optional
+
+        :rtype:
+            str
+        """
+        endpoints = sorted(self._endpoints.items())
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help: str) -> str:
+            name = f"{prefix}_{name}"
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            return name
+
+        name = family("requests_total", "counter", "Responses received by status.")
+        for route, metrics in endpoints:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'{name}{{route="{_escape(route)}",status="{status}"}} {count}'
+                )
+
+        name = family(
+            "request_duration_seconds", "histogram", "Time until the body was read."
+        )
+        for route, metrics in endpoints:
+            label = f'route="{_escape(route)}"'
+            for bound, count in metrics.latency.cumulative():
+                lines.append(
+                    f'{name}_bucket{{{label},le="{_format_bound(bound)}"}} {count}'
+                )
+            lines.append(f"{name}_sum{{{label}}} {metrics.latency.sum!r}")
+            lines.append(f"{name}_count{{{label}}} {metrics.latency.count}")
+
+        counters = (
+            ("response_bytes_total", "bytes", "Response body bytes received."),
+            ("decode_seconds_total", "decode_seconds", "Time spent decoding JSON."),
+            ("retries_total", "retries", "Requests retried."),
+            ("connection_errors_total", "connection_errors", "Connection errors."),
+            ("rate_limited_total", "rate_limited", "429 responses received."),
+            (
+                "rate_limit_wait_seconds_total",
+                "rate_limit_wait",
+                "Time spent waiting for rate limits.",
+            ),
+            (
+                "global_limit_wait_seconds_total",
+                "global_limit_wait",
+                "Time spent held by a rate limit on every route.",
+            ),
+        )
+        for suffix, attribute, help in counters:
+            name = family(suffix, "counter", help)
+            for route, metrics in endpoints:
+                value = getattr(metrics, attribute)
+                lines.append(f'{name}{{route="{_escape(route)}"}} {value!r}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,429 @@
+"""
+네트워크 없이 클라이언트를 테스트하거나 벤치마크할 수 있는 Koreanbots API 대체 서버입니다.
+
+.. code-block:: python
+
+    async with MockKoreanbotsServer(latency=0.05) as server:
+        kb = Koreanbots("token", base_url=server.url)
+        await kb.get_bot_info(653534001742741552)
+"""
+
+from asyncio import sleep
+from math import ceil
+from random import Random
+from time import time
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from aiohttp import web
+
+from .codec import JSONCodec, default_codec
+from .http import VERSION
+
+CATEGORIES = ["관리", "뮤직", "게임", "유틸리티", "빗금 명령어", "웹 대시보드"]
+LIBS = ["discord.py", "discord.js", "Pycord", "disnake", "JDA"]
+STATUSES = ["online", "idle", "dnd", "offline"]
+
+
+def _categories(index: int) -> List[str]:
+    # The API returns every category of a bot or server as a list.
+    return [CATEGORIES[(index + i) % len(CATEGORIES)] for i in range(2)]
+
+
+def make_emoji(index: int) -> Dict[str, Any]:
+    return {
+        "id": str(900000000000000000 + index),
+        "name": f"emoji_{index}",
+        "url": f"https://cdn.discordapp.com/emojis/{900000000000000000 + index}.png",
+    }
+
+
+def make_bot(index: int, owners: List[Any]) -> Dict[str, Any]:
+    bot_id = str(653534001742741552 + index)
+    return {
+        "id": bot_id,
+        "name": f"Bot {index}",
+        "tag": f"{index % 10000:04d}",
+        "avatar": "a" * 32,
+        "flags": index % 4,
+        "lib": LIBS[index % len(LIBS)],
+        "prefix": "!",
+        "votes": index * 7,
+        "servers": index * 31,
+        "shards": 1 + index % 3,
+        "intro": f"소개 문구 {index}",
+        "desc": "설명 문구입니다. " * 20,
+        "web": f"https://example.com/{index}",
+        "git": f"https://github.com/example/{index}",
+        "url": None,
+        "discord": "abcdef",
+        "category": _categories(index),
+        "vanity": None,
+        "bg": None,
+        "banner": None,
+        "status": STATUSES[index % len(STATUSES)],
+        "state": "ok",
+        "owners": owners,
+    }
+
+
+def make_server(index: int, owner: Any, emojis: int = 10) -> Dict[str, Any]:
+    return {
+        "id": str(653083797763522580 + index),
+        "name": f"Server {index}",
+        "flags": 0,
+        "intro": f"소개 문구 {index}",
+        "desc": "설명 문구입니다. " * 20,
+        "votes": index * 3,
+        "category": _categories(index),
+        "invite": "abcdef",
+        "state": "ok",
+        "vanity": None,
+        "bg": None,
+        "banner": None,
+        "icon": "b" * 32,
+        "members": index * 100,
+        "emojis": [make_emoji(i) for i in range(emojis)],
+        "boostTier": index % 4,
+        "owner": owner,
+    }
+
+
+def make_user(
+    bots: int = 5, servers: int = 5, emojis: int = 10, index: int = 0
+) -> Dict[str, Any]:
+    user_id = str(285185716240252929 + index)
+    return {
+        "id": user_id,
+        "username": f"user{index}",
+        "globalName": f"User {index}",
+        "tag": "0",
+        "github": None,
+        "flags": 0,
+        "bots": [make_bot(i, [user_id]) for i in range(bots)],
+        "servers": [make_server(i, user_id, emojis) for i in range(servers)],
+    }
+
+
+def make_owner(index: int = 0, bots: int = 5) -> Dict[str, Any]:
+    return {
+        "id": str(285185716240252929 + index),
+        "username": f"user{index}",
+        "globalName": f"User {index}",
+        "tag": "0",
+        "github": None,
+        "flags": 0,
+        "bots": [str(653534001742741552 + i) for i in range(bots)],
+        "servers": [str(653083797763522580 + i) for i in range(bots)],
+    }
+
+
+def make_bot_response(index: int = 0, owners: int = 3) -> Dict[str, Any]:
+    return make_bot(index, [make_owner(i) for i in range(owners)])
+
+
+def make_server_response(index: int = 0, emojis: int = 10) -> Dict[str, Any]:
+    return make_server(index, make_owner(), emojis)
+
+
+class MockKoreanbotsServer:
+    """
+    Koreanbots API를 흉내내는 aiohttp 서버입니다.
+
+    봇, 유저, 서버 정보와 투표 여부, 길드 개수 전송을 지원하며 실제 API와 같은 형식의 응답을 반환합니다.
+    라우트와 토큰별로 고정 윈도우 레이트리밋을 적용해 ``x-ratelimit-*`` 헤더를 보내고, 초과하면 ``429`` 로 응답합니다.
+
+    :param api_key:
+        허용할 토큰입니다. 지정하면 다른 토큰의 요청에 ``401`` 로 응답합니다. 기본값은 None 입니다.
+    :type api_key:
+        Optional[str], optional
+
+    :param rate_limit:
+        윈도우마다 허용할 요청 수입니다. 기본값은 100입니다.
+    :type rate_limit:
+        int, optional
+
+    :param window:
+        레이트리밋 윈도우의 길이(초)입니다. 기본값은 60입니다.
+    :type window:
+        float, optional
+
+    :param route_limits:
+        ``POST /bots/{id}/stats`` 형식의 라우트별로 rate_limit 대신 사용할 값입니다. 기본값은 None 입니다.
+    :type route_limits:
+        Optional[Dict[str, int]], optional
+
+    :param ratelimit_headers:
+        ``x-ratelimit-*`` 헤더를 보낼지 여부입니다. False이면 ``429`` 응답에 ``Retry-After`` 만 보냅니다. 기본값은 True입니다.
+    :type ratelimit_headers:
+        bool, optional
+
+    :param latency:
+        응답하기 전에 기다릴 시간(초)입니다. 기본값은 0입니다.
+    :type latency:
+        float, optional
+
+    :param jitter:
+        latency에 더할 무작위 시간의 최대값(초)입니다. 기본값은 0입니다.
+    :type jitter:
+        float, optional
+
+    :param error_rate:
+        오류로 응답할 요청의 비율입니다. 기본값은 0입니다.
+    :type error_rate:
+        float, optional
+
+    :param error_status:
+        오류로 응답할 때 사용할 상태 코드입니다. 기본값은 500입니다.
+    :type error_status:
+        int, optional
+
+    :param voters:
+        투표한 것으로 응답할 유저의 ID입니다. 기본값은 None 입니다.
+    :type voters:
+        Optional[Iterable[int]], optional
+
+    :param seed:
+        지연 시간과 오류에 사용할 난수의 시드입니다. 기본값은 None 입니다.
+    :type seed:
+        Optional[int], optional
+
+    :param json_codec:
+        응답에 사용할 JSON 백엔드입니다. 기본값은 None 입니다.
+    :type json_codec:
+        Optional[JSONCodec], optional
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limit: int = 100,
+        window: float = 60,
+        route_limits: Optional[Dict[str, int]] = None,
+        ratelimit_headers: bool = True,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 500,
+        voters: Optional[Iterable[int]] = None,
+        seed: Optional[int] = None,
+        json_codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+        self.window = window
+        self.route_limits = route_limits or {}
+        self.ratelimit_headers = ratelimit_headers
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.voters: Set[int] = set(voters or ())
+        self.json_codec = json_codec or default_codec
+        self.requests: Dict[str, int] = {}
+        """라우트별로 받은 요청 수"""
+        self.rate_limited = 0
+        """``429`` 로 응답한 횟수"""
+        self.guild_counts: Dict[int, Dict[str, int]] = {}
+        """봇 ID별로 마지막으로 전송된 길드 개수"""
+        self._random = Random(seed)
+        self._windows: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._bodies: Dict[Tuple[str, int], bytes] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._url: Optional[str] = None
+
+    async def __aenter__(self) -> "MockKoreanbotsServer":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """클라이언트의 ``base_url`` 로 사용할 주소"""
+        if self._url is None:
+            raise RuntimeError("The server is not running.")
+        return self._url
+
+    def make_app(self) -> web.Application:
+        """
+        서버의 라우트를 담은 애플리케이션을 만듭니다.
+
+        :rtype:
+            aiohttp.web.Application
+        """
+        prefix = f"/api/{VERSION}"
+        app = web.Application()
+        app.router.add_get(prefix + "/bots/{id}", self._bot)
+        app.router.add_get(prefix + "/users/{id}", self._user)
+        app.router.add_get(prefix + "/servers/{id}", self._server)
+        app.router.add_get(prefix + "/bots/{id}/vote", self._vote)
+        app.router.add_get(prefix + "/servers/{id}/vote", self._vote)
+        app.router.add_post(prefix + "/bots/{id}/stats", self._stats)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        서버를 시작합니다.
+
+        :param host:
+            서버의 주소입니다. 기본값은 ``127.0.0.1`` 입니다.
+        :type host:
+            str, optional
+
+        :param port:
+            서버의 포트입니다. 0이면 사용하지 않는 포트를 사용합니다. 기본값은 0입니다.
+        :type port:
+            int, optional
+        """
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self._url = f"http://{host}:{port}/api/{VERSION}"
+
+    async def close(self) -> None:
+        """서버를 종료합니다."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    def _json(
+        self, data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None
+    ) -> web.Response:
+        body = self.json_codec.dumps(data)
+        if isinstance(body, str):
+            body = body.encode()
+        return web.Response(
+            body=body, status=status, headers=headers, content_type="application/json"
+        )
+
+    def _error(
+        self, status: int, message: str, headers: Optional[Dict[str, str]] = None
+    ) -> web.Response:
+        return self._json(
+            {"code": status, "version": 2, "message": message}, status, headers
+        )
+
+    async def _prepare(
+        self, request: web.Request, route: str
+    ) -> Tuple[Optional[web.Response], Dict[str, str]]:
+        # Returns an early response, or the headers to send with the real one.
+        self.requests[route] = self.requests.get(route, 0) + 1
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await sleep(delay)
+
+        token = request.headers.get("Authorization", "")
+        if not token or (self.api_key is not None and token != self.api_key):
+            return self._error(401, "Unauthorized"), {}
+
+        limit = self.route_limits.get(route, self.rate_limit)
+        now = time()
+        start, count = self._windows.get((route, token), (now, 0))
+        if now >= start + self.window:
+            start, count = now, 0
+        reset = start + self.window
+        count += 1
+        self._windows[(route, token)] = (start, count)
+
+        headers = {}
+        if self.ratelimit_headers:
+            headers = {
+                "x-ratelimit-limit": str(limit),
+                "x-ratelimit-remaining": str(max(limit - count, 0)),
+                "x-ratelimit-reset": str(ceil(reset)),
+            }
+        if count > limit:
+            self.rate_limited += 1
+            headers["Retry-After"] = str(ceil(reset - now))
+            return self._error(429, "You are being rate limited.", headers), headers
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._error(self.error_status, "Injected error", headers), headers
+
+        return None, headers
+
+    def _target_id(self, request: web.Request) -> Optional[int]:
+        target = request.match_info["id"]
+        return int(target) if target.isdigit() else None
+
+    async def _info(self, request: web.Request, kind: str) -> web.Response:
+        response, headers = await self._prepare(request, f"GET /{kind}s/{{id}}")
+        if response is not None:
+            return response
+
+        target = self._target_id(request)
+        if target is None:
+            return self._error(404, "Not Found", headers)
+
+        body = self._bodies.get((kind, target))
+        if body is None:
+            if kind == "bot":
+                data = make_bot_response(target % 1000)
+            elif kind == "user":
+                data = make_user(index=target % 1000)
+            else:
+                data = make_server_response(target % 1000)
+            data["id"] = str(target)
+            encoded = self.json_codec.dumps({"code": 200, "version": 2, "data": data})
+            body = self._bodies[(kind, target)] = (
+                encoded.encode() if isinstance(encoded, str) else encoded
+            )
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    async def _bot(self, request: web.Request) -> web.Response:
+        return await self._info(request, "bot")
+
+    async def _user(self, request: web.Request) -> web.Response:
+        return await self._info(request, "user")
+
+    async def _server(self, request: web.Request) -> web.Response:
+        return await self._info(request, "server")
+
+    async def _vote(self, request: web.Request) -> web.Response:
+        kind = "bots" if request.path.split("/")[-3] == "bots" else "servers"
+        response, headers = await self._prepare(request, f"GET /{kind}/{{id}}/vote")
+        if response is not None:
+            return response
+
+        user_id = request.query.get("userID", "")
+        if self._target_id(request) is None or not user_id.isdigit():
+            return self._error(400, "Bad Request", headers)
+
+        voted = int(user_id) in self.voters
+        data = {"voted": voted, "lastVote": int(time() * 1000) if voted else 0}
+        return self._json({"code": 200, "version": 2, "data": data}, headers=headers)
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        response, headers = await self._prepare(request, "POST /bots/{id}/stats")
+        if response is not None:
+            return response
+
+        target = self._target_id(request)
+        try:
+            payload = self.json_codec.loads(await request.read())
+            counts = {
+                key: int(payload[key])
+                for key in ("servers", "shards")
+                if key in payload
+            }
+        except (ValueError, TypeError):
+            return self._error(400, "Bad Request", headers)
+        if target is None or "servers" not in counts:
+            return self._error(400, "Bad Request", headers)
+
+        self.guild_counts[target] = counts
+        return self._json(
+            {"code": 200, "version": 2, "message": "성공적으로 업데이트 했습니다."},
+            headers=headers,
+        )
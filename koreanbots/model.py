@@ -1,16 +1,89 @@
 from abc import ABC
-from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
-from .typing import Category, State, Status
+from .decoder import get_decoder
+from .typing import Category, State, Status, VoteType
 
+R = TypeVar("R", bound="KoreanbotsResponseABC")
 
-class KoreanbotsResponseABC(ABC): ...
+
+class KoreanbotsResponseABC(ABC):
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any], lazy: bool = False) -> R:
+        """
+        API 응답을 모델로 변환합니다.
+
+        :param data:
+            API 응답의 ``data`` 입니다.
+        :type data:
+            Dict[str, Any]
+
+        :param lazy:
+            ``bots``, ``servers``, ``owners``, ``emojis`` 를 처음 접근할 때 변환할지 여부입니다. 기본값은 False입니다.
+        :type lazy:
+            bool, optional
+        """
+        return get_decoder(cls, lazy)(data)
 
 
 T = TypeVar("T", bound=KoreanbotsResponseABC)
+C = TypeVar("C", bound=type)
+
+# Values such as category or lib repeat across many models, so share one copy.
+# Only str values and the str items of lists are interned; anything else is kept.
+_INTERN = {"intern": True}
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
 
+def _getstate(self: Any) -> List[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
 
+
+def _setstate(self: Any, state: List[Any]) -> None:
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _slotted(cls: C) -> C:
+    """
+    frozen dataclass를 ``__slots__`` 를 사용하는 클래스로 다시 만듭니다.
+    파이썬 3.8, 3.9에서는 ``dataclass(slots=True)`` 를 사용할 수 없어 직접 만듭니다.
+    """
+    inherited = {
+        name for base in cls.__mro__[1:] for name in base.__dict__.get("__slots__", ())
+    }
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # The generated __setattr__ refers to the original class, so replace it.
+    cls_dict["__setattr__"] = _frozen_setattr
+    cls_dict["__delattr__"] = _frozen_delattr
+    cls_dict["__getstate__"] = _getstate
+    cls_dict["__setstate__"] = _setstate
+
+    # type() of a TypeVar is opaque to type checkers, so call it untyped.
+    metaclass: Any = type(cls)
+    new_cls: C = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+@_slotted
 @dataclass(frozen=True)
 class KoreanbotsResponse(Generic[T]):
     code: int
@@ -20,6 +93,7 @@ class KoreanbotsResponse(Generic[T]):
     data: T
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsBot(KoreanbotsResponseABC):
     """
@@ -36,7 +110,9 @@ class KoreanbotsBot(KoreanbotsResponseABC):
     """아바타"""
     flags: int = field(repr=False, compare=False, default=0)
     """플래그"""
-    lib: Optional[str] = field(repr=False, compare=False, default=None)
+    lib: Optional[str] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """라이브러리"""
     prefix: Optional[str] = field(repr=False, compare=False, default=None)
     """프리픽스"""
@@ -58,7 +134,9 @@ class KoreanbotsBot(KoreanbotsResponseABC):
     """주소"""
     discord: Optional[str] = field(repr=False, compare=False, default=None)
     """디스코드 주소"""
-    category: Optional[Category] = field(repr=False, compare=False, default=None)
+    category: Optional[Category] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """카테고리"""
     vanity: Optional[str] = field(repr=False, compare=False, default=None)
     """가상 주소"""
@@ -66,12 +144,17 @@ class KoreanbotsBot(KoreanbotsResponseABC):
     """배경 이미지 주소"""
     banner: Optional[str] = field(repr=False, compare=False, default=None)
     """배너 이미지 주소"""
-    status: Optional[Status] = field(repr=False, compare=False, default=None)
+    status: Optional[Status] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """상태"""
-    state: Optional[State] = field(repr=False, compare=False, default=None)
+    state: Optional[State] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """Koreanbots에서의 상태"""
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsUser(KoreanbotsResponseABC):
     """
@@ -92,6 +175,7 @@ class KoreanbotsUser(KoreanbotsResponseABC):
     """플래그"""
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsServer(KoreanbotsResponseABC):
     """
@@ -110,11 +194,15 @@ class KoreanbotsServer(KoreanbotsResponseABC):
     """설명문구"""
     votes: int = field(repr=True, compare=False, default=0)
     """투표수"""
-    category: Optional[Category] = field(repr=False, compare=False, default=None)
+    category: Optional[Category] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """카테고리"""
     invite: str = field(repr=False, compare=False, default="")
     """초대링크"""
-    state: Optional[State] = field(repr=False, compare=False, default=None)
+    state: Optional[State] = field(
+        repr=False, compare=False, default=None, metadata=_INTERN
+    )
     """Koreanbots에서의 상태"""
     vanity: Optional[str] = field(repr=False, compare=False, default=None)
     """서버의 가상 주소"""
@@ -126,211 +214,59 @@ class KoreanbotsServer(KoreanbotsResponseABC):
     """아이콘"""
     members: int = field(repr=False, compare=False, default=0)
     """멤버 수"""
-    emojis: List["Emoji"] = field(repr=False, compare=False, default_factory=list)
-    """Emoji 인스턴스를 담고 있는 리스트"""
+    emojis: Sequence["Emoji"] = field(repr=False, compare=False, default=())
+    """Emoji 인스턴스를 담고 있는 시퀀스"""
     boostTier: int = field(repr=False, compare=False, default=0)
     """부스트 레벨"""
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "KoreanbotsServer":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            flags=data["flags"],
-            intro=data.get("intro"),
-            desc=data.get("desc"),
-            votes=data["votes"],
-            category=data.get("category"),
-            invite=data["invite"],
-            state=data.get("state"),
-            vanity=data.get("vanity"),
-            bg=data.get("bg"),
-            banner=data.get("banner"),
-            icon=data.get("icon"),
-            members=data["members"],
-            emojis=[
-                Emoji(id=e["id"], name=e["name"], url=e["url"]) for e in data["emojis"]
-            ],
-            boostTier=data["boostTier"],
-        )
-
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class CircularKoreanbotsBot(KoreanbotsBot):
-    owners: List[str] = field(repr=False, compare=False, default_factory=list)
+    owners: Tuple[str, ...] = field(repr=False, compare=False, default=())
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class CircularKoreanbotsUser(KoreanbotsUser):
-    bots: List[str] = field(repr=False, compare=False, default_factory=list)
-    servers: List[str] = field(repr=False, compare=False, default_factory=list)
+    bots: Tuple[str, ...] = field(repr=False, compare=False, default=())
+    servers: Tuple[str, ...] = field(repr=False, compare=False, default=())
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class CircularKoreanbotsServer(KoreanbotsServer):
     owner: str = field(repr=False, compare=False, default="")
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsUserResponse(KoreanbotsUser):
-    bots: List["CircularKoreanbotsBot"] = field(
-        repr=False, compare=False, default_factory=list
+    bots: Sequence["CircularKoreanbotsBot"] = field(
+        repr=False, compare=False, default=()
     )
-    servers: List[CircularKoreanbotsServer] = field(
-        repr=False, compare=False, default_factory=list
+    servers: Sequence[CircularKoreanbotsServer] = field(
+        repr=False, compare=False, default=()
     )
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "KoreanbotsUserResponse":
-        return cls(
-            id=data["id"],
-            username=data["username"],
-            globalName=data["globalName"],
-            tag=data["tag"],
-            github=data.get("github"),
-            flags=data["flags"],
-            servers=[
-                CircularKoreanbotsServer(
-                    id=s["id"],
-                    name=s["name"],
-                    flags=s["flags"],
-                    intro=s.get("intro"),
-                    desc=s.get("desc"),
-                    votes=s["votes"],
-                    category=s.get("category"),
-                    invite=s["invite"],
-                    state=s.get("state"),
-                    vanity=s.get("vanity"),
-                    bg=s.get("bg"),
-                    banner=s.get("banner"),
-                    icon=s.get("icon"),
-                    members=s["members"],
-                    emojis=[
-                        Emoji(id=e["id"], name=e["name"], url=e["url"])
-                        for e in s["emojis"]
-                    ],
-                    boostTier=s["boostTier"],
-                    owner=s["owner"],
-                )
-                for s in data["servers"]
-            ],
-            bots=[
-                CircularKoreanbotsBot(
-                    id=b["id"],
-                    name=b["name"],
-                    tag=b["tag"],
-                    avatar=b["avatar"],
-                    flags=b["flags"],
-                    lib=b["lib"],
-                    prefix=b["prefix"],
-                    votes=b["votes"],
-                    servers=b["servers"],
-                    shards=b["shards"],
-                    intro=b.get("intro"),
-                    desc=b.get("desc"),
-                    web=b.get("web"),
-                    git=b.get("git"),
-                    url=b.get("url"),
-                    discord=b.get("discord"),
-                    category=b.get("category"),
-                    vanity=b.get("vanity"),
-                    bg=b.get("bg"),
-                    banner=b.get("banner"),
-                    status=b.get("status"),
-                    state=b.get("state"),
-                    owners=b["owners"],
-                )
-                for b in data["bots"]
-            ],
-        )
-
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsBotResponse(KoreanbotsBot):
-    owners: List["CircularKoreanbotsUser"] = field(
-        repr=False, compare=False, default_factory=list
+    owners: Sequence["CircularKoreanbotsUser"] = field(
+        repr=False, compare=False, default=()
     )
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "KoreanbotsBotResponse":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            tag=data["tag"],
-            avatar=data["avatar"],
-            flags=data["flags"],
-            lib=data["lib"],
-            prefix=data["prefix"],
-            votes=data["votes"],
-            servers=data["servers"],
-            shards=data["shards"],
-            intro=data.get("intro"),
-            desc=data.get("desc"),
-            web=data.get("web"),
-            git=data.get("git"),
-            url=data.get("url"),
-            discord=data.get("discord"),
-            category=data.get("category"),
-            vanity=data.get("vanity"),
-            bg=data.get("bg"),
-            banner=data.get("banner"),
-            status=data.get("status"),
-            state=data.get("state"),
-            owners=[
-                CircularKoreanbotsUser(
-                    id=o["id"],
-                    username=o["username"],
-                    globalName=o["globalName"],
-                    tag=o["tag"],
-                    github=o.get("github"),
-                    flags=o["flags"],
-                    bots=o["bots"],
-                )
-                for o in data["owners"]
-            ],
-        )
-
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsServerResponse(KoreanbotsServer):
     owner: "CircularKoreanbotsUser" = field(
         repr=False, compare=False, default=CircularKoreanbotsUser()
     )
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "KoreanbotsServerResponse":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            flags=data["flags"],
-            intro=data.get("intro"),
-            desc=data.get("desc"),
-            votes=data["votes"],
-            category=data.get("category"),
-            invite=data["invite"],
-            state=data.get("state"),
-            vanity=data.get("vanity"),
-            bg=data.get("bg"),
-            banner=data.get("banner"),
-            icon=data.get("icon"),
-            members=data["members"],
-            emojis=[
-                Emoji(id=e["id"], name=e["name"], url=e["url"]) for e in data["emojis"]
-            ],
-            boostTier=data["boostTier"],
-            owner=CircularKoreanbotsUser(
-                id=data["owner"]["id"],
-                username=data["owner"]["username"],
-                globalName=data["owner"]["globalName"],
-                tag=data["owner"]["tag"],
-                github=data["owner"].get("github"),
-                flags=data["owner"]["flags"],
-                bots=data["owner"]["bots"],
-                servers=data["owner"]["servers"],
-            ),
-        )
-
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class Emoji:
     """
@@ -345,13 +281,43 @@ class Emoji:
     """이모지 url"""
 
 
+@_slotted
 @dataclass(eq=True, frozen=True)
 class KoreanbotsVoteResponse(KoreanbotsResponseABC):
     voted: bool = field(repr=True, compare=True, default=False)
     """투표 여부"""
-    last_vote: int = field(repr=True, compare=True, default=0)
+    last_vote: int = field(
+        repr=True, compare=True, default=0, metadata={"key": "lastVote"}
+    )
     """마지막으로 투표한 일자"""
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "KoreanbotsVoteResponse":
-        return cls(voted=data["voted"], last_vote=data["lastVote"])
+
+@_slotted
+@dataclass(eq=True, frozen=True)
+class KoreanbotsVoteEvent(KoreanbotsResponseABC):
+    """
+    웹훅으로 투표 알림을 받았을때 반환되는 클래스입니다.
+    """
+
+    type: Optional[VoteType] = field(
+        repr=True, compare=True, default=None, metadata=_INTERN
+    )
+    """투표 대상의 종류"""
+    target_id: Optional[str] = field(
+        repr=True, compare=True, default=None, metadata={"key": "targetID"}
+    )
+    """투표 대상 봇 또는 서버의 ID"""
+    user_id: Optional[str] = field(
+        repr=True, compare=True, default=None, metadata={"key": "userID"}
+    )
+    """투표한 유저의 ID"""
+    before: int = field(repr=False, compare=False, default=0)
+    """투표 전 투표 수"""
+    after: int = field(repr=False, compare=False, default=0)
+    """투표 후 투표 수"""
+    timestamp: int = field(repr=False, compare=True, default=0)
+    """투표한 시각 (밀리초 단위 유닉스 타임스탬프)"""
+    event_id: Optional[str] = field(
+        repr=False, compare=False, default=None, metadata={"key": "id"}
+    )
+    """웹훅 전송의 ID. 본문에 있을 때만 설정됩니다."""
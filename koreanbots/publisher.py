@@ -0,0 +1,246 @@
+from asyncio import Task, gather, get_running_loop, sleep
+from dataclasses import dataclass
+from inspect import isawaitable
+from logging import getLogger
+from time import monotonic, time
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Union
+
+import aiohttp
+
+from .connection import ConnectorConfig, create_session
+from .http import KoreanbotsRequester
+from .ratelimit import RateLimiter
+
+log = getLogger(__name__)
+
+Counts = Union[int, Mapping[str, int]]
+CountProvider = Callable[[], Union[Counts, Awaitable[Counts]]]
+
+
+@dataclass
+class PublishStatus:
+    """
+    봇 하나의 정보 갱신 결과를 나타내는 클래스입니다.
+    """
+
+    bot_id: int
+    """봇의 ID"""
+    last_success: Optional[float] = None
+    """마지막으로 갱신에 성공한 시각 (유닉스 타임스탬프)"""
+    last_failure: Optional[float] = None
+    """마지막으로 갱신에 실패한 시각 (유닉스 타임스탬프)"""
+    last_error: Optional[BaseException] = None
+    """마지막으로 발생한 오류"""
+    last_duration: Optional[float] = None
+    """마지막 갱신에 걸린 시간(초)"""
+    successes: int = 0
+    """갱신에 성공한 횟수"""
+    failures: int = 0
+    """갱신에 실패한 횟수"""
+
+
+class _Entry:
+    __slots__ = ("requester", "count_provider", "status")
+
+    def __init__(
+        self,
+        requester: KoreanbotsRequester,
+        count_provider: CountProvider,
+        status: PublishStatus,
+    ) -> None:
+        self.requester = requester
+        self.count_provider = count_provider
+        self.status = status
+
+
+class StatsPublisher:
+    """
+    여러 봇의 서버 수를 하나의 이벤트 루프와 커넥션 풀에서 주기적으로 갱신하는 클래스입니다.
+    갱신 시점은 주기 안에 고르게 분산되며, 레이트리밋은 토큰별로 관리됩니다.
+
+    :param interval:
+        봇마다 정보를 갱신할 주기(초)입니다. 기본값은 1800입니다.
+    :type interval:
+        float, optional
+
+    :param session:
+        모든 봇이 공유할 aiohttp.ClientSession의 클래스입니다. 전달되지 않으면 생성합니다. 기본값은 None 입니다.
+    :type session:
+        Optional[aiohttp.ClientSession], optional
+
+    :param connector_config:
+        세션을 생성할 때 사용할 커넥션 풀 설정입니다. session이 전달된 경우 무시됩니다. 기본값은 None 입니다.
+    :type connector_config:
+        Optional[ConnectorConfig], optional
+    """
+
+    def __init__(
+        self,
+        interval: float = 1800,
+        session: Optional[aiohttp.ClientSession] = None,
+        connector_config: Optional[ConnectorConfig] = None,
+    ) -> None:
+        self.interval = interval
+        self.session = session
+        self.connector_config = connector_config
+        self._owns_session = session is None
+        self._entries: Dict[int, _Entry] = {}
+        self._ratelimiters: Dict[str, RateLimiter] = {}
+        self._tasks: List["Task[None]"] = []
+
+    @property
+    def status(self) -> Dict[int, PublishStatus]:
+        """봇 ID별 갱신 결과"""
+        return {bot_id: entry.status for bot_id, entry in self._entries.items()}
+
+    @property
+    def is_running(self) -> bool:
+        """주기적인 갱신이 실행 중인지 여부"""
+        return any(not task.done() for task in self._tasks)
+
+    def add(self, bot_id: int, api_key: str, count_provider: CountProvider) -> None:
+        """
+        정보를 갱신할 봇을 등록합니다.
+
+        :param bot_id:
+            봇의 ID입니다.
+        :type bot_id:
+            int
+
+        :param api_key:
+            봇의 Koreanbots 토큰입니다. 같은 토큰을 사용하는 봇은 레이트리밋을 공유합니다.
+        :type api_key:
+            str
+
+        :param count_provider:
+            서버 수를 반환하는 함수입니다. 코루틴 함수도 사용할 수 있습니다.
+            샤드 수도 갱신하려면 ``{"servers": ..., "shards": ...}`` 형식의 딕셔너리를 반환하세요.
+        :type count_provider:
+            Callable[[], Union[int, Mapping[str, int], Awaitable[Union[int, Mapping[str, int]]]]]
+
+        :raises RuntimeError:
+            갱신이 실행 중입니다.
+        """
+        if self.is_running:
+            raise RuntimeError("Cannot add a bot while the publisher is running")
+
+        ratelimiter = self._ratelimiters.get(api_key)
+        if ratelimiter is None:
+            ratelimiter = self._ratelimiters[api_key] = RateLimiter()
+
+        # The publisher closes the shared session, not each requester.
+        requester = KoreanbotsRequester(
+            api_key, self.session, ratelimiter, owns_session=False
+        )
+        self._entries[bot_id] = _Entry(requester, count_provider, PublishStatus(bot_id))
+
+    def remove(self, bot_id: int) -> None:
+        """
+        등록한 봇을 제거합니다.
+
+        :param bot_id:
+            봇의 ID입니다.
+        :type bot_id:
+            int
+
+        :raises RuntimeError:
+            갱신이 실행 중입니다.
+        """
+        if self.is_running:
+            raise RuntimeError("Cannot remove a bot while the publisher is running")
+
+        del self._entries[bot_id]
+
+    async def publish(self, bot_id: int) -> PublishStatus:
+        """
+        주어진 봇의 정보를 바로 갱신합니다. 실패해도 예외를 발생시키지 않고 결과에 기록합니다.
+
+        :param bot_id:
+            봇의 ID입니다.
+        :type bot_id:
+            int
+
+        :rtype:
+            PublishStatus
+        """
+        entry = self._entries[bot_id]
+        status = entry.status
+        self._ensure_session()
+
+        start = monotonic()
+        try:
+            counts = entry.count_provider()
+            if isawaitable(counts):
+                counts = await counts
+            if isinstance(counts, int):
+                counts = {"servers": counts}
+            await entry.requester.post_update_bot_info(bot_id, **counts)
+        except Exception as e:
+            status.last_duration = monotonic() - start
+            status.last_failure = time()
+            status.last_error = e
+            status.failures += 1
+            log.exception("Guild count update for %s failed due to an error.", bot_id)
+        else:
+            status.last_duration = monotonic() - start
+            status.last_success = time()
+            status.successes += 1
+            log.info(
+                "Guild count for %s updated in %.3f seconds.",
+                bot_id,
+                status.last_duration,
+            )
+        return status
+
+    async def publish_all(self) -> Dict[int, PublishStatus]:
+        """
+        등록한 모든 봇의 정보를 바로 갱신합니다.
+
+        :rtype:
+            Dict[int, PublishStatus]
+        """
+        await gather(*(self.publish(bot_id) for bot_id in self._entries))
+        return self.status
+
+    def start(self) -> None:
+        """
+        주기적인 갱신을 시작합니다.
+        봇이 N개라면 각 봇의 첫 갱신은 ``interval / N`` 초 간격으로 나뉘어 실행됩니다.
+        """
+        if self.is_running:
+            return
+
+        loop = get_running_loop()
+        self._ensure_session()
+        step = self.interval / len(self._entries) if self._entries else 0
+        self._tasks = [
+            loop.create_task(self._run(bot_id, index * step))
+            for index, bot_id in enumerate(self._entries)
+        ]
+
+    async def close(self) -> None:
+        """
+        주기적인 갱신을 멈추고, 생성한 세션을 닫습니다.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self.session and self._owns_session and not self.session.closed:
+            await self.session.close()
+
+    def _ensure_session(self) -> None:
+        if self.session is None or self.session.closed:
+            self.session = create_session(self.connector_config)
+            self._owns_session = True
+            for entry in self._entries.values():
+                entry.requester.session = self.session
+
+    async def _run(self, bot_id: int, delay: float) -> None:
+        # Schedule from a fixed start so slow posts don't push later ones back.
+        next_run = monotonic() + delay
+        while True:
+            await sleep(max(next_run - monotonic(), 0))
+            await self.publish(bot_id)
+            next_run += self.interval
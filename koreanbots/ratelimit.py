@@ -0,0 +1,231 @@
+import re
+from asyncio import Lock, sleep
+from dataclasses import dataclass
+from logging import getLogger
+from time import monotonic, time
+from typing import Dict, Mapping, Optional
+
+log = getLogger(__name__)
+
+_SNOWFLAKE = re.compile(r"/\d+(?=/|$)")
+
+
+def get_route(method: str, endpoint: str) -> str:
+    """
+    요청의 메소드와 주소를 레이트리밋 버킷을 구분하는 라우트로 변환합니다.
+    주소에 포함된 ID는 ``{id}`` 로 치환됩니다.
+
+    :param method:
+        HTTP 메소드입니다.
+    :type method:
+        str
+
+    :param endpoint:
+        요청할 API 페이지의 주소입니다.
+    :type endpoint:
+        str
+
+    :return:
+        ``GET /bots/{id}/vote`` 형식의 라우트를 반환합니다.
+    :rtype:
+        str
+    """
+    return f"{method} {_SNOWFLAKE.sub('/{id}', endpoint)}"
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """
+    레이트리밋 버킷의 현재 상태를 나타내는 클래스입니다.
+    """
+
+    route: str
+    """라우트"""
+    limit: Optional[int]
+    """윈도우당 요청 가능 횟수"""
+    remaining: Optional[int]
+    """남은 요청 가능 횟수"""
+    reset: Optional[float]
+    """윈도우가 초기화되는 시각 (유닉스 타임스탬프)"""
+
+
+class RateLimitBucket:
+    """
+    하나의 라우트에 대한 레이트리밋 상태를 관리하는 클래스입니다.
+    남은 요청 횟수를 남은 시간에 고르게 분배하여 요청 횟수가 0에 도달하지 않도록 합니다.
+
+    :param route:
+        버킷의 라우트입니다.
+    :type route:
+        str
+
+    :param burst:
+        윈도우 안에서 간격 없이 보낼 수 있는 요청의 비율입니다. 남은 요청 횟수가
+        ``limit * (1 - burst)`` 이하로 떨어지면 요청을 고르게 분배합니다. 기본값은 0.5입니다.
+    :type burst:
+        float, optional
+    """
+
+    def __init__(self, route: str, burst: float = 0.5) -> None:
+        self.route = route
+        self.burst = burst
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self._next_at = 0.0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> RateLimitState:
+        return RateLimitState(self.route, self.limit, self.remaining, self.reset)
+
+    def _expire(self, now: float) -> None:
+        if self.reset is not None and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = None
+            self._next_at = 0.0
+
+    async def acquire(self) -> float:
+        """
+        요청을 보낼 수 있을 때까지 기다립니다.
+
+        :return:
+            다른 요청이 먼저 기다리는 동안 대기한 시간을 포함해 대기한 시간(초)을 반환합니다. 대기하지 않았다면 0을 반환합니다.
+        :rtype:
+            float
+        """
+        start = monotonic()
+        # Callers queued behind a throttled request wait on the lock instead.
+        waited = self._lock.locked()
+        async with self._lock:
+            while True:
+                now = time()
+                self._expire(now)
+
+                if self.reset is None or self.remaining is None:
+                    break
+
+                if self.remaining <= 0:
+                    delay = self.reset - now
+                else:
+                    delay = self._next_at - now
+
+                if delay <= 0:
+                    break
+
+                log.debug("Route %s is throttled for %.3f seconds.", self.route, delay)
+                await sleep(delay)
+                waited = True
+
+            if self.reset is not None and self.remaining is not None:
+                self.remaining -= 1
+                if self.limit is not None and self.remaining < self.limit * (
+                    1 - self.burst
+                ):
+                    now = time()
+                    self._next_at = now + (self.reset - now) / max(self.remaining, 1)
+
+        return monotonic() - start if waited else 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        응답 헤더의 ``x-ratelimit-*`` 값으로 버킷의 상태를 갱신합니다.
+
+        :param headers:
+            응답 헤더입니다.
+        :type headers:
+            Mapping[str, str]
+        """
+        limit = headers.get("x-ratelimit-limit")
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+
+        if limit is not None:
+            self.limit = int(limit)
+
+        if reset is not None:
+            reset_timestamp = float(reset)
+            if self.reset != reset_timestamp:
+                # A new window started, so the server value wins over local bookkeeping.
+                self.reset = reset_timestamp
+                self.remaining = None
+
+        if remaining is not None:
+            if self.remaining is None:
+                self.remaining = int(remaining)
+            else:
+                # Requests still in flight were already subtracted locally.
+                self.remaining = min(self.remaining, int(remaining))
+
+    def exhaust(self, headers: Mapping[str, str]) -> float:
+        """
+        429 응답을 받았을 때 버킷을 소진된 상태로 변경합니다.
+
+        :param headers:
+            응답 헤더입니다.
+        :type headers:
+            Mapping[str, str]
+
+        :return:
+            윈도우가 초기화될 때까지 남은 시간(초)을 반환합니다.
+        :rtype:
+            float
+        """
+        now = time()
+        reset = headers.get("x-ratelimit-reset")
+        retry_after = headers.get("retry-after")
+
+        if reset is not None:
+            self.reset = float(reset)
+        elif retry_after is not None:
+            self.reset = now + float(retry_after)
+        elif self.reset is None or self.reset <= now:
+            self.reset = now + 1
+
+        self.remaining = 0
+        return max(self.reset - now, 0.0)
+
+
+class RateLimiter:
+    """
+    라우트별 레이트리밋 버킷을 관리하는 클래스입니다.
+
+    :param burst:
+        각 버킷에 전달할 burst 값입니다. 기본값은 0.5입니다.
+    :type burst:
+        float, optional
+    """
+
+    def __init__(self, burst: float = 0.5) -> None:
+        self.burst = burst
+        self._buckets: Dict[str, RateLimitBucket] = {}
+
+    def get_bucket(self, route: str) -> RateLimitBucket:
+        """
+        라우트에 해당하는 버킷을 반환합니다. 없으면 생성합니다.
+
+        :param route:
+            :func:`get_route` 로 만든 라우트입니다.
+        :type route:
+            str
+
+        :rtype:
+            RateLimitBucket
+        """
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = self._buckets[route] = RateLimitBucket(route, self.burst)
+        return bucket
+
+    @property
+    def buckets(self) -> Dict[str, RateLimitBucket]:
+        return dict(self._buckets)
+
+    def snapshot(self) -> Dict[str, RateLimitState]:
+        """
+        모든 버킷의 현재 상태를 반환합니다.
+
+        :rtype:
+            Dict[str, RateLimitState]
+        """
+        return {route: bucket.state for route, bucket in self._buckets.items()}
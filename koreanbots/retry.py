@@ -0,0 +1,219 @@
+from dataclasses import dataclass, field
+from logging import getLogger
+from random import uniform
+from time import monotonic
+from typing import FrozenSet, Optional, Sequence
+
+from .errors import CircuitOpenError
+from .typing import CircuitState
+
+log = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    실패한 요청을 다시 보낼지와 얼마나 기다릴지 정하는 설정입니다.
+    기다리는 시간은 ``min(cap, base * 2 ** attempt)`` 이하의 무작위 값입니다.
+    """
+
+    max_attempts: int = 3
+    """처음 요청을 포함한 최대 요청 횟수입니다."""
+    base: float = 0.5
+    """첫 재시도 전에 기다릴 최대 시간(초)입니다."""
+    cap: float = 10.0
+    """재시도 전에 기다릴 최대 시간(초)입니다."""
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({500, 502, 503, 504})
+    )
+    """재시도할 응답 상태 코드입니다."""
+    retry_connection_errors: bool = True
+    """연결 오류와 타임아웃을 재시도할지 여부입니다."""
+
+    def backoff(self, attempt: int) -> float:
+        """
+        ``attempt`` 번째 재시도 전에 기다릴 시간(초)을 반환합니다.
+
+        :param attempt:
+            0부터 시작하는 재시도 횟수입니다.
+        :type attempt:
+            int
+
+        :rtype:
+            float
+        """
+        return uniform(0, min(self.cap, self.base * 2**attempt))
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+"""재시도하지 않는 정책입니다."""
+
+DEFAULT_RETRY_POLICIES = {
+    "GET": RetryPolicy(),
+    # Posting stats twice is harmless, but don't hammer a struggling API with it.
+    "POST": RetryPolicy(max_attempts=2, retry_statuses=frozenset({502, 503, 504})),
+}
+"""메소드별 기본 재시도 정책입니다."""
+
+
+class RetryBudget:
+    """
+    재시도가 전체 요청의 일정 비율을 넘지 않도록 제한하는 클래스입니다.
+    API가 장애 상태일 때 재시도로 요청이 몇 배로 늘어나는 것을 막습니다.
+
+    :param ratio:
+        요청 하나당 허용할 재시도 횟수입니다. 기본값은 0.2입니다.
+    :type ratio:
+        float, optional
+
+    :param reserve:
+        요청이 적을 때도 허용할 재시도 횟수입니다. 저장할 수 있는 최대 재시도 횟수이기도 합니다. 기본값은 10입니다.
+    :type reserve:
+        float, optional
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+
+    @property
+    def balance(self) -> float:
+        """남은 재시도 횟수"""
+        return self._balance
+
+    def deposit(self) -> None:
+        """요청을 보낼 때 호출되어 재시도 횟수를 적립합니다."""
+        self._balance = min(self._balance + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        """
+        재시도할 수 있으면 횟수를 차감하고 True를 반환합니다.
+
+        :rtype:
+            bool
+        """
+        if self._balance >= 1:
+            self._balance -= 1
+            return True
+        return False
+
+
+class CircuitBreaker:
+    """
+    API가 연속으로 실패하면 일정 시간 동안 요청을 보내지 않고 바로 실패시키는 클래스입니다.
+
+    - ``closed``: 요청을 보냅니다. 연속 실패가 ``failure_threshold`` 에 도달하면 ``open`` 이 됩니다.
+    - ``open``: :class:`CircuitOpenError` 를 발생시킵니다. ``recovery_timeout`` 이 지나면 ``half_open`` 이 됩니다.
+    - ``half_open``: 요청 하나만 보내 복구 여부를 확인합니다. 성공하면 ``closed``, 실패하면 다시 ``open`` 이 됩니다.
+
+    :param failure_threshold:
+        ``open`` 이 되는 연속 실패 횟수입니다. 기본값은 5입니다.
+    :type failure_threshold:
+        int, optional
+
+    :param recovery_timeout:
+        ``open`` 상태를 유지할 시간(초)입니다. 기본값은 30입니다.
+    :type recovery_timeout:
+        float, optional
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태"""
+        if self.opened_at is None:
+            return "closed"
+        if monotonic() - self.opened_at < self.recovery_timeout:
+            return "open"
+        return "half_open"
+
+    def before_request(self) -> None:
+        """
+        요청을 보내기 전에 호출합니다.
+
+        :raises CircuitOpenError:
+            ``open`` 상태이거나, ``half_open`` 상태에서 이미 다른 요청이 복구 여부를 확인하고 있습니다.
+        """
+        state = self.state
+        if state == "closed":
+            return
+        now = monotonic()
+        # A probe that never reported back (e.g. cancelled) must not block forever.
+        if state == "half_open" and (
+            self._probe_started is None
+            or now - self._probe_started >= self.recovery_timeout
+        ):
+            self._probe_started = now
+            return
+
+        assert self.opened_at is not None
+        raise CircuitOpenError(max(self.opened_at + self.recovery_timeout - now, 0))
+
+    def record_success(self) -> None:
+        """요청이 성공했음을 기록합니다."""
+        if self.opened_at is not None:
+            log.info("Koreanbots API recovered. Closing the circuit.")
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """요청이 실패했음을 기록합니다."""
+        self.failures += 1
+        if self._probe_started is not None or (
+            self.opened_at is None and self.failures >= self.failure_threshold
+        ):
+            log.warning(
+                "Koreanbots API failed %d times in a row. Opening the circuit for %.0f seconds.",
+                self.failures,
+                self.recovery_timeout,
+            )
+            self.opened_at = monotonic()
+        self._probe_started = None
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    GET 요청이 늦어질 때 같은 요청을 한 번 더 보내는 설정입니다.
+    첫 요청이 최근 응답 시간의 ``percentile`` 분위수 안에 응답하지 않으면 두 번째 요청을 보내고,
+    먼저 응답한 결과를 사용합니다. 늦은 요청은 취소됩니다.
+    """
+
+    percentile: float = 0.95
+    """두 번째 요청을 보낼 기준이 되는 응답 시간의 분위수입니다."""
+    min_delay: float = 0.05
+    """두 번째 요청을 보내기 전에 기다릴 최소 시간(초)입니다."""
+    max_delay: float = 1.0
+    """두 번째 요청을 보내기 전에 기다릴 최대 시간(초)입니다. 응답 시간이 충분히 모이지 않았을 때도 사용합니다."""
+    min_samples: int = 20
+    """분위수를 계산하기 위해 필요한 최소 응답 수입니다."""
+    window: int = 256
+    """라우트별로 보관할 최근 응답 시간의 수입니다."""
+
+    def delay(self, samples: Sequence[float]) -> float:
+        """
+        최근 응답 시간으로 두 번째 요청을 보내기 전에 기다릴 시간(초)을 계산합니다.
+
+        :param samples:
+            최근 응답 시간(초)입니다.
+        :type samples:
+            Sequence[float]
+
+        :rtype:
+            float
+        """
+        if len(samples) < self.min_samples:
+            return self.max_delay
+        ordered = sorted(samples)
+        value = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+        return min(max(value, self.min_delay), self.max_delay)
@@ -0,0 +1,341 @@
+import sqlite3
+from asyncio import Future, Lock, Task, get_running_loop, sleep
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from time import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from .codec import JSONCodec, default_codec
+from .model import KoreanbotsVoteEvent
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vote_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    payload BLOB NOT NULL,
+    created REAL NOT NULL,
+    acked INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS vote_events_pending ON vote_events (acked, id)"
+
+# Values of the acked column.
+_PENDING = 0
+_ACKED = 1
+_DEAD = 2
+
+
+def event_key(event: KoreanbotsVoteEvent) -> str:
+    """
+    투표 이벤트의 중복을 판단하는 키를 반환합니다.
+    같은 투표가 다시 전달되면 같은 키를 가집니다. 웹훅 전송의 ID가 있으면 ID를, 없으면 투표한 시각을 사용합니다.
+
+    :param event:
+        투표 이벤트입니다.
+    :type event:
+        KoreanbotsVoteEvent
+
+    :raises ValueError:
+        이벤트에 ID와 투표한 시각이 모두 없을 때 발생합니다.
+
+    :rtype:
+        str
+    """
+    if event.event_id:
+        return f"id:{event.event_id}"
+    if not event.timestamp:
+        raise ValueError("Vote event has neither an id nor a timestamp.")
+    return f"{event.type}:{event.target_id}:{event.user_id}:{event.timestamp}"
+
+
+class VoteEventStore:
+    """
+    투표 이벤트를 SQLite(WAL 모드)에 저장하는 영속 큐입니다.
+
+    - 같은 키의 이벤트는 한 번만 저장됩니다.
+    - 동시에 들어온 이벤트는 한 트랜잭션으로 묶어 커밋합니다.
+    - 처리한 이벤트는 :meth:`ack` 로 확인해야 하며, 확인되지 않은 이벤트는 :meth:`pending` 으로 다시 가져올 수 있습니다.
+    - 처리에 실패한 이벤트는 :meth:`fail` 로 기록하며, ``max_attempts`` 번 실패하면 :meth:`dead_letters` 로 옮겨집니다.
+
+    데이터베이스 작업은 별도의 스레드에서 실행되므로 이벤트 루프를 막지 않습니다.
+
+    :param path:
+        데이터베이스 파일의 경로입니다.
+    :type path:
+        str
+
+    :param batch_size:
+        한 번에 커밋할 최대 이벤트 수입니다. 기본값은 500입니다.
+    :type batch_size:
+        int, optional
+
+    :param flush_interval:
+        이벤트를 모아 커밋하기 전에 기다릴 시간(초)입니다. 기본값은 0.01입니다.
+    :type flush_interval:
+        float, optional
+
+    :param retention:
+        확인된 이벤트를 중복 확인을 위해 보관할 시간(초)입니다. 기본값은 86400입니다.
+    :type retention:
+        float, optional
+
+    :param json_codec:
+        이벤트를 저장할 때 사용할 JSON 백엔드입니다. 기본값은 None 입니다.
+    :type json_codec:
+        Optional[JSONCodec], optional
+
+    :param max_attempts:
+        이벤트를 더이상 다시 처리하지 않을 때까지의 최대 실패 횟수입니다. 0이면 제한하지 않습니다. 기본값은 5입니다.
+    :type max_attempts:
+        int, optional
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 500,
+        flush_interval: float = 0.01,
+        retention: float = 86400,
+        json_codec: Optional[JSONCodec] = None,
+        max_attempts: int = 5,
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention = retention
+        self.json_codec = json_codec or default_codec
+        self.max_attempts = max_attempts
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._open_lock: Optional[Lock] = None
+        self._buffer: List[Tuple[str, Any, "Future[Optional[int]]"]] = []
+        self._flusher: Optional["Task[None]"] = None
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._executor is None:
+            # A single thread owns the connection, which also serializes writes.
+            self._executor = ThreadPoolExecutor(1, "koreanbots-store")
+        return await get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def open(self) -> None:
+        """
+        데이터베이스를 열고, 보관 기간이 지난 이벤트를 정리합니다.
+        """
+        if self._open_lock is None:
+            self._open_lock = Lock()
+        # The first puts may arrive together; only one of them opens the database.
+        async with self._open_lock:
+            if self._connection is None:
+                await self._run(self._open)
+        await self.prune()
+
+    def _open(self) -> None:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL is durable across process crashes.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(_SCHEMA)
+        columns = [
+            row[1] for row in connection.execute("PRAGMA table_info(vote_events)")
+        ]
+        if "attempts" not in columns:
+            # Databases created before attempts were counted.
+            connection.execute(
+                "ALTER TABLE vote_events ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0"
+            )
+        connection.execute(_INDEX)
+        connection.commit()
+        self._connection = connection
+
+    async def close(self) -> None:
+        """
+        남은 이벤트를 커밋하고 데이터베이스를 닫습니다.
+        """
+        if self._flusher is not None:
+            await self._flusher
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def put(self, event: KoreanbotsVoteEvent) -> Optional[int]:
+        """
+        이벤트를 저장합니다. 커밋된 뒤 반환됩니다.
+
+        :param event:
+            저장할 투표 이벤트입니다.
+        :type event:
+            KoreanbotsVoteEvent
+
+        :return:
+            저장된 이벤트의 ID를 반환합니다. 이미 저장된 이벤트라면 None을 반환합니다.
+        :rtype:
+            Optional[int]
+        """
+        if self._connection is None:
+            await self.open()
+
+        payload = self.json_codec.dumps([getattr(event, f.name) for f in fields(event)])
+        future: "Future[Optional[int]]" = get_running_loop().create_future()
+        self._buffer.append((event_key(event), payload, future))
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = get_running_loop().create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        while self._buffer:
+            if len(self._buffer) < self.batch_size:
+                await sleep(self.flush_interval)
+            batch = self._buffer[: self.batch_size]
+            del self._buffer[: self.batch_size]
+            try:
+                ids = await self._run(self._insert, [item[:2] for item in batch])
+            except Exception as e:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (*_, future), row_id in zip(batch, ids):
+                    if not future.done():
+                        future.set_result(row_id)
+
+    def _insert(self, rows: Sequence[Tuple[str, Any]]) -> List[Optional[int]]:
+        assert self._connection is not None
+        ids: List[Optional[int]] = []
+        now = time()
+        with self._connection:
+            cursor = self._connection.cursor()
+            for key, payload in rows:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO vote_events (key, payload, created) VALUES (?, ?, ?)",
+                    (key, payload, now),
+                )
+                ids.append(cursor.lastrowid if cursor.rowcount else None)
+        return ids
+
+    async def ack(self, *ids: int) -> None:
+        """
+        처리한 이벤트를 확인합니다. 확인된 이벤트는 :meth:`pending` 에서 반환되지 않습니다.
+
+        :param ids:
+            확인할 이벤트의 ID입니다.
+        :type ids:
+            int
+        """
+        if ids:
+            await self._run(self._ack, ids)
+
+    def _ack(self, ids: Sequence[int]) -> None:
+        assert self._connection is not None
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE vote_events SET acked = ? WHERE id = ?",
+                [(_ACKED, i) for i in ids],
+            )
+
+    async def fail(self, row_id: int) -> bool:
+        """
+        이벤트의 처리에 실패했음을 기록합니다.
+        ``max_attempts`` 번 실패한 이벤트는 :meth:`pending` 에서 반환되지 않고 :meth:`dead_letters` 로 옮겨집니다.
+
+        :param row_id:
+            실패한 이벤트의 ID입니다.
+        :type row_id:
+            int
+
+        :return:
+            이벤트가 더이상 다시 처리되지 않으면 True를 반환합니다.
+        :rtype:
+            bool
+        """
+        return await self._run(self._fail, row_id)
+
+    def _fail(self, row_id: int) -> bool:
+        assert self._connection is not None
+        with self._connection:
+            self._connection.execute(
+                "UPDATE vote_events SET attempts = attempts + 1, "
+                "acked = CASE WHEN ? > 0 AND attempts + 1 >= ? THEN ? ELSE acked END "
+                "WHERE id = ? AND acked = ?",
+                (self.max_attempts, self.max_attempts, _DEAD, row_id, _PENDING),
+            )
+            row = self._connection.execute(
+                "SELECT acked FROM vote_events WHERE id = ?", (row_id,)
+            ).fetchone()
+        return row is not None and row[0] == _DEAD
+
+    async def pending(
+        self, limit: Optional[int] = None
+    ) -> List[Tuple[int, KoreanbotsVoteEvent]]:
+        """
+        확인되지 않은 이벤트를 저장된 순서대로 반환합니다.
+        재시작한 뒤 처리하지 못한 이벤트를 다시 처리할 때 사용합니다.
+
+        :param limit:
+            반환할 최대 이벤트 수입니다. 기본값은 None 입니다.
+        :type limit:
+            Optional[int], optional
+
+        :rtype:
+            List[Tuple[int, KoreanbotsVoteEvent]]
+        """
+        if self._connection is None:
+            await self.open()
+
+        return await self._select(_PENDING, limit)
+
+    async def dead_letters(
+        self, limit: Optional[int] = None
+    ) -> List[Tuple[int, KoreanbotsVoteEvent]]:
+        """
+        ``max_attempts`` 번 실패해 더이상 다시 처리하지 않는 이벤트를 저장된 순서대로 반환합니다.
+        이 이벤트도 보관 기간이 지나면 삭제됩니다.
+
+        :param limit:
+            반환할 최대 이벤트 수입니다. 기본값은 None 입니다.
+        :type limit:
+            Optional[int], optional
+
+        :rtype:
+            List[Tuple[int, KoreanbotsVoteEvent]]
+        """
+        if self._connection is None:
+            await self.open()
+
+        return await self._select(_DEAD, limit)
+
+    async def _select(
+        self, state: int, limit: Optional[int]
+    ) -> List[Tuple[int, KoreanbotsVoteEvent]]:
+        rows = await self._run(self._rows, state, -1 if limit is None else limit)
+        loads = self.json_codec.loads
+        return [
+            (row_id, KoreanbotsVoteEvent(*loads(payload))) for row_id, payload in rows
+        ]
+
+    def _rows(self, state: int, limit: int) -> List[Tuple[int, Any]]:
+        assert self._connection is not None
+        return self._connection.execute(
+            "SELECT id, payload FROM vote_events WHERE acked = ? ORDER BY id LIMIT ?",
+            (state, limit),
+        ).fetchall()
+
+    async def prune(self) -> None:
+        """
+        보관 기간이 지난 확인된 이벤트와 더이상 다시 처리하지 않는 이벤트를 삭제합니다.
+        """
+        await self._run(self._prune, time() - self.retention)
+
+    def _prune(self, before: float) -> None:
+        assert self._connection is not None
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM vote_events WHERE acked != ? AND created < ?",
+                (_PENDING, before),
+            )
@@ -0,0 +1,190 @@
+from dataclasses import dataclass, field
+from logging import getLogger
+from time import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import aiohttp
+
+log = getLogger(__name__)
+
+SpanCallback = Callable[["RequestSpan"], Any]
+
+
+@dataclass
+class RequestSpan:
+    """
+    요청 하나의 진행 과정을 나타내는 클래스입니다. 재시도한 요청은 각각 기록됩니다.
+    시각은 모두 :func:`time.time` 기준의 초입니다.
+    """
+
+    method: str
+    """HTTP 메소드"""
+    route: str
+    """ID가 ``{id}`` 로 치환된 라우트"""
+    attempt: int
+    """1부터 시작하는 시도 횟수"""
+    start: float
+    """요청을 시작한 시각"""
+    end: Optional[float] = None
+    """요청이 끝난 시각"""
+    status: Optional[int] = None
+    """응답 상태 코드. 응답을 받지 못했다면 None입니다."""
+    error: Optional[BaseException] = None
+    """요청 중 발생한 오류"""
+    phases: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    """
+    단계별 시작과 끝 시각입니다. 세션이 :meth:`RequestTracer.trace_config` 를 사용할 때 기록됩니다.
+
+    - ``queue``: 커넥션 풀에서 연결을 기다린 시간
+    - ``dns``: DNS 조회
+    - ``connect``: TCP 연결과 TLS 핸드셰이크
+    - ``wait``: 요청을 보낸 뒤 응답 헤더를 받을 때까지
+    - ``read``: 응답 본문을 읽은 시간
+    """
+
+    @property
+    def duration(self) -> float:
+        """요청에 걸린 시간(초)"""
+        return (self.end or self.start) - self.start
+
+
+class RequestTracer:
+    """
+    요청마다 :class:`RequestSpan` 을 만들어 콜백에 전달하는 클래스입니다.
+    요청 클래스에 ``tracer`` 인자로 전달하면 요청 클래스가 만드는 세션에 단계별 기록을 위한 훅이 추가됩니다.
+
+    .. code-block:: python
+
+        def on_span(span: RequestSpan) -> None:
+            print(span.route, span.status, span.phases)
+
+        kb = Koreanbots(api_key, tracer=RequestTracer(on_span))
+
+    :param callback:
+        요청이 끝날 때마다 호출할 함수입니다. :class:`OpenTelemetryExporter` 를 전달할 수도 있습니다.
+    :type callback:
+        Callable[[RequestSpan], Any]
+    """
+
+    def __init__(self, callback: SpanCallback) -> None:
+        self.callback = callback
+
+    def start(self, method: str, route: str, attempt: int) -> RequestSpan:
+        """
+        요청을 시작할 때 호출합니다.
+
+        :rtype:
+            RequestSpan
+        """
+        return RequestSpan(method, route, attempt, time())
+
+    def finish(
+        self,
+        span: RequestSpan,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        요청이 끝날 때 호출합니다. 콜백에서 발생한 오류는 요청에 영향을 주지 않습니다.
+        """
+        if span.end is not None:
+            return
+        span.end = time()
+        span.status = status
+        span.error = error
+        # Headers arrived at the end of "wait"; the rest was spent on the body.
+        wait = span.phases.get("wait")
+        if wait is not None and status is not None:
+            span.phases["read"] = (wait[1], span.end)
+        try:
+            self.callback(span)
+        except Exception:
+            log.exception("Request span callback failed.")
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        요청의 단계별 시각을 기록하는 :class:`aiohttp.TraceConfig` 를 반환합니다.
+        단계는 요청에 ``trace_request_ctx`` 로 전달된 :class:`RequestSpan` 에 기록됩니다.
+
+        :rtype:
+            aiohttp.TraceConfig
+        """
+
+        def phase(name: str, end: bool) -> Any:
+            async def hook(
+                session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+            ) -> None:
+                span = context.trace_request_ctx
+                if not isinstance(span, RequestSpan):
+                    return
+                now = time()
+                if end:
+                    start = getattr(context, name, None)
+                    if start is not None:
+                        span.phases[name] = (start, now)
+                else:
+                    setattr(context, name, now)
+
+            return hook
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(phase("queue", False))
+        trace_config.on_connection_queued_end.append(phase("queue", True))
+        trace_config.on_dns_resolvehost_start.append(phase("dns", False))
+        trace_config.on_dns_resolvehost_end.append(phase("dns", True))
+        trace_config.on_connection_create_start.append(phase("connect", False))
+        trace_config.on_connection_create_end.append(phase("connect", True))
+        trace_config.on_request_headers_sent.append(phase("wait", False))
+        trace_config.on_request_end.append(phase("wait", True))
+        return trace_config
+
+
+class OpenTelemetryExporter:
+    """
+    :class:`RequestSpan` 을 OpenTelemetry 스팬으로 내보내는 콜백입니다.
+    단계는 하위 스팬으로 기록됩니다. ``opentelemetry-api`` 가 설치되어 있어야 합니다.
+
+    :param tracer:
+        스팬을 만들 OpenTelemetry 트레이서입니다. 전달되지 않으면 ``koreanbots`` 이름의 트레이서를 사용합니다. 기본값은 None 입니다.
+    :type tracer:
+        Optional[opentelemetry.trace.Tracer], optional
+
+    :raises ImportError:
+        ``opentelemetry-api`` 가 설치되어 있지 않습니다.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        from opentelemetry import trace  # type: ignore
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("koreanbots")
+
+    def __call__(self, span: RequestSpan) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": span.method,
+            "http.route": span.route,
+            "http.request.resend_count": span.attempt - 1,
+        }
+        if span.status is not None:
+            attributes["http.response.status_code"] = span.status
+
+        parent = self.tracer.start_span(
+            span.route, start_time=_nanoseconds(span.start), attributes=attributes
+        )
+        if span.error is not None:
+            parent.record_exception(span.error)
+        if span.error is not None or (span.status or 0) >= 500:
+            parent.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+        context = self._trace.set_span_in_context(parent)
+        for name, (start, end) in span.phases.items():
+            child = self.tracer.start_span(
+                name, context=context, start_time=_nanoseconds(start)
+            )
+            child.end(end_time=_nanoseconds(end))
+        parent.end(end_time=_nanoseconds(span.end or span.start))
+
+
+def _nanoseconds(seconds: float) -> int:
+    return int(seconds * 1_000_000_000)
@@ -8,6 +8,14 @@ WidgetStyle = Literal["classic", "flat"]
 
 VoteType = Literal["bot", "server"]
 
+JSONBackend = Literal["orjson", "ujson", "json"]
+
+OutputMode = Literal["model", "dict", "raw"]
+
+RawOutputMode = Literal["dict", "raw"]
+
+CircuitState = Literal["closed", "open", "half_open"]
+
 Category = Literal[
     "관리",
     "뮤직",
@@ -0,0 +1,399 @@
+from asyncio import Queue, Task, gather, get_running_loop, sleep
+from dataclasses import dataclass
+from hmac import compare_digest
+from logging import getLogger
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+from .codec import JSONCodec, default_codec
+from .model import KoreanbotsVoteEvent
+from .store import VoteEventStore
+
+log = getLogger(__name__)
+
+# How often the retry task removes events that are past the store's retention.
+_PRUNE_INTERVAL = 3600
+
+VoteHandler = Callable[[KoreanbotsVoteEvent], Awaitable[Any]]
+
+
+@dataclass
+class WebhookStats:
+    """
+    웹훅 서버가 처리한 요청 수를 나타내는 클래스입니다.
+    """
+
+    received: int = 0
+    """큐에 넣은 이벤트 수"""
+    unauthorized: int = 0
+    """비밀 키가 일치하지 않아 거부한 요청 수"""
+    malformed: int = 0
+    """본문을 해석할 수 없어 거부한 요청 수"""
+    dropped: int = 0
+    """큐가 가득 차 거부한 요청 수"""
+    duplicates: int = 0
+    """이미 저장된 이벤트라서 무시한 요청 수"""
+    handled: int = 0
+    """핸들러까지 전달된 이벤트 수"""
+    failed: int = 0
+    """핸들러에서 오류가 발생한 이벤트 수"""
+    dead: int = 0
+    """store의 ``max_attempts`` 번 실패해 더이상 다시 처리하지 않는 이벤트 수"""
+
+
+def parse_vote_event(payload: Dict[str, Any]) -> KoreanbotsVoteEvent:
+    """
+    웹훅 본문을 :class:`KoreanbotsVoteEvent` 로 변환합니다.
+
+    :param payload:
+        웹훅 요청의 본문입니다.
+    :type payload:
+        Dict[str, Any]
+
+    :raises ValueError:
+        본문에 ``id`` 와 ``timestamp`` 가 모두 없을 때 발생합니다. 둘 중 하나가 있어야 같은 투표가 다시 전달되었는지 판단할 수 있습니다.
+
+    :rtype:
+        KoreanbotsVoteEvent
+    """
+    data = payload.get("data") or {}
+    event_id = payload.get("id")
+    timestamp = payload.get("timestamp")
+    if not event_id and not timestamp:
+        raise ValueError("Vote event has neither an id nor a timestamp.")
+    return KoreanbotsVoteEvent.from_dict(
+        {
+            **data,
+            "type": payload.get("type"),
+            "targetID": payload.get("botID")
+            or payload.get("guildID")
+            or payload.get("serverID"),
+            "timestamp": timestamp,
+            "id": None if event_id is None else str(event_id),
+        }
+    )
+
+
+class WebhookServer:
+    """
+    Koreanbots의 투표 웹훅을 받는 서버입니다.
+
+    요청은 비밀 키를 확인하고 큐에 넣은 뒤 바로 응답하며, 핸들러는 별도의 작업에서 실행됩니다.
+    큐가 가득 차면 ``503`` 으로 응답해 Koreanbots가 나중에 다시 보내도록 합니다.
+
+    :param secret:
+        웹훅의 비밀 키입니다. ``Authorization`` 헤더와 비교합니다. 비어 있으면 안 됩니다.
+    :type secret:
+        str
+
+    :param path:
+        웹훅을 받을 주소입니다. 기본값은 ``/koreanbots`` 입니다.
+    :type path:
+        str, optional
+
+    :param client:
+        이벤트를 ``koreanbots_vote`` 로 전달할 discord.py 클라이언트입니다. 기본값은 None 입니다.
+    :type client:
+        Optional[Any], optional
+
+    :param max_queue:
+        처리를 기다릴 수 있는 최대 이벤트 수입니다. 기본값은 1000입니다.
+    :type max_queue:
+        int, optional
+
+    :param workers:
+        핸들러를 실행할 작업의 수입니다. 기본값은 1입니다.
+    :type workers:
+        int, optional
+
+    :param json_codec:
+        본문을 해석할 JSON 백엔드입니다. 기본값은 None 입니다.
+    :type json_codec:
+        Optional[JSONCodec], optional
+
+    :param store:
+        이벤트를 응답하기 전에 저장할 영속 큐입니다. 지정하면 중복된 이벤트는 한 번만 처리되고,
+        핸들러가 성공한 이벤트만 확인되어 처리하지 못한 이벤트를 retry_interval마다, 그리고 재시작할 때 다시 처리합니다.
+        store의 ``max_attempts`` 번 실패한 이벤트는 더이상 다시 처리하지 않습니다. 기본값은 None 입니다.
+    :type store:
+        Optional[VoteEventStore], optional
+
+    :param retry_interval:
+        store가 지정되었을 때 핸들러가 실패한 이벤트를 다시 처리할 간격(초)입니다. 보관 기간이 지난 이벤트도 이 작업에서 정리합니다.
+        0이면 재시작할 때만 다시 처리합니다. 기본값은 60입니다.
+    :type retry_interval:
+        float, optional
+
+    :raises ValueError:
+        secret이 비어 있을 때 발생합니다.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        path: str = "/koreanbots",
+        client: Optional[Any] = None,
+        max_queue: int = 1000,
+        workers: int = 1,
+        json_codec: Optional[JSONCodec] = None,
+        store: Optional[VoteEventStore] = None,
+        retry_interval: float = 60,
+    ) -> None:
+        if not secret:
+            # An empty secret would accept requests without an Authorization header.
+            raise ValueError("Webhook secret must not be empty.")
+        self.secret = secret.encode()
+        self.path = path
+        self.client = client
+        self.max_queue = max_queue
+        self.workers = workers
+        self.json_codec = json_codec or default_codec
+        self.store = store
+        self.retry_interval = retry_interval
+        self.stats = WebhookStats()
+        self.handlers: List[VoteHandler] = []
+        self._queue: Optional["Queue[Tuple[Optional[int], KoreanbotsVoteEvent]]"] = None
+        self._tasks: List["Task[None]"] = []
+        # Slots held by requests that are still saving their event to the store.
+        self._reserved = 0
+        # Stored events that are queued or being handled, so a replay skips them.
+        self._inflight: Set[int] = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    def handler(self, func: VoteHandler) -> VoteHandler:
+        """
+        투표 이벤트를 받을 핸들러를 등록하는 데코레이터입니다.
+
+        .. code-block:: python
+
+            @webhook.handler
+            async def on_vote(event: KoreanbotsVoteEvent) -> None:
+                ...
+        """
+        self.handlers.append(func)
+        return func
+
+    def setup(self, app: web.Application) -> None:
+        """
+        기존 aiohttp 애플리케이션에 웹훅 라우트를 추가합니다.
+        핸들러 작업은 애플리케이션이 시작될 때 실행되고 종료될 때 멈춥니다.
+
+        :param app:
+            라우트를 추가할 애플리케이션입니다.
+        :type app:
+            aiohttp.web.Application
+        """
+        app.router.add_post(self.path, self._receive)
+
+        async def on_startup(_: web.Application) -> None:
+            if self.store is not None:
+                await self.replay()
+            self.start_workers()
+
+        async def on_cleanup(_: web.Application) -> None:
+            await self.stop_workers()
+            if self.store is not None:
+                await self.store.close()
+
+        app.on_startup.append(on_startup)
+        app.on_cleanup.append(on_cleanup)
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080) -> None:
+        """
+        웹훅 서버를 시작합니다.
+
+        :param host:
+            서버의 주소입니다. 기본값은 ``0.0.0.0`` 입니다.
+        :type host:
+            str, optional
+
+        :param port:
+            서버의 포트입니다. 기본값은 8080입니다.
+        :type port:
+            int, optional
+        """
+        app = web.Application()
+        self.setup(app)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def close(self) -> None:
+        """
+        웹훅 서버를 종료합니다. 큐에 남은 이벤트를 모두 처리한 뒤 종료됩니다.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def replay(self) -> int:
+        """
+        저장소에서 확인되지 않은 이벤트를 가져와 다시 처리합니다. 이미 큐에 있거나 처리 중인 이벤트는 제외합니다.
+        큐의 크기를 넘는 이벤트는 다음에 다시 처리할 때 처리됩니다.
+
+        :return:
+            다시 처리할 이벤트 수를 반환합니다.
+        :rtype:
+            int
+        """
+        if self.store is None:
+            return 0
+
+        queue = self._get_queue()
+        free = self._free_slots()
+        if free == 0:
+            return 0
+        rows = await self.store.pending(
+            None if free is None else free + len(self._inflight)
+        )
+
+        count = 0
+        for row_id, event in rows:
+            # The queue may have filled up while the rows were being read.
+            if self._free_slots() == 0:
+                break
+            if row_id in self._inflight:
+                continue
+            self._inflight.add(row_id)
+            queue.put_nowait((row_id, event))
+            count += 1
+        if count:
+            log.info("Replaying %d unacknowledged vote events.", count)
+        return count
+
+    def _get_queue(self) -> "Queue[Tuple[Optional[int], KoreanbotsVoteEvent]]":
+        if self._queue is None:
+            self._queue = Queue(self.max_queue)
+        return self._queue
+
+    def _free_slots(self) -> Optional[int]:
+        queue = self._get_queue()
+        if queue.maxsize <= 0:
+            return None
+        return max(queue.maxsize - queue.qsize() - self._reserved, 0)
+
+    def start_workers(self) -> None:
+        """핸들러를 실행할 작업을 시작합니다."""
+        self._get_queue()
+        loop = get_running_loop()
+        self._tasks = [loop.create_task(self._work()) for _ in range(self.workers)]
+        if self.store is not None and self.retry_interval > 0:
+            self._tasks.append(loop.create_task(self._retry()))
+
+    async def stop_workers(self) -> None:
+        """큐에 남은 이벤트를 처리한 뒤 작업을 멈춥니다."""
+        if self._queue is not None:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _receive(self, request: web.Request) -> web.Response:
+        authorization = request.headers.get("Authorization", "").encode()
+        if not compare_digest(authorization, self.secret):
+            self.stats.unauthorized += 1
+            return web.json_response({"message": "Unauthorized"}, status=401)
+
+        try:
+            payload = self.json_codec.loads(await request.read())
+            event = parse_vote_event(payload)
+        except (ValueError, TypeError, AttributeError):
+            self.stats.malformed += 1
+            return web.json_response({"message": "Bad Request"}, status=400)
+
+        queue = self._get_queue()
+        if self._free_slots() == 0:
+            self.stats.dropped += 1
+            log.warning("Vote webhook queue is full. Rejecting an event.")
+            return web.json_response(
+                {"message": "Service Unavailable"},
+                status=503,
+                headers={"Retry-After": "5"},
+            )
+
+        row_id = None
+        if self.store is not None:
+            # Hold a slot while saving so the event can't be stored and then
+            # find the queue filled by other requests in the meantime.
+            self._reserved += 1
+            try:
+                row_id = await self.store.put(event)
+            finally:
+                self._reserved -= 1
+            if row_id is None:
+                # Already stored, so this is a retried delivery.
+                self.stats.duplicates += 1
+                return web.json_response({"message": "OK"})
+            if row_id in self._inflight:
+                # A replay that ran during the save has already queued it.
+                return web.json_response({"message": "OK"})
+            self._inflight.add(row_id)
+
+        queue.put_nowait((row_id, event))
+        self.stats.received += 1
+        return web.json_response({"message": "OK"})
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            row_id, event = await self._queue.get()
+            try:
+                await self._dispatch(event)
+            except Exception:
+                self.stats.failed += 1
+                log.exception("Vote webhook handler failed.")
+                if self.store is not None and row_id is not None:
+                    await self._fail(row_id)
+            else:
+                self.stats.handled += 1
+                if self.store is not None and row_id is not None:
+                    try:
+                        await self.store.ack(row_id)
+                    except Exception:
+                        # The row stays pending, so a replay delivers it again.
+                        log.exception("Failed to acknowledge vote event %d.", row_id)
+            finally:
+                if row_id is not None:
+                    self._inflight.discard(row_id)
+                self._queue.task_done()
+
+    async def _fail(self, row_id: int) -> None:
+        assert self.store is not None
+        try:
+            dead = await self.store.fail(row_id)
+        except Exception:
+            log.exception("Failed to record a failure of vote event %d.", row_id)
+            return
+        if dead:
+            self.stats.dead += 1
+            log.error(
+                "Vote event %d failed %d times and will not be retried.",
+                row_id,
+                self.store.max_attempts,
+            )
+
+    async def _retry(self) -> None:
+        assert self.store is not None
+        pruned_at = monotonic()
+        while True:
+            await sleep(self.retry_interval)
+            try:
+                await self.replay()
+            except Exception:
+                log.exception("Failed to replay unacknowledged vote events.")
+            # The store only prunes on open, which a long-running server rarely does.
+            if monotonic() - pruned_at >= _PRUNE_INTERVAL:
+                pruned_at = monotonic()
+                try:
+                    await self.store.prune()
+                except Exception:
+                    log.exception("Failed to prune vote events.")
+
+    async def _dispatch(self, event: KoreanbotsVoteEvent) -> None:
+        if self.client is not None:
+            self.client.dispatch("koreanbots_vote", event)
+        for handler in self.handlers:
+            await handler(event)
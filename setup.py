@@ -38,6 +38,7 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=requirements,
+    extras_require={"speed": ["orjson"], "opentelemetry": ["opentelemetry-api"]},
     python_requires=">=3.8",
     package_data={"koreanbots": ["py.typed"]},
     classifiers=[
@@ -1,10 +1,54 @@
 from os import getenv
 
+from aiohttp import web
 from pytest_asyncio import fixture
 
+import koreanbots.http
 from koreanbots import Koreanbots
 
 
 @fixture(name="session")
 async def client():
     yield Koreanbots(api_key=getenv("API_KEY"))
+
+
+@fixture
+async def api_server(monkeypatch):
+    """
+    Serves a handler on the given API paths of a local server, and points
+    requesters created afterwards at it.
+    """
+    runners = []
+
+    async def start(handler, *paths):
+        app = web.Application()
+        for path in paths:
+            app.router.add_route("*", f"/api/v2{path}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        port = runner.addresses[0][1]
+        monkeypatch.setattr(
+            koreanbots.http, "KOREANBOTS_URL", f"http://127.0.0.1:{port}/api/v2"
+        )
+
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+@fixture
+async def status_server(api_server):
+    """
+    Answers /bots/{id} with the statuses appended to the yielded list, in
+    order, and with 200 once it is empty.
+    """
+    statuses = []
+
+    async def handler(request: web.Request) -> web.Response:
+        status = statuses.pop(0) if statuses else 200
+        return web.json_response({"code": status, "data": {}}, status=status)
+
+    await api_server(handler, "/bots/{id}")
+    yield statuses
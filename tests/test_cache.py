@@ -0,0 +1,125 @@
+from asyncio import sleep
+from time import sleep as sleep_sync
+from time import time
+
+import pytest
+
+from koreanbots.cache import ResponseCache, VoteCache
+from koreanbots.errors import NotFound
+from koreanbots.model import KoreanbotsVoteResponse
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_and_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        return key
+
+    for key in (1, 2, 1, 3, 1, 2):
+        assert await cache.get_or_fetch("bot", key, lambda: fetch(key)) == key
+
+    assert calls == [1, 2, 3, 2]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 4
+    assert cache.stats.evictions == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_negative_entry():
+    cache = ResponseCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        raise NotFound(404, {"code": 404, "message": "Not Found"})
+
+    errors = []
+    for _ in range(3):
+        with pytest.raises(NotFound) as info:
+            await cache.get_or_fetch("user", 1, fetch)
+        errors.append(info.value)
+
+    assert calls == 1
+    # Every hit raises its own exception with the original status and message.
+    assert len({id(error) for error in errors}) == 3
+    assert all(str(error) == "404 Not Found" for error in errors)
+    assert cache.stats.negative_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_stale_while_revalidate():
+    cache = ResponseCache(default_ttl=0.05, stale_ttl=10)
+    version = 0
+
+    async def fetch():
+        nonlocal version
+        version += 1
+        return version
+
+    assert await cache.get_or_fetch("server", 1, fetch) == 1
+    await sleep(0.1)
+    assert await cache.get_or_fetch("server", 1, fetch) == 1
+    await sleep(0)
+    assert await cache.get_or_fetch("server", 1, fetch) == 2
+    assert cache.stats.stale_hits == 1
+    assert cache.stats.refreshes == 1
+
+
+def test_vote_cache_keeps_vote_until_window_ends():
+    cache = VoteCache(window=60)
+    now = int(time() * 1000)
+
+    cache.set("bot", 1, 2, KoreanbotsVoteResponse(voted=True, last_vote=now - 30_000))
+
+    assert cache.get("bot", 1, 2) == KoreanbotsVoteResponse(True, now - 30_000)
+    assert cache.get("server", 1, 2) is None
+
+
+def test_vote_cache_never_inverts_vote():
+    cache = VoteCache(window=60, negative_ttl=0.05)
+    now = int(time() * 1000)
+
+    # The API still says voted past the window; cache that briefly, as is.
+    cache.set("bot", 3, 2, KoreanbotsVoteResponse(voted=True, last_vote=now - 90_000))
+
+    assert cache.get("bot", 3, 2) == KoreanbotsVoteResponse(True, now - 90_000)
+    sleep_sync(0.1)
+    assert cache.get("bot", 3, 2) is None
+
+
+def test_vote_cache_negative_ttl():
+    cache = VoteCache(negative_ttl=0.05)
+    cache.set("server", 1, 2, KoreanbotsVoteResponse(voted=False, last_vote=0))
+
+    assert cache.get("server", 1, 2) == KoreanbotsVoteResponse(False, 0)
+    sleep_sync(0.1)
+    assert cache.get("server", 1, 2) is None
+
+
+def test_vote_cache_eviction():
+    cache = VoteCache(max_size=100)
+    now = int(time() * 1000)
+
+    for user_id in range(150):
+        cache.set("bot", user_id, 1, KoreanbotsVoteResponse(True, now))
+
+    assert len(cache) <= 100
+    assert cache.get("bot", 149, 1) is not None
+    assert cache.get("bot", 0, 1) is None
+
+
+def test_vote_cache_rejects_unknown_vote_type():
+    cache = VoteCache()
+    response = KoreanbotsVoteResponse(True, int(time() * 1000))
+
+    with pytest.raises(ValueError):
+        cache.set("servers", 1, 2, response)
+    with pytest.raises(ValueError):
+        cache.get("servers", 1, 2)
+    with pytest.raises(ValueError):
+        cache.invalidate("servers", 1, 2)
+    assert len(cache) == 0
@@ -1,7 +1,17 @@
+from asyncio import TimeoutError, sleep
+from time import monotonic
+
 import pytest
 
 from koreanbots.client import Koreanbots
-from koreanbots.model import KoreanbotsBot, KoreanbotsUser
+from koreanbots.errors import NotFound
+from koreanbots.mock import MockKoreanbotsServer
+from koreanbots.model import (
+    KoreanbotsBot,
+    KoreanbotsResponse,
+    KoreanbotsUser,
+    KoreanbotsVoteResponse,
+)
 
 
 @pytest.mark.asyncio
@@ -37,3 +47,52 @@ async def test_get(session: Koreanbots):
         response
         == "https://koreanbots.dev/api/v2/widget/bots/votes/653534001742741552.svg?style=flat&scale=1.0&icon=False"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_bot_votes_many(monkeypatch: pytest.MonkeyPatch):
+    client = Koreanbots("token")
+    running = 0
+    peak = 0
+
+    async def get_bot_vote(user_id: int, bot_id: int, deadline=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await sleep(0.01)
+        running -= 1
+        if user_id % 10 == 0:
+            raise NotFound(404, {"code": 404, "message": "Not Found"})
+        return KoreanbotsResponse(200, 2, KoreanbotsVoteResponse(True, user_id))
+
+    monkeypatch.setattr(client, "get_bot_vote", get_bot_vote)
+
+    results = {
+        user_id: result
+        async for user_id, result in client.get_bot_votes_many(
+            range(1, 51), 653534001742741552, concurrency=5
+        )
+    }
+
+    assert len(results) == 50
+    assert peak == 5
+    assert isinstance(results[10], NotFound)
+    assert results[11].data.last_vote == 11
+
+
+@pytest.mark.asyncio
+async def test_votes_many_deadline_bounds_the_batch():
+    async with MockKoreanbotsServer(api_key="token", latency=0.2) as server:
+        client = Koreanbots("token", base_url=server.url)
+        start = monotonic()
+        results = {
+            user_id: result
+            async for user_id, result in client.get_server_votes_many(
+                range(6), 653083797763522580, concurrency=2, deadline=0.3
+            )
+        }
+        await client.close()
+
+    assert monotonic() - start < 0.5
+    assert not isinstance(results[0], Exception)
+    assert isinstance(results[5], TimeoutError)
@@ -0,0 +1,84 @@
+import sys
+from asyncio import sleep
+
+import pytest
+
+from koreanbots.cluster import ClusterAggregator
+
+
+@pytest.mark.asyncio
+async def test_leader_sums_worker_reports(tmp_path):
+    path = str(tmp_path / "cluster.sock")
+    leader = ClusterAggregator(path, "a", settle=0)
+    worker = ClusterAggregator(path, "b", settle=0)
+
+    await leader.report({"servers": 10, "shards": 4})
+    await worker.report({"servers": 5, "shards": 4})
+    await sleep(0.05)
+
+    assert leader.is_leader and leader.ready
+    assert not worker.is_leader
+    assert leader.totals() == {"servers": 15, "shards": 4}
+
+    # The worker takes over once the leader is gone.
+    await leader.close()
+    await worker.report({"servers": 5, "shards": 4})
+    assert worker.is_leader
+    assert worker.totals() == {"servers": 5, "shards": 4}
+    await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_workers_age_out(tmp_path):
+    path = str(tmp_path / "cluster.sock")
+    leader = ClusterAggregator(path, "a", stale_after=0.05)
+    worker = ClusterAggregator(path, "b")
+
+    await leader.report({"servers": 10})
+    await worker.report({"servers": 5})
+    await sleep(0.02)
+    assert leader.totals() == {"servers": 15}
+
+    await sleep(0.05)
+    await leader.report({"servers": 10})
+    assert leader.totals() == {"servers": 10}
+    await leader.close()
+    await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_malformed_counts_are_dropped(tmp_path):
+    path = str(tmp_path / "cluster.sock")
+    leader = ClusterAggregator(path, "a", settle=0)
+    workers = [ClusterAggregator(path, name, settle=0) for name in "bcde"]
+
+    await leader.report({"servers": 10})
+    for worker, counts in zip(
+        workers,
+        (
+            {"servers": "12"},
+            {"servers": True},
+            {"guilds": 3},
+            [12],
+        ),
+    ):
+        await worker.report(counts)
+    await sleep(0.05)
+
+    assert leader.totals() == {"servers": 10}
+    await leader.close()
+    for worker in workers:
+        await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_this_process_without_fcntl(tmp_path, monkeypatch):
+    # Importing a module mapped to None raises ImportError, as on Windows.
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    aggregator = ClusterAggregator(str(tmp_path / "cluster.sock"), "a")
+
+    await aggregator.report({"servers": 10, "shards": 2})
+
+    assert aggregator.is_leader and aggregator.ready
+    assert aggregator.totals() == {"servers": 10, "shards": 2}
+    await aggregator.close()
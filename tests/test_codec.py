@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from koreanbots.codec import JSONCodec
+
+
+def test_stdlib_codec_roundtrip():
+    codec = JSONCodec.from_name("json")
+    assert codec.loads(codec.dumps({"servers": 1})) == {"servers": 1}
+    assert codec.loads(b'{"code": 200}') == {"code": 200}
+
+
+def test_default_codec_falls_back():
+    codec = JSONCodec.from_name()
+    assert codec.name in ("orjson", "ujson", "json")
+    assert json.loads(codec.dumps({"shards": 2})) == {"shards": 2}
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        JSONCodec.from_name("pickle")  # type: ignore
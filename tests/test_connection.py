@@ -0,0 +1,49 @@
+import pytest
+from aiohttp import web
+from pytest_asyncio import fixture
+
+from koreanbots.connection import ConnectionStats, create_session
+from koreanbots.http import KoreanbotsRequester
+
+
+@fixture
+async def server(api_server):
+    tokens = []
+
+    async def handler(request: web.Request) -> web.Response:
+        tokens.append(request.headers.get("Authorization"))
+        return web.json_response({"code": 200, "version": 2, "data": {}})
+
+    await api_server(handler, "/users/{id}")
+    yield tokens
+
+
+@pytest.mark.asyncio
+async def test_shared_session_sends_each_token(server):
+    stats = ConnectionStats()
+    session = create_session(stats=stats)
+    first = KoreanbotsRequester("first", session)
+    second = KoreanbotsRequester("second", session)
+
+    await first.request("GET", "/users/1")
+    await second.request("GET", "/users/1")
+    await first.request("GET", "/users/2")
+
+    assert server == ["first", "second", "first"]
+    assert stats.created == 1
+    assert stats.reused == 2
+
+    # A session passed in belongs to the caller.
+    await first.close()
+    assert not session.closed
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_owned_session_is_closed(server):
+    requester = KoreanbotsRequester("token")
+    await requester.request("GET", "/users/1")
+
+    assert requester.connection_stats.created == 1
+    await requester.close()
+    assert requester.session is not None and requester.session.closed
@@ -0,0 +1,83 @@
+import pickle
+
+from benchmarks.payloads import make_bot_response, make_server_response, make_user
+from koreanbots.decoder import LazySequence
+from koreanbots.model import (
+    CircularKoreanbotsBot,
+    CircularKoreanbotsServer,
+    CircularKoreanbotsUser,
+    Emoji,
+    KoreanbotsBotResponse,
+    KoreanbotsServerResponse,
+    KoreanbotsUserResponse,
+    KoreanbotsVoteResponse,
+)
+
+
+def test_decode_nested_models():
+    user = KoreanbotsUserResponse.from_dict(make_user(bots=2, servers=3, emojis=4))
+
+    assert len(user.bots) == 2
+    assert isinstance(user.bots[0], CircularKoreanbotsBot)
+    assert user.bots[0].owners == (user.id,)
+    assert isinstance(user.servers[2].emojis[3], Emoji)
+    assert user.servers[0].owner == user.id
+
+    bot = KoreanbotsBotResponse.from_dict(make_bot_response(owners=2))
+    assert isinstance(bot.owners[1], CircularKoreanbotsUser)
+    assert isinstance(bot.owners[1].bots, tuple)
+
+    server = KoreanbotsServerResponse.from_dict(make_server_response())
+    assert isinstance(server.owner, CircularKoreanbotsUser)
+
+
+def test_decode_interns_repeated_strings():
+    first = KoreanbotsUserResponse.from_dict(make_user(bots=1, servers=0))
+    second = KoreanbotsUserResponse.from_dict(make_user(bots=1, servers=0))
+
+    assert first.bots[0].lib is second.bots[0].lib
+    assert first.bots[0].category == second.bots[0].category
+    assert all(a is b for a, b in zip(first.bots[0].category, second.bots[0].category))
+
+
+def test_decode_interns_only_strings():
+    first = KoreanbotsBotResponse.from_dict(
+        {**make_bot_response(), "category": ["관리", "뮤직", 1]}
+    )
+    second = KoreanbotsBotResponse.from_dict(
+        {**make_bot_response(), "category": ["".join(["관", "리"])]}
+    )
+
+    assert first.category == ("관리", "뮤직", 1)
+    assert first.category[0] is second.category[0]
+
+    server = KoreanbotsServerResponse.from_dict(
+        {**make_server_response(), "category": {"id": 1}}
+    )
+    assert server.category == {"id": 1}
+
+
+def test_decode_tolerates_missing_and_unknown_fields():
+    vote = KoreanbotsVoteResponse.from_dict(
+        {"voted": True, "lastVote": 1635591600000, "unknown": 1}
+    )
+    assert vote == KoreanbotsVoteResponse(voted=True, last_vote=1635591600000)
+
+    user = KoreanbotsUserResponse.from_dict({"id": "1", "bots": None})
+    assert user.bots == ()
+    assert user.username == ""
+
+
+def test_lazy_decode():
+    user = KoreanbotsUserResponse.from_dict(make_user(bots=3, servers=2), lazy=True)
+
+    assert isinstance(user.bots, LazySequence)
+    assert len(user.bots) == 3
+    assert not user.bots.decoded
+    assert isinstance(user.servers[1], CircularKoreanbotsServer)
+    assert isinstance(user.servers[1].emojis[0], Emoji)
+    assert not user.bots.decoded
+
+    eager = KoreanbotsUserResponse.from_dict(make_user(bots=3, servers=2))
+    assert user.bots == eager.bots
+    assert pickle.loads(pickle.dumps(user)).bots == eager.bots
@@ -0,0 +1,19 @@
+import pytest
+
+from koreanbots.client import Koreanbots
+
+
+@pytest.mark.asyncio
+async def test_strict_literal_rejects_invalid_values():
+    client = Koreanbots()
+
+    assert await client.get_widget("servers", 1, style="classic")
+
+    with pytest.raises(ValueError):
+        await client.get_widget("invalid", 1)
+
+    with pytest.raises(ValueError):
+        await client.get_widget("votes", 1, style="invalid")
+
+    with pytest.raises(ValueError):
+        await client.get_bot_widget_url(widget_type=["votes"], bot_id=1)
@@ -0,0 +1,86 @@
+from asyncio import Event, gather, get_running_loop, sleep
+
+import pytest
+from aiohttp import ClientSession
+
+from koreanbots.http import KoreanbotsRequester
+
+
+class CountingRequester(KoreanbotsRequester):
+    def __init__(self) -> None:
+        super().__init__("token")
+        self.calls = 0
+        self.release = Event()
+
+    async def _request(self, method, endpoint, raw=False, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        return {"endpoint": endpoint, **kwargs}
+
+
+@pytest.mark.asyncio
+async def test_identical_get_requests_are_coalesced():
+    requester = CountingRequester()
+    waiters = [
+        requester.request("GET", "/bots/1/vote", params={"userID": 1})
+        for _ in range(10)
+    ]
+    other = requester.request("GET", "/bots/1/vote", params={"userID": 2})
+
+    get_running_loop().call_soon(requester.release.set)
+    results = await gather(*waiters, other)
+
+    assert requester.calls == 2
+    assert results[0] is results[9]
+    assert results[10]["params"] == {"userID": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_request():
+    requester = CountingRequester()
+    loop = get_running_loop()
+    first = loop.create_task(requester.request("GET", "/bots/1"))
+    second = loop.create_task(requester.request("GET", "/bots/1"))
+    await sleep(0)
+
+    first.cancel()
+    requester.release.set()
+
+    assert await second == {"endpoint": "/bots/1"}
+    assert first.cancelled()
+    assert requester.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_request_after_last_waiter_cancels_starts_anew():
+    requester = CountingRequester()
+    first = get_running_loop().create_task(requester.request("GET", "/bots/1"))
+    await sleep(0)
+
+    first.cancel()
+    await sleep(0)
+    # The shared task is still cancelling; a new request must not join it.
+    get_running_loop().call_soon(requester.release.set)
+    assert await requester.request("GET", "/bots/1") == {"endpoint": "/bots/1"}
+    assert first.cancelled()
+    assert requester.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_raw_and_parsed_requests_are_not_coalesced():
+    requester = CountingRequester()
+    get_running_loop().call_soon(requester.release.set)
+
+    await gather(requester.get_bot_info(1), requester.get_bot_info(1, output="raw"))
+
+    assert requester.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_passed_session_is_closed_only_when_owned():
+    async with ClientSession() as shared:
+        await KoreanbotsRequester("token", shared).close()
+        assert not shared.closed
+
+        await KoreanbotsRequester("token", shared, owns_session=True).close()
+        assert shared.closed
@@ -0,0 +1,81 @@
+from asyncio import sleep
+from types import SimpleNamespace
+
+import pytest
+
+import koreanbots.integrations.base
+from koreanbots.integrations.discord import DiscordpyKoreanbots
+from koreanbots.integrations.poster import GuildCountPolicy
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.user = None
+        self.guilds = [object()] * 3
+        self.shard_count = None
+        self.closed = False
+
+    async def wait_until_ready(self) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def event(self, coro):
+        return coro
+
+
+class RecordingKoreanbots(DiscordpyKoreanbots):
+    def __init__(self, client) -> None:
+        super().__init__(
+            client, "token", post_policy=GuildCountPolicy(check_interval=0.01)
+        )
+        self.lookups = 0
+        self.posts = []
+
+    def get_client_bot_id(self):
+        self.lookups += 1
+        return super().get_client_bot_id()
+
+    async def post_guild_count(self, bot_id, **kwargs):
+        self.posts.append((bot_id, kwargs))
+
+
+@pytest.mark.asyncio
+async def test_task_waits_for_user_without_spinning(monkeypatch):
+    monkeypatch.setattr(koreanbots.integrations.base, "_IDLE_RETRY", 0.05)
+    client = FakeClient()
+    kb = RecordingKoreanbots(client)
+
+    kb.run_post_guild_count_task()
+    await sleep(0.12)
+    assert kb.lookups <= 4
+    assert kb.posts == []
+
+    client.user = SimpleNamespace(id="1")
+    await sleep(0.1)
+    # Unchanged counts are only posted once.
+    assert kb.posts == [(1, {"servers": 3})]
+
+    await client.close()
+    assert not kb.is_running
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_task_immediately():
+    client = FakeClient()
+    client.user = SimpleNamespace(id="1")
+    kb = RecordingKoreanbots(client)
+    kb.post_policy = GuildCountPolicy(check_interval=3600)
+
+    kb.run_post_guild_count_task()
+    await sleep(0)
+    await sleep(0)
+    assert kb.is_running
+
+    await client.close()
+    assert not kb.is_running
+    assert client.closed
@@ -0,0 +1,78 @@
+import pytest
+
+from koreanbots.errors import NotFound
+from koreanbots.http import KoreanbotsRequester
+from koreanbots.metrics import Histogram, RequestMetrics
+from koreanbots.retry import RetryPolicy
+
+
+def test_histogram_is_cumulative():
+    histogram = Histogram((0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.65)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded(status_server):
+    metrics = RequestMetrics()
+    requester = KoreanbotsRequester(
+        "token",
+        retry_policies={"GET": RetryPolicy(base=0.01, cap=0.01)},
+        metrics=metrics,
+    )
+    status_server.extend([503, 200, 404])
+
+    await requester.get_bot_info(1)
+    with pytest.raises(NotFound):
+        await requester.get_bot_info(2)
+    await requester.close()
+
+    snapshot = metrics.snapshot()["GET /bots/{id}"]
+    assert snapshot.requests == 3
+    assert snapshot.statuses == {200: 1, 404: 1, 503: 1}
+    assert snapshot.retries == 1
+    assert snapshot.latency.count == 3
+    assert snapshot.bytes > 0
+    assert snapshot.decode_seconds > 0
+    # Retried responses aren't decoded.
+    assert snapshot.decode.count == 2
+    assert requester.decode_stats["GET /bots/{id}"] == snapshot.decode
+
+    # Snapshots don't change with later requests.
+    metrics.get("GET /bots/{id}").requests += 1
+    assert snapshot.requests == 3
+
+
+def test_prometheus_format():
+    metrics = RequestMetrics(buckets=(0.5,))
+    endpoint = metrics.get('GET /bots/{id}"')
+    endpoint.statuses[200] = 2
+    endpoint.latency.observe(0.1)
+    endpoint.rate_limit_wait = 1.5
+
+    text = metrics.to_prometheus()
+    assert "# TYPE koreanbots_requests_total counter" in text
+    assert 'koreanbots_requests_total{route="GET /bots/{id}\\"",status="200"} 2' in text
+    assert (
+        'koreanbots_request_duration_seconds_bucket{route="GET /bots/{id}\\"",le="+Inf"} 1'
+        in text
+    )
+    assert (
+        'koreanbots_rate_limit_wait_seconds_total{route="GET /bots/{id}\\""} 1.5'
+        in text
+    )
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_recorded_without_metrics(status_server):
+    requester = KoreanbotsRequester("token")
+    status_server.append(200)
+
+    await requester.get_bot_info(1)
+    await requester.close()
+
+    assert requester.decode_stats == {}
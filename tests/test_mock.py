@@ -0,0 +1,73 @@
+import pytest
+from pytest_asyncio import fixture
+
+from koreanbots.client import Koreanbots
+from koreanbots.errors import HTTPException, NotFound
+from koreanbots.mock import MockKoreanbotsServer
+from koreanbots.model import KoreanbotsBotResponse
+from koreanbots.retry import NO_RETRY
+
+
+@fixture
+async def server():
+    async with MockKoreanbotsServer(api_key="token", voters=[1]) as server:
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_endpoints(server: MockKoreanbotsServer):
+    kb = Koreanbots("token", base_url=server.url)
+
+    bot = await kb.get_bot_info(653534001742741552)
+    assert isinstance(bot.data, KoreanbotsBotResponse)
+    assert bot.data.id == "653534001742741552"
+    assert (await kb.get_user_info(285185716240252929)).data.bots
+    assert (await kb.get_server_info(653083797763522580)).data.emojis
+    assert (await kb.get_bot_vote(1, 653534001742741552)).data.voted
+    assert not (await kb.get_server_vote(2, 653083797763522580)).data.voted
+
+    await kb.post_guild_count(653534001742741552, servers=10, shards=2)
+    assert server.guild_counts[653534001742741552] == {"servers": 10, "shards": 2}
+    assert server.requests["GET /bots/{id}"] == 1
+    await kb.close()
+
+
+@pytest.mark.asyncio
+async def test_invalid_requests(server: MockKoreanbotsServer):
+    kb = Koreanbots("wrong", base_url=server.url)
+    with pytest.raises(HTTPException) as error:
+        await kb.get_bot_info(1)
+    assert error.value.status == 401
+
+    kb.api_key = "token"
+    with pytest.raises(NotFound):
+        await kb.request("GET", "/bots/abc")
+    await kb.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers():
+    async with MockKoreanbotsServer(
+        route_limits={"GET /bots/{id}": 2}, window=0.5
+    ) as server:
+        kb = Koreanbots("token", base_url=server.url)
+        await kb.get_bot_info(1)
+        bucket = kb.ratelimiter.get_bucket("GET /bots/{id}")
+        assert bucket.limit == 2
+        assert bucket.remaining == 1
+
+        # The third request is throttled or retried after a 429, but succeeds.
+        for _ in range(2):
+            await kb.get_bot_info(1)
+        assert server.requests["GET /bots/{id}"] >= 3
+        await kb.close()
+
+
+@pytest.mark.asyncio
+async def test_error_injection():
+    async with MockKoreanbotsServer(error_rate=1, error_status=503, seed=0) as server:
+        kb = Koreanbots("token", base_url=server.url, retry_policies={"GET": NO_RETRY})
+        with pytest.raises(HTTPException) as error:
+            await kb.get_bot_info(1)
+        assert error.value.status == 503
+        await kb.close()
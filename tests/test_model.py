@@ -0,0 +1,82 @@
+import pickle
+from dataclasses import FrozenInstanceError, fields
+
+import pytest
+
+from benchmarks.payloads import make_bot_response, make_server_response, make_user
+from koreanbots.decoder import LazySequence
+from koreanbots.model import (
+    KoreanbotsBot,
+    KoreanbotsBotResponse,
+    KoreanbotsResponse,
+    KoreanbotsServer,
+    KoreanbotsServerResponse,
+    KoreanbotsUser,
+    KoreanbotsUserResponse,
+    KoreanbotsVoteEvent,
+    KoreanbotsVoteResponse,
+)
+
+
+def make_models():
+    user = KoreanbotsUserResponse.from_dict(make_user(bots=2, servers=2, emojis=2))
+    bot = KoreanbotsBotResponse.from_dict(make_bot_response(owners=2))
+    server = KoreanbotsServerResponse.from_dict(make_server_response())
+    return [
+        user,
+        KoreanbotsUserResponse.from_dict(make_user(bots=2, servers=2), lazy=True),
+        user.bots[0],
+        user.servers[0],
+        user.servers[0].emojis[0],
+        bot,
+        bot.owners[0],
+        server,
+        KoreanbotsBot.from_dict(make_bot_response()),
+        KoreanbotsUser.from_dict(make_user()),
+        KoreanbotsServer.from_dict(make_server_response()),
+        KoreanbotsVoteResponse(voted=True, last_vote=1635591600000),
+        KoreanbotsVoteEvent("bot", "1", "2", 0, 1, 1700000000000, "delivery"),
+        KoreanbotsResponse(200, 2, bot),
+    ]
+
+
+def state(model):
+    return [getattr(model, f.name) for f in fields(model)]
+
+
+@pytest.mark.parametrize("model", make_models(), ids=lambda m: type(m).__name__)
+def test_models_are_frozen(model):
+    name = fields(model)[0].name
+
+    with pytest.raises(FrozenInstanceError):
+        setattr(model, name, None)
+    with pytest.raises(FrozenInstanceError):
+        delattr(model, name)
+
+
+@pytest.mark.parametrize("model", make_models(), ids=lambda m: type(m).__name__)
+def test_models_have_no_dict(model):
+    assert not hasattr(model, "__dict__")
+    # Even bypassing the frozen __setattr__, there is nowhere to put a new name.
+    with pytest.raises(AttributeError):
+        object.__setattr__(model, "unknown", 1)
+
+
+@pytest.mark.parametrize("model", make_models(), ids=lambda m: type(m).__name__)
+def test_models_pickle_round_trip(model):
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert type(restored) is type(model)
+    # Many fields are excluded from ==, so compare every field.
+    assert state(restored) == state(model)
+
+
+def test_lazy_fields_pickle_as_decoded_items():
+    user = KoreanbotsUserResponse.from_dict(make_user(bots=2, servers=2), lazy=True)
+    assert isinstance(user.bots, LazySequence) and not user.bots.decoded
+
+    restored = pickle.loads(pickle.dumps(user))
+
+    assert isinstance(restored.bots, tuple)
+    assert restored.bots == user.bots
+    assert restored.servers[0].emojis == user.servers[0].emojis
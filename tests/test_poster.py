@@ -0,0 +1,69 @@
+from koreanbots.integrations.poster import GuildCountPolicy, GuildCountPoster
+
+POLICY = GuildCountPolicy(
+    min_interval=300,
+    max_interval=1800,
+    threshold=0.05,
+    debounce=30,
+    retry_base=10,
+    retry_max=100,
+)
+
+
+def test_unchanged_counts_are_not_posted():
+    poster = GuildCountPoster(POLICY)
+    assert poster.should_post({"servers": 100}, now=0)
+    poster.posted({"servers": 100}, now=0)
+
+    assert not poster.should_post({"servers": 100}, now=10_000)
+
+
+def test_small_change_waits_for_interval():
+    poster = GuildCountPoster(POLICY)
+    poster.posted({"servers": 100}, now=0)
+
+    assert not poster.should_post({"servers": 101}, now=600)
+    assert poster.should_post({"servers": 101}, now=1800)
+
+
+def test_large_change_is_debounced_and_posted_early():
+    poster = GuildCountPoster(POLICY)
+    poster.posted({"servers": 100}, now=0)
+
+    assert not poster.should_post({"servers": 150}, now=400)
+    # Changes within the debounce are posted together.
+    assert not poster.should_post({"servers": 160}, now=420)
+    assert poster.should_post({"servers": 160}, now=450)
+
+    poster.posted({"servers": 160}, now=450)
+    assert poster.interval == 900
+
+
+def test_failure_backs_off_with_jitter():
+    poster = GuildCountPoster(POLICY)
+    delays = [poster.failed(now=0) for _ in range(5)]
+
+    assert 5 <= delays[0] <= 10
+    assert 50 <= delays[4] <= 100
+    assert not poster.should_post({"servers": 1}, now=delays[4] - 1)
+    assert poster.should_post({"servers": 1}, now=delays[4])
+
+
+def test_growing_count_is_still_posted():
+    poster = GuildCountPoster(POLICY)
+    poster.posted({"servers": 1000}, now=0)
+
+    posts = []
+    servers = 1000
+    for now in range(60, 4 * 3600, 60):
+        servers += 100
+        if poster.should_post({"servers": servers}, now=now):
+            poster.posted({"servers": servers}, now=now)
+            posts.append(now)
+
+    # The count never settles, but it is still posted: early while the changes
+    # are large, and at least every max_interval once they become small.
+    gaps = [b - a for a, b in zip([0] + posts, posts)]
+    assert gaps[0] <= POLICY.min_interval + 60
+    assert max(gaps) <= POLICY.max_interval
+    assert 4 * 3600 - posts[-1] <= POLICY.max_interval
@@ -0,0 +1,71 @@
+from asyncio import sleep
+from time import monotonic
+
+import pytest
+from aiohttp import web
+from pytest_asyncio import fixture
+
+from koreanbots.publisher import StatsPublisher
+
+
+@fixture
+async def server(api_server):
+    posts = []
+
+    async def handler(request: web.Request) -> web.Response:
+        body = await request.json()
+        posts.append(
+            (
+                int(request.match_info["id"]),
+                request.headers["Authorization"],
+                body,
+                monotonic(),
+            )
+        )
+        if body["servers"] < 0:
+            return web.json_response({"code": 400, "message": "Bad"}, status=400)
+        return web.json_response({"code": 200, "version": 2, "message": "OK"})
+
+    await api_server(handler, "/bots/{id}/stats")
+    yield posts
+
+
+@pytest.mark.asyncio
+async def test_publish_all_records_status(server):
+    async def shards():
+        return {"servers": 20, "shards": 2}
+
+    publisher = StatsPublisher()
+    publisher.add(1, "first", lambda: 10)
+    publisher.add(2, "second", shards)
+    publisher.add(3, "first", lambda: -1)
+
+    status = await publisher.publish_all()
+    await publisher.close()
+
+    assert sorted((p[0], p[1], p[2]) for p in server) == [
+        (1, "first", {"servers": 10}),
+        (2, "second", {"servers": 20, "shards": 2}),
+        (3, "first", {"servers": -1}),
+    ]
+    assert status[1].successes == 1 and status[1].last_duration is not None
+    assert status[3].failures == 1 and status[3].last_error is not None
+    # Bots sharing a token share its rate limiter.
+    assert publisher._entries[1].requester.ratelimiter is (
+        publisher._entries[3].requester.ratelimiter
+    )
+
+
+@pytest.mark.asyncio
+async def test_posts_are_staggered(server):
+    publisher = StatsPublisher(interval=0.3)
+    for bot_id in range(3):
+        publisher.add(bot_id, "token", lambda: 1)
+
+    publisher.start()
+    await sleep(0.25)
+    await publisher.close()
+
+    assert [p[0] for p in server] == [0, 1, 2]
+    gaps = [b[3] - a[3] for a, b in zip(server, server[1:])]
+    assert all(gap > 0.05 for gap in gaps)
@@ -0,0 +1,72 @@
+from asyncio import gather
+from time import time
+
+import pytest
+
+from koreanbots.ratelimit import RateLimiter, get_route
+
+
+def test_get_route():
+    assert get_route("GET", "/bots/653534001742741552/vote") == "GET /bots/{id}/vote"
+    assert get_route("POST", "/bots/653534001742741552/stats") == "POST /bots/{id}/stats"
+    assert get_route("GET", "/users/285185716240252929") == "GET /users/{id}"
+
+
+@pytest.mark.asyncio
+async def test_buckets_are_separated_by_route():
+    ratelimiter = RateLimiter()
+    vote = ratelimiter.get_bucket(get_route("GET", "/bots/1/vote"))
+    stats = ratelimiter.get_bucket(get_route("POST", "/bots/1/stats"))
+
+    vote.exhaust({"x-ratelimit-reset": str(time() + 60)})
+
+    assert await stats.acquire() == 0
+    assert ratelimiter.snapshot()["GET /bots/{id}/vote"].remaining == 0
+    assert ratelimiter.snapshot()["POST /bots/{id}/stats"].remaining is None
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_until_reset():
+    bucket = RateLimiter().get_bucket("GET /bots/{id}")
+    bucket.update(
+        {
+            "x-ratelimit-limit": "10",
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": str(time() + 0.2),
+        }
+    )
+
+    assert await bucket.acquire() > 0
+    assert bucket.remaining == 10
+
+
+@pytest.mark.asyncio
+async def test_bucket_spreads_remaining_requests():
+    bucket = RateLimiter().get_bucket("GET /bots/{id}")
+    bucket.update(
+        {
+            "x-ratelimit-limit": "10",
+            "x-ratelimit-remaining": "2",
+            "x-ratelimit-reset": str(time() + 0.4),
+        }
+    )
+
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() > 0
+
+
+@pytest.mark.asyncio
+async def test_bucket_wait_includes_time_queued_behind_others():
+    bucket = RateLimiter().get_bucket("GET /bots/{id}")
+    bucket.update(
+        {
+            "x-ratelimit-limit": "10",
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": str(time() + 0.2),
+        }
+    )
+
+    waits = await gather(*(bucket.acquire() for _ in range(5)))
+
+    # Every caller was held until the reset, not only the one that slept.
+    assert all(wait > 0.1 for wait in waits)
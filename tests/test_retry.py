@@ -0,0 +1,125 @@
+from asyncio import TimeoutError
+from asyncio import sleep as async_sleep
+from time import monotonic, sleep
+
+import pytest
+from aiohttp import web
+from pytest_asyncio import fixture
+
+from koreanbots.errors import CircuitOpenError, HTTPException
+from koreanbots.http import KoreanbotsRequester
+from koreanbots.retry import CircuitBreaker, HedgePolicy, RetryBudget, RetryPolicy
+
+FAST = RetryPolicy(max_attempts=3, base=0.01, cap=0.01)
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    sleep(0.05)
+    assert breaker.state == "half_open"
+    breaker.before_request()
+    # Only one probe is let through at a time.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried(status_server):
+    requester = KoreanbotsRequester("token", retry_policies={"GET": FAST})
+    status_server.extend([503, 502])
+
+    assert await requester.request("GET", "/bots/1") == {"code": 200, "data": {}}
+    await requester.close()
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_without_policy(status_server):
+    requester = KoreanbotsRequester("token", retry_policies={"GET": FAST})
+    status_server.append(503)
+
+    with pytest.raises(HTTPException):
+        await requester.request("POST", "/bots/1", json={})
+    await requester.close()
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures(status_server):
+    requester = KoreanbotsRequester(
+        "token",
+        retry_policies={},
+        circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+    status_server.extend([500, 500])
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await requester.request("GET", "/bots/1")
+    with pytest.raises(CircuitOpenError):
+        await requester.request("GET", "/bots/1")
+    assert requester.circuit_breaker.state == "open"
+    await requester.close()
+
+
+@fixture
+async def slow_server(api_server):
+    delays = []
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        await async_sleep(delays.pop(0) if delays else 0)
+        return web.json_response({"code": 200, "data": {}})
+
+    await api_server(handler, "/bots/{id}")
+    yield delays, hits
+
+
+def test_hedge_delay_uses_percentile():
+    policy = HedgePolicy(percentile=0.9, min_delay=0.01, max_delay=1, min_samples=10)
+    assert policy.delay([0.1] * 5) == 1
+    assert policy.delay([0.1] * 9 + [0.5]) == 0.5
+    assert policy.delay([0.001] * 10) == 0.01
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_enforced(slow_server):
+    delays, _ = slow_server
+    requester = KoreanbotsRequester("token")
+    delays.append(1)
+
+    start = monotonic()
+    with pytest.raises(TimeoutError):
+        await requester.get_bot_info(1, deadline=0.1)
+    assert monotonic() - start < 0.5
+    await requester.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_get_is_hedged(slow_server):
+    delays, hits = slow_server
+    requester = KoreanbotsRequester("token", hedge_policy=HedgePolicy(max_delay=0.05))
+    delays.extend([1, 0])
+
+    start = monotonic()
+    assert await requester.get_bot_info(1) == {"code": 200, "data": {}}
+    assert monotonic() - start < 0.5
+    assert len(hits) == 2
+    await requester.close()
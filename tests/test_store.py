@@ -0,0 +1,84 @@
+from asyncio import gather
+
+import pytest
+
+from koreanbots.model import KoreanbotsVoteEvent
+from koreanbots.store import VoteEventStore
+
+
+def make_event(user_id: int) -> KoreanbotsVoteEvent:
+    return KoreanbotsVoteEvent("bot", "1", str(user_id), 0, 1, 1700000000000)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_stored_once(tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"))
+
+    ids = await gather(*(store.put(make_event(i % 10)) for i in range(30)))
+
+    assert len([i for i in ids if i is not None]) == 10
+    assert [event for _, event in await store.pending()] == [
+        make_event(i) for i in range(10)
+    ]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_unacked_events_are_replayed_after_reopen(tmp_path):
+    path = str(tmp_path / "votes.db")
+    store = VoteEventStore(path)
+    first = await store.put(make_event(1))
+    await store.put(make_event(2))
+    assert first is not None
+    await store.ack(first)
+    await store.close()
+
+    store = VoteEventStore(path)
+    pending = await store.pending()
+    assert [event.user_id for _, event in pending] == ["2"]
+    # Acknowledged events still count as duplicates.
+    assert await store.put(make_event(1)) is None
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_inserts_are_batched(tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"), batch_size=500)
+
+    ids = await gather(*(store.put(make_event(i)) for i in range(5000)))
+
+    assert len(set(ids)) == 5000
+    assert len(await store.pending(limit=100)) == 100
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_puts_open_once(tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"))
+    opened = []
+    open_connection = store._open
+
+    def counting_open():
+        opened.append(True)
+        open_connection()
+
+    store._open = counting_open
+    await gather(*(store.put(make_event(i)) for i in range(10)))
+
+    assert len(opened) == 1
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_events_move_to_dead_letters(tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"), max_attempts=3, retention=0)
+    row_id = await store.put(make_event(1))
+    assert row_id is not None
+
+    assert [await store.fail(row_id) for _ in range(3)] == [False, False, True]
+    assert await store.pending() == []
+    assert await store.dead_letters() == [(row_id, make_event(1))]
+
+    await store.prune()
+    assert await store.dead_letters() == []
+    await store.close()
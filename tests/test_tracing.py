@@ -0,0 +1,67 @@
+import pytest
+
+from koreanbots.http import KoreanbotsRequester
+from koreanbots.retry import RetryPolicy
+from koreanbots.tracing import OpenTelemetryExporter, RequestTracer
+
+
+@pytest.mark.asyncio
+async def test_spans_record_phases(status_server):
+    spans = []
+    requester = KoreanbotsRequester(
+        "token",
+        retry_policies={"GET": RetryPolicy(base=0.01, cap=0.01)},
+        tracer=RequestTracer(spans.append),
+    )
+    status_server.append(503)
+
+    await requester.get_bot_info(1)
+    await requester.close()
+
+    assert [(span.route, span.attempt, span.status) for span in spans] == [
+        ("GET /bots/{id}", 1, 503),
+        ("GET /bots/{id}", 2, 200),
+    ]
+    first, second = spans
+    assert {"connect", "wait", "read"} <= set(first.phases)
+    # The second attempt reuses the connection.
+    assert "connect" not in second.phases
+    for span in spans:
+        assert span.end is not None and span.duration >= 0
+        for start, end in span.phases.values():
+            assert span.start <= start <= end <= span.end
+
+
+@pytest.mark.asyncio
+async def test_callback_errors_are_ignored(status_server):
+    def callback(span):
+        raise RuntimeError
+
+    requester = KoreanbotsRequester("token", tracer=RequestTracer(callback))
+    assert await requester.get_bot_info(1) == {"code": 200, "data": {}}
+    await requester.close()
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_exporter(status_server):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    requester = KoreanbotsRequester(
+        "token",
+        tracer=RequestTracer(OpenTelemetryExporter(provider.get_tracer("test"))),
+    )
+
+    await requester.get_bot_info(1)
+    await requester.close()
+
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert "GET /bots/{id}" in names
+    assert "wait" in names
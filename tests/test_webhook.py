@@ -0,0 +1,256 @@
+import sqlite3
+from asyncio import Event, gather, sleep
+
+import pytest
+from aiohttp import ClientSession
+
+from koreanbots.store import VoteEventStore
+from koreanbots.webhook import WebhookServer
+
+PAYLOAD = {
+    "type": "bot",
+    "botID": "653534001742741552",
+    "data": {"userID": "285185716240252929", "before": 1, "after": 2},
+    "timestamp": 1700000000000,
+}
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.events = []
+
+    def dispatch(self, name, *args):
+        self.events.append((name, *args))
+
+
+@pytest.mark.asyncio
+async def test_vote_is_verified_and_dispatched(unused_tcp_port):
+    client = FakeClient()
+    webhook = WebhookServer("secret", client=client)
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession() as session:
+        async with session.post(url, json=PAYLOAD) as response:
+            assert response.status == 401
+        async with session.post(
+            url, data=b"{", headers={"Authorization": "secret"}
+        ) as response:
+            assert response.status == 400
+        async with session.post(
+            url, json=PAYLOAD, headers={"Authorization": "secret"}
+        ) as response:
+            assert response.status == 200
+    await webhook.close()
+
+    assert len(received) == 1
+    event = received[0]
+    assert event.type == "bot"
+    assert event.target_id == "653534001742741552"
+    assert event.user_id == "285185716240252929"
+    assert event.after == 2
+    assert client.events == [("koreanbots_vote", event)]
+    assert webhook.stats.unauthorized == 1 and webhook.stats.malformed == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_with_503(unused_tcp_port):
+    release = Event()
+    webhook = WebhookServer("secret", max_queue=1)
+
+    @webhook.handler
+    async def on_vote(event):
+        await release.wait()
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    statuses = []
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        for _ in range(3):
+            async with session.post(url, json=PAYLOAD) as response:
+                statuses.append(response.status)
+            await sleep(0.01)
+
+    assert statuses == [200, 200, 503]
+    release.set()
+    await webhook.close()
+    assert webhook.stats.handled == 2 and webhook.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_events_are_deduplicated_and_replayed(unused_tcp_port, tmp_path):
+    path = str(tmp_path / "votes.db")
+    webhook = WebhookServer("secret", store=VoteEventStore(path))
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+        if len(received) == 1:
+            raise RuntimeError
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        for _ in range(2):
+            async with session.post(url, json=PAYLOAD) as response:
+                assert response.status == 200
+    await webhook.close()
+
+    assert len(received) == 1
+    assert webhook.stats.duplicates == 1
+
+    # The failed event was never acknowledged, so it is delivered again.
+    webhook = WebhookServer("secret", store=VoteEventStore(path))
+    webhook.handler(on_vote)
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    await webhook.close()
+    assert len(received) == 2 and received[0] == received[1]
+
+
+@pytest.mark.asyncio
+async def test_burst_never_stores_rejected_events(unused_tcp_port, tmp_path):
+    release = Event()
+    store = VoteEventStore(str(tmp_path / "votes.db"), flush_interval=0.05)
+    webhook = WebhookServer("secret", max_queue=2, store=store)
+
+    @webhook.handler
+    async def on_vote(event):
+        await release.wait()
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+
+    async def post(session, timestamp):
+        async with session.post(
+            url, json={**PAYLOAD, "timestamp": timestamp}
+        ) as response:
+            return response.status
+
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        statuses = await gather(*(post(session, i) for i in range(1, 7)))
+
+    assert set(statuses) <= {200, 503} and 503 in statuses
+    # Only the accepted events were saved, so rejected ones can be redelivered.
+    assert len(await store.pending()) == statuses.count(200)
+    release.set()
+    await webhook.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_events_are_retried_while_running(unused_tcp_port, tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"))
+    webhook = WebhookServer("secret", store=store, retry_interval=0.05)
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+        if len(received) == 1:
+            raise RuntimeError
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        async with session.post(url, json=PAYLOAD) as response:
+            assert response.status == 200
+    await sleep(0.2)
+
+    assert len(received) == 2 and received[0] == received[1]
+    assert await store.pending() == []
+    await webhook.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_ack_does_not_stop_the_worker(unused_tcp_port, tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"))
+    webhook = WebhookServer("secret", store=store)
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+
+    async def ack(*ids):
+        raise sqlite3.OperationalError("database is locked")
+
+    store.ack = ack
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        for timestamp in range(1, 3):
+            async with session.post(
+                url, json={**PAYLOAD, "timestamp": timestamp}
+            ) as response:
+                assert response.status == 200
+            await sleep(0.05)
+    await webhook.close()
+
+    assert len(received) == 2
+    assert webhook.stats.handled == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_event_is_retried_up_to_max_attempts(unused_tcp_port, tmp_path):
+    store = VoteEventStore(str(tmp_path / "votes.db"), max_attempts=3)
+    webhook = WebhookServer("secret", store=store, retry_interval=0.02)
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+        raise RuntimeError
+
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        async with session.post(url, json=PAYLOAD) as response:
+            assert response.status == 200
+    await sleep(0.3)
+
+    assert len(received) == 3
+    assert webhook.stats.dead == 1
+    assert await store.pending() == []
+    assert len(await store.dead_letters()) == 1
+    await webhook.close()
+
+
+@pytest.mark.asyncio
+async def test_events_are_deduplicated_by_id_and_need_a_timestamp(
+    unused_tcp_port, tmp_path
+):
+    store = VoteEventStore(str(tmp_path / "votes.db"))
+    webhook = WebhookServer("secret", store=store)
+    received = []
+
+    @webhook.handler
+    async def on_vote(event):
+        received.append(event)
+
+    without_timestamp = {k: v for k, v in PAYLOAD.items() if k != "timestamp"}
+    await webhook.start("127.0.0.1", unused_tcp_port)
+    url = f"http://127.0.0.1:{unused_tcp_port}/koreanbots"
+    async with ClientSession(headers={"Authorization": "secret"}) as session:
+        async with session.post(url, json=without_timestamp) as response:
+            assert response.status == 400
+        # A redelivery keeps its id even if the timestamp changes.
+        for timestamp in (1, 2):
+            async with session.post(
+                url, json={**PAYLOAD, "id": "delivery-1", "timestamp": timestamp}
+            ) as response:
+                assert response.status == 200
+    await webhook.close()
+
+    assert webhook.stats.malformed == 1
+    assert webhook.stats.duplicates == 1
+    assert len(received) == 1 and received[0].event_id == "delivery-1"
+
+
+def test_empty_secret_is_rejected():
+    with pytest.raises(ValueError):
+        WebhookServer("")